@@ -0,0 +1,46 @@
+"""
+Compares the localization of datetime64 arrays
+with pendulum.numpy against the per-element path.
+
+    python benchmarks/bench_numpy.py
+"""
+from __future__ import print_function
+
+import timeit
+
+import numpy as np
+import pendulum
+
+from pendulum.numpy import localize
+
+
+SIZE = 100000
+TZ = pendulum.timezone("America/New_York")
+VALUES = np.arange(
+    np.datetime64("2018-01-01T00:00:00"), np.datetime64("2019-01-01T00:00:00"), 317
+)[:SIZE].astype("datetime64[us]")
+ITEMS = VALUES.tolist()
+
+
+def per_element():
+    for value in ITEMS:
+        dt = pendulum.instance(value).in_tz(TZ)
+        dt.year, dt.month, dt.day, dt.hour, dt.offset
+
+
+def vectorized():
+    localize(TZ, VALUES)
+
+
+def main():
+    for name, func, number in (
+        ("per-element", per_element, 1),
+        ("pendulum.numpy", vectorized, 10),
+    ):
+        elapsed = min(timeit.repeat(func, number=number, repeat=3)) / number
+
+        print("{:<16} {:>10.1f} ns/item".format(name, elapsed / SIZE * 1e9))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Compares pendulum.parse() on ISO 8601 strings against the two-pass
+pipeline it used before, which parsed a datetime first
+and then built the DateTime with pendulum.datetime().
+
+    python benchmarks/bench_parse.py
+"""
+from __future__ import print_function
+
+import datetime
+import timeit
+
+import pendulum
+
+from pendulum.parsing import parse as base_parse
+
+
+TEXTS = {
+    "offset": "2024-01-01T10:00:00+02:00",
+    "naive": "2024-01-01T10:00:00.123456",
+    "date": "2024-01-01",
+}
+NUMBER = 100000
+
+
+def two_pass(text):
+    parsed = base_parse(text, now=pendulum.get_test_now())
+
+    if not isinstance(parsed, datetime.datetime):
+        parsed = datetime.datetime(parsed.year, parsed.month, parsed.day)
+
+    return pendulum.datetime(
+        parsed.year,
+        parsed.month,
+        parsed.day,
+        parsed.hour,
+        parsed.minute,
+        parsed.second,
+        parsed.microsecond,
+        tz=parsed.tzinfo or pendulum.UTC,
+    )
+
+
+def main():
+    for kind, text in sorted(TEXTS.items()):
+        assert two_pass(text) == pendulum.parse(text)
+
+        for name, func in (("two-pass", two_pass), ("pendulum.parse", pendulum.parse)):
+            elapsed = min(timeit.repeat(lambda: func(text), number=NUMBER, repeat=3))
+
+            print(
+                "{:<8} {:<16} {:>10.1f} ns/item".format(
+                    kind, name, elapsed / NUMBER * 1e9
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
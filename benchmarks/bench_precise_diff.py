@@ -0,0 +1,60 @@
+"""
+Compares precise_diff_many() against calling precise_diff()
+on each pair, with datetimes and with UTC timestamps
+converted to datetimes first.
+
+    python benchmarks/bench_precise_diff.py
+"""
+from __future__ import print_function
+
+import random
+import timeit
+
+import pendulum
+
+from pendulum.helpers import precise_diff, precise_diff_many
+
+
+TZ = pendulum.timezone("Europe/Paris")
+EPOCH = pendulum.datetime(1970, 1, 1)
+SIZE = 20000
+
+
+def to_datetime(us):
+    return TZ.convert(EPOCH + pendulum.duration(microseconds=us))
+
+
+def main():
+    rng = random.Random(0)
+    starts = sorted(
+        rng.randint(-600000000, 900000000) * 1000000 for _ in range(SIZE)
+    )
+    ends = [1714557600 * 1000000] * SIZE
+
+    d1 = [to_datetime(us) for us in starts]
+    d2 = [to_datetime(us) for us in ends]
+
+    assert list(zip(*precise_diff_many(d1, d2))) == [
+        tuple(precise_diff(a, b)) for a, b in zip(d1, d2)
+    ]
+    assert precise_diff_many(starts, ends, TZ) == precise_diff_many(d1, d2)
+
+    for name, func in (
+        ("datetimes", lambda: [precise_diff(a, b) for a, b in zip(d1, d2)]),
+        ("datetimes many", lambda: precise_diff_many(d1, d2)),
+        (
+            "timestamps",
+            lambda: [
+                precise_diff(to_datetime(a), to_datetime(b))
+                for a, b in zip(starts, ends)
+            ],
+        ),
+        ("timestamps many", lambda: precise_diff_many(starts, ends, TZ)),
+    ):
+        elapsed = min(timeit.repeat(func, number=1, repeat=3))
+
+        print("{:<16} {:>10.1f} ns/item".format(name, elapsed / SIZE * 1e9))
+
+
+if __name__ == "__main__":
+    main()
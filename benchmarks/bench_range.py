@@ -0,0 +1,53 @@
+"""
+Compares Period.range(), and Period.timestamps(), against adding
+a growing duration to the start of the period, as range() did before.
+
+    python benchmarks/bench_range.py
+"""
+from __future__ import print_function
+
+import timeit
+
+import pendulum
+
+
+PERIOD = pendulum.period(
+    pendulum.datetime(2015, 1, 1, tz="Europe/Paris"),
+    pendulum.datetime(2018, 1, 1, tz="Europe/Paris"),
+)
+UNITS = ("hours", "days", "months")
+
+
+def by_adding(unit):
+    start, end = PERIOD.start, PERIOD.end
+
+    i = 1
+    dt = start
+    while dt <= end:
+        yield dt
+
+        dt = start.add(**{unit: i})
+        i += 1
+
+
+def main():
+    for unit in UNITS:
+        items = list(PERIOD.range(unit))
+        assert items == list(by_adding(unit))
+
+        for name, func in (
+            ("adding", by_adding),
+            ("range", PERIOD.range),
+            ("timestamps", PERIOD.timestamps),
+        ):
+            elapsed = min(timeit.repeat(lambda: list(func(unit)), number=1, repeat=3))
+
+            print(
+                "{:<8} {:<10} {:>10.1f} ns/item".format(
+                    unit, name, elapsed / len(items) * 1e9
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,9 @@
 from __future__ import absolute_import
 
 import datetime as _datetime
-from typing import Union
+import functools as _functools
+
+from typing import Iterable, Iterator, Union
 
 from .__version__ import __version__
 
@@ -17,6 +19,7 @@ from .tz import PRE_TRANSITION, POST_TRANSITION, TRANSITION_ERROR
 from .tz.timezone import Timezone as _Timezone
 
 from .formatting import Formatter
+from .formatting import CompiledParser as _CompiledParser
 
 # Helpers
 from .helpers import (
@@ -32,11 +35,12 @@ from .helpers import (
     week_ends_at,
 )
 
-from .utils._compat import _HAS_FOLD
+from .utils._bulk import apply_many as _apply_many
+from .utils._compat import _HAS_FOLD, basestring
 
 from .tz import timezones, local_timezone, test_local_timezone, set_local_timezone, UTC
 
-from .parser import parse
+from .parser import parse, parse_many
 
 # Constants
 from .constants import (
@@ -79,6 +83,9 @@ def _safe_timezone(obj):
     if obj is None or obj == "local":
         return local_timezone()
 
+    if isinstance(obj, basestring):
+        return timezone(obj)
+
     if isinstance(obj, (int, float)):
         obj = int(obj * 60 * 60)
     elif isinstance(obj, _datetime.tzinfo):
@@ -246,14 +253,59 @@ def yesterday(tz="local"):  # type: (Union[str, _Timezone]) -> DateTime
 
 def from_format(
     string,  # type: str
-    fmt,  # type: str
+    fmt,  # type: Union[str, _CompiledParser]
     tz=UTC,  # type: Union[str, _Timezone]
     locale=None,  # type: Union[str, None]
 ):  # type: (...) -> DateTime
     """
     Creates a DateTime instance from a specific format.
+
+    The format can also be a parser compiled
+    with Formatter.compile_parser(), in which case
+    the locale is the one it was compiled for.
+    """
+    if not isinstance(fmt, _CompiledParser):
+        fmt = _formatter.compile_parser(fmt, locale)
+
+    parts = fmt.parse(string)
+    if parts["tz"] is None:
+        parts["tz"] = tz
+
+    return datetime(**parts)
+
+
+def from_format_many(
+    strings,  # type: Iterable[str]
+    fmt,  # type: Union[str, _CompiledParser]
+    tz=UTC,  # type: Union[str, _Timezone]
+    locale=None,  # type: Union[str, None]
+    errors="raise",  # type: str
+    processes=None,  # type: Union[int, None]
+    chunksize=None,  # type: Union[int, None]
+):  # type: (...) -> Iterator[DateTime]
+    """
+    Creates DateTime instances from many strings
+    with the same format, yielding them in order.
+
+    Errors are raised, or yielded in place of the instances
+    if errors is "return".
+    Strings can also be parsed in a pool of processes,
+    chunksize strings at a time.
     """
-    parts = _formatter.parse(string, fmt, now(), locale=locale)
+    if not isinstance(fmt, _CompiledParser):
+        fmt = _formatter.compile_parser(fmt, locale)
+
+    if tz is not None:
+        tz = _safe_timezone(tz)
+
+    parse = _functools.partial(_from_format, fmt, tz, now())
+
+    return _apply_many(parse, strings, errors, processes, chunksize)
+
+
+def _from_format(parser, tz, now, string):
+    # type: (_CompiledParser, _Timezone, DateTime, str) -> DateTime
+    parts = parser.parse(string, now)
     if parts["tz"] is None:
         parts["tz"] = tz
 
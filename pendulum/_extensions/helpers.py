@@ -19,6 +19,7 @@ from ..constants import (
     DAY_OF_WEEK_TABLE,
     DAYS_PER_L_YEAR,
     DAYS_PER_N_YEAR,
+    US_PER_SECOND,
 )
 
 
@@ -194,107 +195,105 @@ def precise_diff(d1, d2):
 
     :rtype: PreciseDiff
     """
+    return PreciseDiff(*_precise_diff(d1, d2, {}))
+
+
+_US_PER_DAY = SECS_PER_DAY * US_PER_SECOND
+_NO_NAME = object()
+
+
+def _precise_diff(d1, d2, tz_names):
+    """
+    Calculates the precise difference between two datetimes as a tuple.
+
+    The names of their timezones are cached in tz_names,
+    which can be shared by successive calls.
+    """
     sign = 1
 
     if d1 == d2:
-        return PreciseDiff(0, 0, 0, 0, 0, 0, 0, 0)
+        return (0,) * 8
 
     tzinfo1 = d1.tzinfo if isinstance(d1, datetime.datetime) else None
     tzinfo2 = d2.tzinfo if isinstance(d2, datetime.datetime) else None
 
-    if (
-        tzinfo1 is None
-        and tzinfo2 is not None
-        or tzinfo2 is None
-        and tzinfo1 is not None
-    ):
+    if (tzinfo1 is None) is not (tzinfo2 is None):
         raise ValueError(
             "Comparison between naive and aware datetimes is not supported"
         )
 
     if d1 > d2:
         d1, d2 = d2, d1
+        tzinfo1, tzinfo2 = tzinfo2, tzinfo1
         sign = -1
 
-    d_diff = 0
-    hour_diff = 0
-    min_diff = 0
-    sec_diff = 0
-    mic_diff = 0
-    total_days = _day_number(d2.year, d2.month, d2.day) - _day_number(
-        d1.year, d1.month, d1.day
-    )
+    start = _fields(d1)
+    end = _fields(d2)
     in_same_tz = False
-    tz1 = None
-    tz2 = None
 
     # Trying to figure out the timezone names
     # If we can't find them, we assume different timezones
-    if tzinfo1 and tzinfo2:
-        if hasattr(tzinfo1, "name"):
-            # Pendulum timezone
-            tz1 = tzinfo1.name
-        elif hasattr(tzinfo1, "zone"):
-            # pytz timezone
-            tz1 = tzinfo1.zone
-
-        if hasattr(tzinfo2, "name"):
-            tz2 = tzinfo2.name
-        elif hasattr(tzinfo2, "zone"):
-            tz2 = tzinfo2.zone
-
-        in_same_tz = tz1 == tz2 and tz1 is not None
-
-    if isinstance(d2, datetime.datetime):
-        if isinstance(d1, datetime.datetime):
+    if tzinfo1 is not None:
+        name1 = _tz_name(tzinfo1, tz_names)
+        name2 = name1
+        if tzinfo2 is not tzinfo1:
+            name2 = _tz_name(tzinfo2, tz_names)
+
+        in_same_tz = name1 == name2 and name1 is not None
+
+        # The offsets are only used by _diff() when it adjusts the values
+        if not in_same_tz or start[0] == end[0]:
+            return _diff(start + (_offset(d1),), end + (_offset(d2),), sign, in_same_tz)
+
+    return _diff(start + (0,), end + (0,), sign, in_same_tz)
+
+
+def _diff(start, end, sign, in_same_tz):  # type: (tuple, tuple, int, bool) -> tuple
+    """
+    Calculates the precise difference between two ordered values
+    given as their ordinal, year, month, day, microseconds
+    of the day (None for dates) and UTC offset in microseconds.
+    """
+    ordinal1, year1, month1, day1, time1, offset1 = start
+    ordinal2, year2, month2, day2, time2, offset2 = end
+
+    total_days = ordinal2 - ordinal1
+    d_diff = 0
+    time_diff = 0
+
+    if time2 is not None:
+        if time1 is not None:
             # If we are not in the same timezone
             # we need to adjust
             #
             # We also need to adjust if we do not
             # have variable-length units
             if not in_same_tz or total_days == 0:
-                offset1 = d1.utcoffset()
-                offset2 = d2.utcoffset()
-
                 if offset1:
-                    d1 = d1 - offset1
+                    year1, month1, day1, time1 = _shift(ordinal1, time1 - offset1)
 
                 if offset2:
-                    d2 = d2 - offset2
+                    year2, month2, day2, time2 = _shift(ordinal2, time2 - offset2)
 
-            hour_diff = d2.hour - d1.hour
-            min_diff = d2.minute - d1.minute
-            sec_diff = d2.second - d1.second
-            mic_diff = d2.microsecond - d1.microsecond
+            time_diff = time2 - time1
         else:
-            hour_diff = d2.hour
-            min_diff = d2.minute
-            sec_diff = d2.second
-            mic_diff = d2.microsecond
-
-        if mic_diff < 0:
-            mic_diff += 1000000
-            sec_diff -= 1
-
-        if sec_diff < 0:
-            sec_diff += 60
-            min_diff -= 1
+            time_diff = time2
 
-        if min_diff < 0:
-            min_diff += 60
-            hour_diff -= 1
-
-        if hour_diff < 0:
-            hour_diff += 24
+        if time_diff < 0:
+            time_diff += _US_PER_DAY
             d_diff -= 1
 
-    y_diff = d2.year - d1.year
-    m_diff = d2.month - d1.month
-    d_diff += d2.day - d1.day
+    sec_diff, mic_diff = divmod(time_diff, US_PER_SECOND)
+    min_diff, sec_diff = divmod(sec_diff, 60)
+    hour_diff, min_diff = divmod(min_diff, 60)
+
+    y_diff = year2 - year1
+    m_diff = month2 - month1
+    d_diff += day2 - day1
 
     if d_diff < 0:
-        year = d2.year
-        month = d2.month
+        year = year2
+        month = month2
 
         if month == 1:
             month = 12
@@ -305,12 +304,12 @@ def precise_diff(d1, d2):
         leap = int(is_leap(year))
 
         days_in_last_month = DAYS_PER_MONTHS[leap][month]
-        days_in_month = DAYS_PER_MONTHS[int(is_leap(d2.year))][d2.month]
+        days_in_month = DAYS_PER_MONTHS[int(is_leap(year2))][month2]
 
         if d_diff < days_in_month - days_in_last_month:
             # We don't have a full month, we calculate days
-            if days_in_last_month < d1.day:
-                d_diff += d1.day
+            if days_in_last_month < day1:
+                d_diff += day1
             else:
                 d_diff += days_in_last_month
         elif d_diff == days_in_month - days_in_last_month:
@@ -329,7 +328,7 @@ def precise_diff(d1, d2):
         m_diff += 12
         y_diff -= 1
 
-    return PreciseDiff(
+    return (
         sign * y_diff,
         sign * m_diff,
         sign * d_diff,
@@ -341,15 +340,52 @@ def precise_diff(d1, d2):
     )
 
 
-def _day_number(year, month, day):
-    month = (month + 9) % 12
-    year = year - month // 10
+def _fields(dt):  # type: (datetime.date) -> tuple
+    if isinstance(dt, datetime.datetime):
+        time = (
+            (dt.hour * 60 + dt.minute) * 60 + dt.second
+        ) * US_PER_SECOND + dt.microsecond
+    else:
+        time = None
+
+    return dt.toordinal(), dt.year, dt.month, dt.day, time
+
+
+def _offset(dt):  # type: (datetime.datetime) -> int
+    offset = dt.utcoffset()
+    if offset is None:
+        return 0
 
     return (
-        365 * year
-        + year // 4
-        - year // 100
-        + year // 400
-        + (month * 306 + 5) // 10
-        + (day - 1)
-    )
+        offset.days * SECS_PER_DAY + offset.seconds
+    ) * US_PER_SECOND + offset.microseconds
+
+
+def _shift(ordinal, time):  # type: (int, int) -> tuple
+    days, time = divmod(time, _US_PER_DAY)
+
+    return _date_fields(ordinal + days)[1:] + (time,)
+
+
+def _date_fields(ordinal):  # type: (int) -> tuple
+    d = datetime.date.fromordinal(ordinal)
+
+    return ordinal, d.year, d.month, d.day
+
+
+def _tz_name(tzinfo, names):  # type: (datetime.tzinfo, dict) -> str
+    name = names.get(tzinfo, _NO_NAME)
+    if name is not _NO_NAME:
+        return name
+
+    name = None
+    if hasattr(tzinfo, "name"):
+        # Pendulum timezone
+        name = tzinfo.name
+    elif hasattr(tzinfo, "zone"):
+        # pytz timezone
+        name = tzinfo.zone
+
+    names[tzinfo] = name
+
+    return name
@@ -14,8 +14,11 @@ from .period import Period
 from .exceptions import PendulumException
 from .utils._compat import _HAS_FOLD
 from .tz import UTC
+from .tz import POST_TRANSITION
 from .tz.timezone import Timezone
 from .helpers import add_duration
+from .helpers import is_leap
+from .helpers import local_time
 from .helpers import timestamp
 from .constants import (
     YEARS_PER_CENTURY,
@@ -24,6 +27,9 @@ from .constants import (
     MINUTES_PER_HOUR,
     SECONDS_PER_MINUTE,
     SECONDS_PER_DAY,
+    SECONDS_PER_HOUR,
+    US_PER_SECOND,
+    DAYS_PER_MONTHS,
     SUNDAY,
     SATURDAY,
     ATOM,
@@ -38,6 +44,10 @@ from .constants import (
 )
 
 
+_MIN_TIMESTAMP = timestamp(datetime.datetime.min)
+_MAX_TIMESTAMP = timestamp(datetime.datetime.max)
+
+
 class DateTime(datetime.datetime, Date):
 
     # Formats
@@ -601,6 +611,12 @@ class DateTime(datetime.datetime, Date):
         otherwise move forward from utc, for accuracy
         when moving across DST boundaries.
         """
+        dt = self._add_fast(
+            years, months, weeks, days, hours, minutes, seconds, microseconds
+        )
+        if dt is not None:
+            return dt
+
         units_of_variable_length = any([years, months, weeks, days])
 
         current_dt = datetime.datetime(
@@ -666,6 +682,73 @@ class DateTime(datetime.datetime, Date):
             fold=dt.fold,
         )
 
+    def _add_fast(
+        self, years, months, weeks, days, hours, minutes, seconds, microseconds
+    ):  # type: (int, int, int, int, int, int, int, int) -> Union[DateTime, None]
+        """
+        Adds a duration by computing the resulting timestamp
+        directly from the transitions of the timezone,
+        without any intermediate datetime instance.
+
+        Returns None if the duration, or the timezone, is not supported,
+        in which case the generic implementation must be used.
+        """
+        tz = self.tzinfo
+        if tz is not None and not isinstance(tz, Timezone):
+            return
+
+        exact = not (years or months or weeks or days)
+
+        # Seconds since the epoch, of the UTC time for exact units,
+        # and of the wall-clock time otherwise.
+        sec = timestamp(self)
+        if exact and tz is not None:
+            offset = self.utcoffset()
+            sec -= offset.days * SECONDS_PER_DAY + offset.seconds
+        elif years or months:
+            year, month = divmod(
+                (self.year + years) * MONTHS_PER_YEAR + self.month - 1 + months,
+                MONTHS_PER_YEAR,
+            )
+            month += 1
+            if not 1 <= year <= 9999:
+                return
+
+            day = min(DAYS_PER_MONTHS[int(is_leap(year))][month], self.day)
+            sec += (
+                datetime.date(year, month, day).toordinal() - self.toordinal()
+            ) * SECONDS_PER_DAY
+
+        sec += (
+            (weeks * 7 + days) * SECONDS_PER_DAY
+            + hours * SECONDS_PER_HOUR
+            + minutes * SECONDS_PER_MINUTE
+            + seconds
+        )
+        microsecond = self.microsecond + microseconds
+        sec += microsecond // US_PER_SECOND
+        microsecond %= US_PER_SECOND
+
+        if type(sec) is not int or type(microsecond) is not int:
+            # Fractional units are rounded like timedelta does
+            return
+
+        if tz is None:
+            fold = 0
+        elif exact:
+            sec, fold = tz._from_utc_timestamp(sec)
+        else:
+            sec, fold = tz._normalize_timestamp(sec, POST_TRANSITION)
+
+        if not _MIN_TIMESTAMP <= sec <= _MAX_TIMESTAMP:
+            return
+
+        cls = DateTime
+        if exact and tz is not None:
+            cls = self.__class__
+
+        return cls(*local_time(sec, 0, microsecond), tzinfo=tz, fold=fold)
+
     def subtract(
         self,
         years=0,
@@ -742,7 +825,10 @@ class DateTime(datetime.datetime, Date):
                 years=delta.years, months=delta.months, seconds=delta.total_seconds()
             )
 
-        return self.add(seconds=delta.total_seconds())
+        return self.add(
+            seconds=delta.days * SECONDS_PER_DAY + delta.seconds,
+            microseconds=delta.microseconds,
+        )
 
     def _subtract_timedelta(self, delta):
         """
@@ -1510,17 +1596,26 @@ class DateTime(datetime.datetime, Date):
     def __getnewargs__(self):
         return (self,)
 
-    def _getstate(self, protocol=3):
-        return (
-            self.year,
-            self.month,
-            self.day,
-            self.hour,
-            self.minute,
-            self.second,
-            self.microsecond,
-            self.tzinfo,
-        )
+    if _HAS_FOLD:
+
+        def _getstate(self, protocol=3):
+            # The packed state of datetime, which keeps the fold
+            # for protocols above 3, and the timezone
+            return datetime.datetime.__reduce_ex__(self, protocol)[1]
+
+    else:
+
+        def _getstate(self, protocol=3):
+            return (
+                self.year,
+                self.month,
+                self.day,
+                self.hour,
+                self.minute,
+                self.second,
+                self.microsecond,
+                self.tzinfo,
+            )
 
     def __reduce__(self):
         return self.__reduce_ex__(2)
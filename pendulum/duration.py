@@ -399,6 +399,17 @@ class Duration(timedelta):
 
         return NotImplemented
 
+    def _getstate(self, protocol=3):
+        days, seconds, microseconds = timedelta.__reduce__(self)[1]
+
+        return days, seconds, microseconds, 0, 0, 0, 0, self._years, self._months
+
+    def __reduce__(self):
+        return self.__reduce_ex__(2)
+
+    def __reduce_ex__(self, protocol):
+        return self.__class__, self._getstate(protocol)
+
 
 Duration.min = Duration(days=-999999999)
 Duration.max = Duration(
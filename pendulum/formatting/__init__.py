@@ -1,4 +1,4 @@
-from .formatter import Formatter
+from .formatter import CompiledFormat, CompiledParser, Formatter
 
 
-__all__ = ["Formatter"]
+__all__ = ["CompiledFormat", "CompiledParser", "Formatter"]
@@ -9,7 +9,8 @@ class DifferenceFormatter(object):
     """
 
     def __init__(self, locale="en"):
-        self._locale = Locale.load(locale)
+        # Loaded on first use
+        self._locale = locale
 
     def format(self, diff, is_now=True, absolute=False, locale=None):
         """
@@ -31,8 +32,8 @@ class DifferenceFormatter(object):
         """
         if locale is None:
             locale = self._locale
-        else:
-            locale = Locale.load(locale)
+
+        locale = Locale.load(locale)
 
         count = diff.remaining_seconds
 
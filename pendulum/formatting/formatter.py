@@ -8,6 +8,7 @@ import typing
 
 from pendulum.helpers import local_time
 from pendulum.locales.locale import Locale
+from pendulum.tz import _resolve_name
 from pendulum.utils._compat import decode
 
 
@@ -82,6 +83,19 @@ class Formatter:
         ),
     }
 
+    # The unit parsed from the localizable tokens matching a translation,
+    # and the key of their translations. The meridiem tokens
+    # only match the am and pm day periods.
+    _TRANSLATED_TOKENS = {
+        "MMMM": ("month", "months.wide"),
+        "MMM": ("month", "months.abbreviated"),
+        "dddd": ("day_of_week", "days.wide"),
+        "ddd": ("day_of_week", "days.abbreviated"),
+        "dd": ("day_of_week", "days.short"),
+        "A": ("meridiem", None),
+        "a": ("meridiem", None),
+    }
+
     _TOKENS_RULES = {
         # Year
         "YYYY": lambda dt: "{:d}".format(dt.year),
@@ -226,6 +240,36 @@ class Formatter:
         "z": str,
     }
 
+    # Tokens which only depend on an attribute of the instance,
+    # as replacement fields of the format string of a compiled format.
+    _TOKENS_FIELDS = {
+        "YYYY": "{0.year:d}",
+        "Y": "{0.year:d}",
+        "Q": "{0.quarter:d}",
+        "MM": "{0.month:02d}",
+        "M": "{0.month:d}",
+        "DD": "{0.day:02d}",
+        "D": "{0.day:d}",
+        "DDDD": "{0.day_of_year:03d}",
+        "DDD": "{0.day_of_year:d}",
+        "d": "{0.day_of_week:d}",
+        "HH": "{0.hour:02d}",
+        "H": "{0.hour:d}",
+        "mm": "{0.minute:02d}",
+        "m": "{0.minute:d}",
+        "ss": "{0.second:02d}",
+        "s": "{0.second:d}",
+        "SSSSSS": "{0.microsecond:06d}",
+        "X": "{0.int_timestamp:d}",
+    }
+
+    # The maximum number of compiled formats, and parsers, kept by a formatter.
+    COMPILED_CACHE_SIZE = 256
+
+    def __init__(self):
+        self._compiled = {}
+        self._parsers = {}
+
     def format(self, dt, fmt, locale=None):
         """
         Formats a DateTime instance with a given format and locale.
@@ -241,114 +285,206 @@ class Formatter:
 
         :rtype: str
         """
+        return self.compile(fmt, locale)(dt)
+
+    def compile(self, fmt, locale=None):
+        """
+        Compiles a format for a given locale.
+
+        The returned CompiledFormat formats instances
+        without having to tokenize the format again.
+        Compiled formats are cached, so formatting
+        with the same format and locale is cheap.
+
+        >>> import pendulum
+        >>> from pendulum.formatting import Formatter
+        >>> fmt = Formatter().compile('dddd Do [of] MMMM', 'en')
+        >>> fmt(pendulum.datetime(2018, 3, 4))
+        'Sunday 4th of March'
+
+        :param fmt: The format to compile
+        :type fmt: str
+
+        :param locale: The locale to use
+        :type locale: str or Locale or None
+
+        :rtype: CompiledFormat
+        """
         if not locale:
             locale = pendulum.get_locale()
 
-        locale = Locale.load(locale)
+        key = (fmt, locale)
+        compiled = self._compiled.get(key)
+        if compiled is not None:
+            return compiled
 
-        result = self._FORMAT_RE.sub(
-            lambda m: m.group(1)
-            if m.group(1)
-            else m.group(2)
-            if m.group(2)
-            else self._format_token(dt, m.group(3), locale),
-            fmt,
-        )
+        emitters = []
+        template = self._compile(fmt, Locale.load(locale), emitters)
+        compiled = CompiledFormat(fmt, template, emitters)
 
-        return decode(result)
+        if len(self._compiled) >= self.COMPILED_CACHE_SIZE:
+            # Evicting the oldest compiled format
+            self._compiled.pop(next(iter(self._compiled), None), None)
 
-    def _format_token(self, dt, token, locale):
-        """
-        Formats a DateTime instance with a given token and locale.
+        self._compiled[key] = compiled
 
-        :param dt: The instance to format
-        :type dt: pendulum.DateTime
+        return compiled
 
-        :param token: The token to use
-        :type token: str
+    def _compile(
+        self, fmt, locale, emitters
+    ):  # type: (str, Locale, typing.List[typing.Callable]) -> str
+        """
+        Compiles a format for a given locale into a format string
+        whose replacement fields are either attributes of the instance
+        or the values returned by the functions appended to emitters.
+
+        :param fmt: The format to compile
+        :type fmt: str
 
         :param locale: The locale to use
         :type locale: Locale
 
+        :param emitters: The functions of the replacement fields
+        :type emitters: list
+
         :rtype: str
         """
-        if token in self._DATE_FORMATS:
-            fmt = locale.get("custom.date_formats.{}".format(token))
-            if fmt is None:
-                fmt = self._DEFAULT_DATE_FORMATS[token]
+        template = []
+        position = 0
+        for m in self._FORMAT_RE.finditer(fmt):
+            template.append(_escape(fmt[position : m.start()]))
+            position = m.end()
+
+            if m.group(1):
+                template.append(_escape(m.group(1)))
+                continue
+
+            if m.group(2):
+                template.append(_escape(m.group(2)))
+                continue
+
+            token = m.group(3)
+            if token in self._DATE_FORMATS:
+                date_fmt = locale.get("custom.date_formats.{}".format(token))
+                if date_fmt is None:
+                    date_fmt = self._DEFAULT_DATE_FORMATS[token]
+
+                # Date formats are expanded at compile time,
+                # with the same locale fallback as format()
+                date_locale = locale or Locale.load(pendulum.get_locale())
+                template.append(self._compile(date_fmt, date_locale, emitters))
+                continue
+
+            if token in self._TOKENS_FIELDS:
+                template.append(self._TOKENS_FIELDS[token])
+                continue
+
+            emitter = self._compile_token(token, locale)
+            if callable(emitter):
+                emitters.append(emitter)
+                template.append("{{{}}}".format(len(emitters)))
+            else:
+                template.append(_escape(emitter))
+
+        template.append(_escape(fmt[position:]))
 
-            return self.format(dt, fmt, locale)
+        return "".join(template)
 
+    def _compile_token(self, token, locale):
+        """
+        Compiles a token for a given locale into a function
+        formatting a DateTime instance, or into a literal string.
+
+        :param token: The token to compile
+        :type token: str
+
+        :param locale: The locale to use
+        :type locale: Locale
+
+        :rtype: callable or str
+        """
         if token in self._LOCALIZABLE_TOKENS:
-            return self._format_localizable_token(dt, token, locale)
+            return self._compile_localizable_token(token, locale)
 
         if token in self._TOKENS_RULES:
-            return self._TOKENS_RULES[token](dt)
+            return self._TOKENS_RULES[token]
 
         # Timezone
         if token in ["ZZ", "Z"]:
-            if dt.tzinfo is None:
-                return ""
-
             separator = ":" if token == "Z" else ""
-            offset = dt.utcoffset() or datetime.timedelta()
-            minutes = offset.total_seconds() / 60
 
-            if minutes >= 0:
-                sign = "+"
-            else:
-                sign = "-"
+            def format_offset(dt):
+                if dt.tzinfo is None:
+                    return ""
 
-            hour, minute = divmod(abs(int(minutes)), 60)
+                offset = dt.utcoffset() or datetime.timedelta()
+                minutes = offset.total_seconds() / 60
 
-            return "{}{:02d}{}{:02d}".format(sign, hour, separator, minute)
+                if minutes >= 0:
+                    sign = "+"
+                else:
+                    sign = "-"
 
-    def _format_localizable_token(self, dt, token, locale):
-        """
-        Formats a DateTime instance
-        with a given localizable token and locale.
+                hour, minute = divmod(abs(int(minutes)), 60)
 
-        :param dt: The instance to format
-        :type dt: pendulum.DateTime
+                return "{}{:02d}{}{:02d}".format(sign, hour, separator, minute)
+
+            return format_offset
 
-        :param token: The token to use
+        # Unsupported tokens are ignored
+        return ""
+
+    def _compile_localizable_token(self, token, locale):
+        """
+        Compiles a localizable token for a given locale
+        into a function formatting a DateTime instance,
+        or into a literal string.
+
+        :param token: The token to compile
         :type token: str
 
         :param locale: The locale to use
         :type locale: Locale
 
-        :rtype: str
+        :rtype: callable or str
         """
         if token == "MMM":
-            return locale.get("translations.months.abbreviated")[dt.month]
+            months = locale.get("translations.months.abbreviated")
+
+            return lambda dt: months[dt.month]
         elif token == "MMMM":
-            return locale.get("translations.months.wide")[dt.month]
+            months = locale.get("translations.months.wide")
+
+            return lambda dt: months[dt.month]
         elif token == "dd":
-            return locale.get("translations.days.short")[dt.day_of_week]
+            days = locale.get("translations.days.short")
+
+            return lambda dt: days[dt.day_of_week]
         elif token == "ddd":
-            return locale.get("translations.days.abbreviated")[dt.day_of_week]
+            days = locale.get("translations.days.abbreviated")
+
+            return lambda dt: days[dt.day_of_week]
         elif token == "dddd":
-            return locale.get("translations.days.wide")[dt.day_of_week]
+            days = locale.get("translations.days.wide")
+
+            return lambda dt: days[dt.day_of_week]
         elif token == "Do":
-            return locale.ordinalize(dt.day)
+            return lambda dt: locale.ordinalize(dt.day)
         elif token == "do":
-            return locale.ordinalize(dt.day_of_week)
+            return lambda dt: locale.ordinalize(dt.day_of_week)
         elif token == "Mo":
-            return locale.ordinalize(dt.month)
+            return lambda dt: locale.ordinalize(dt.month)
         elif token == "Qo":
-            return locale.ordinalize(dt.quarter)
+            return lambda dt: locale.ordinalize(dt.quarter)
         elif token == "wo":
-            return locale.ordinalize(dt.week_of_year)
+            return lambda dt: locale.ordinalize(dt.week_of_year)
         elif token == "DDDo":
-            return locale.ordinalize(dt.day_of_year)
+            return lambda dt: locale.ordinalize(dt.day_of_year)
         elif token == "A":
-            key = "translations.day_periods"
-            if dt.hour >= 12:
-                key += ".pm"
-            else:
-                key += ".am"
+            am = locale.get("translations.day_periods.am")
+            pm = locale.get("translations.day_periods.pm")
 
-            return locale.get(key)
+            return lambda dt: pm if dt.hour >= 12 else am
         else:
             return token
 
@@ -369,43 +505,53 @@ class Formatter:
 
         :return: The parsed elements
         """
-        escaped_fmt = re.escape(fmt)
+        return self.compile_parser(fmt, locale).parse(time, now)
 
-        tokens = self._FORMAT_RE.findall(escaped_fmt)
-        if not tokens:
-            return time
+    def compile_parser(self, fmt, locale=None):
+        """
+        Compiles a format for a given locale into a parser.
+
+        The returned CompiledParser parses strings
+        with a single match of a precompiled regular expression.
+        Compiled parsers are cached, so parsing many strings
+        with the same format and locale is cheap.
+
+        :param fmt: The format
+        :type fmt: str
+
+        :param locale: The locale to use
+        :type locale: str or Locale or None
 
+        :rtype: CompiledParser
+        """
         if not locale:
             locale = pendulum.get_locale()
 
-        locale = Locale.load(locale)
+        key = (fmt, locale)
+        parser = self._parsers.get(key)
+        if parser is not None:
+            return parser
 
-        parsed = {
-            "year": None,
-            "month": None,
-            "day": None,
-            "hour": None,
-            "minute": None,
-            "second": None,
-            "microsecond": None,
-            "tz": None,
-            "quarter": None,
-            "day_of_week": None,
-            "day_of_year": None,
-            "meridiem": None,
-            "timestamp": None,
-        }
+        escaped_fmt = re.escape(fmt)
 
-        pattern = self._FORMAT_RE.sub(
-            lambda m: self._replace_tokens(m.group(0), locale), escaped_fmt
-        )
+        tokens = self._FORMAT_RE.findall(escaped_fmt)
+        if not tokens:
+            parser = CompiledParser(self, fmt, None, None)
+        else:
+            locale = Locale.load(locale)
+            pattern = self._FORMAT_RE.sub(
+                lambda m: self._replace_tokens(m.group(0), locale), escaped_fmt
+            )
 
-        if not re.match(pattern, time):
-            raise ValueError("String does not match format {}".format(fmt))
+            parser = CompiledParser(self, fmt, re.compile(pattern), locale)
 
-        re.sub(pattern, lambda m: self._get_parsed_values(m, parsed, locale, now), time)
+        if len(self._parsers) >= self.COMPILED_CACHE_SIZE:
+            # Evicting the oldest compiled parser
+            self._parsers.pop(next(iter(self._parsers), None), None)
 
-        return self._check_parsed(parsed, now)
+        self._parsers[key] = parser
+
+        return parser
 
     def _check_parsed(self, parsed, now):  # type: (dict, pendulum.DateTime) -> dict
         """
@@ -589,56 +735,49 @@ class Formatter:
             parsed["tz"] = pendulum.timezone(offset)
         elif token == "z":
             # Full timezone
-            if value not in pendulum.timezones:
+            name = _resolve_name(value)
+            if name is None:
                 raise ValueError("Invalid date")
 
-            parsed["tz"] = pendulum.timezone(value)
+            parsed["tz"] = pendulum.timezone(name)
 
     def _get_parsed_locale_value(
         self, token, value, parsed, locale
     ):  # type: (str, str, dict, Locale) -> None
-        if token == "MMMM":
-            unit = "month"
-            match = "months.wide"
-        elif token == "MMM":
-            unit = "month"
-            match = "months.abbreviated"
-        elif token == "Do":
+        if token == "Do":
             parsed["day"] = int(re.match("(\d+)", value).group(1))
 
             return
-        elif token == "dddd":
-            unit = "day_of_week"
-            match = "days.wide"
-        elif token == "ddd":
-            unit = "day_of_week"
-            match = "days.abbreviated"
-        elif token == "dd":
-            unit = "day_of_week"
-            match = "days.short"
-        elif token in ["a", "A"]:
-            valid_values = [
-                locale.translation("day_periods.am"),
-                locale.translation("day_periods.pm"),
-            ]
-
-            if token == "a":
-                value = value.lower()
-                valid_values = list(map(lambda x: x.lower(), valid_values))
-
-            if value not in valid_values:
-                raise ValueError("Invalid date")
 
-            parsed["meridiem"] = ["am", "pm"][valid_values.index(value)]
-
-            return
-        else:
+        if token not in self._TRANSLATED_TOKENS:
             raise ValueError('Invalid token "{}"'.format(token))
 
-        parsed[unit] = locale.match_translation(match, value)
-        if value is None:
+        if token == "a":
+            value = value.lower()
+
+        unit, translations = self._get_translations(token, locale)
+
+        parsed[unit] = translations.get(value)
+        if parsed[unit] is None:
             raise ValueError("Invalid date")
 
+    def _get_translations(self, token, locale):  # type: (str, Locale) -> tuple
+        """
+        Returns the unit parsed from a translated token
+        and the parsed values keyed by their translation.
+        """
+        unit, key = self._TRANSLATED_TOKENS[token]
+        if key is not None:
+            return unit, locale.inverse_translation(key)
+
+        am = locale.translation("day_periods.am")
+        pm = locale.translation("day_periods.pm")
+        if token == "a":
+            am, pm = am.lower(), pm.lower()
+
+        # am comes last to take precedence if both are the same
+        return unit, {pm: "pm", am: "am"}
+
     def _replace_tokens(self, token, locale):  # type: (str, Locale) -> str
         if token.startswith("[") and token.endswith("]"):
             return token[1:-1]
@@ -670,3 +809,156 @@ class Formatter:
         pattern = "(?P<{}>{})".format(token, "|".join([decode(p) for p in candidates]))
 
         return pattern
+
+
+class CompiledFormat(object):
+    """
+    A format compiled for a given locale by Formatter.compile().
+
+    Calling it with a DateTime instance formats it.
+    """
+
+    def __init__(self, fmt, template, emitters):
+        # type: (str, str, typing.List[typing.Callable]) -> None
+        self._fmt = fmt
+        self._template = template
+        self._emitters = tuple(emitters)
+
+    @property
+    def fmt(self):  # type: () -> str
+        return self._fmt
+
+    def __call__(self, dt):  # type: (pendulum.DateTime) -> str
+        return decode(
+            self._template.format(dt, *[emitter(dt) for emitter in self._emitters])
+        )
+
+    def __repr__(self):  # type: () -> str
+        return "CompiledFormat({!r})".format(self._fmt)
+
+
+class CompiledParser(object):
+    """
+    A format compiled for a given locale by Formatter.compile_parser().
+    """
+
+    _WEEKDAY_TOKENS = {"d", "E", "dd", "ddd", "dddd"}
+    _MONTH_TOKENS = {"M", "MM", "MMM", "MMMM"}
+    _DAY_TOKENS = {"D", "DD", "Do"}
+
+    def __init__(self, formatter, fmt, regex, locale):
+        # type: (Formatter, str, typing.Optional[typing.Pattern], Locale) -> None
+        self._fmt = fmt
+        self._regex = regex
+        self._locale = locale
+        self._check_parsed = formatter._check_parsed
+        self._get_parsed_value = formatter._get_parsed_value
+        self._get_parsed_locale_value = formatter._get_parsed_locale_value
+
+        # The parsed value of each token, in the order of the format
+        self._groups = []
+        if regex is None:
+            self._needs_now = False
+
+            return
+
+        for token, index in sorted(regex.groupindex.items(), key=lambda g: g[1]):
+            # Translated tokens are parsed with a single lookup
+            translations = None
+            if token in formatter._TRANSLATED_TOKENS:
+                translations = formatter._get_translations(token, locale)
+
+            self._groups.append(
+                (token, index, token in formatter._LOCALIZABLE_TOKENS, translations)
+            )
+
+        # The current time is only needed to fill in
+        # the elements missing from the format.
+        tokens = set(regex.groupindex)
+        self._needs_now = "YY" in tokens or (
+            not tokens & {"X", "x"}
+            and (
+                not tokens & {"Y", "YYYY"}
+                or tokens & self._WEEKDAY_TOKENS
+                and not (tokens & self._MONTH_TOKENS and tokens & self._DAY_TOKENS)
+            )
+        )
+
+    @property
+    def fmt(self):  # type: () -> str
+        return self._fmt
+
+    def parse(
+        self, time, now=None  # type: str  # type: typing.Optional[pendulum.DateTime]
+    ):  # type: (...) -> dict
+        """
+        Parses a time string matching the format as a dict.
+
+        :param time: The timestring
+        :param now: The datetime to use as "now", the current time by default
+
+        :return: The parsed elements
+        """
+        if self._regex is None:
+            return time
+
+        m = self._regex.match(time)
+        if not m:
+            raise ValueError("String does not match format {}".format(self._fmt))
+
+        if now is None and self._needs_now:
+            now = pendulum.now()
+
+        parsed = {
+            "year": None,
+            "month": None,
+            "day": None,
+            "hour": None,
+            "minute": None,
+            "second": None,
+            "microsecond": None,
+            "tz": None,
+            "quarter": None,
+            "day_of_week": None,
+            "day_of_year": None,
+            "meridiem": None,
+            "timestamp": None,
+        }
+
+        locale = self._locale
+        for token, index, localizable, translations in self._groups:
+            if translations is not None:
+                unit, values = translations
+
+                parsed[unit] = values.get(m.group(index))
+                if parsed[unit] is None:
+                    raise ValueError("Invalid date")
+            elif localizable:
+                self._get_parsed_locale_value(token, m.group(index), parsed, locale)
+            else:
+                self._get_parsed_value(token, m.group(index), parsed, now)
+
+        return self._check_parsed(parsed, now)
+
+    def __reduce__(self):
+        # Compiled again when unpickled, to be sent to other processes
+        locale = self._locale._locale if self._locale is not None else None
+
+        return _compile_parser, (self._fmt, locale)
+
+    def __repr__(self):  # type: () -> str
+        return "CompiledParser({!r})".format(self._fmt)
+
+
+def _compile_parser(fmt, locale):  # type: (str, str) -> CompiledParser
+    # Through the shared formatter, so that unpickling the same parser
+    # again, with each chunk of strings sent to a process, is cheap.
+    return pendulum._formatter.compile_parser(fmt, locale)
+
+
+def _escape(text):  # type: (str) -> str
+    """
+    Escapes literal text for a format string.
+    """
+    return text.replace("{", "{{").replace("}", "}}")
+
@@ -5,7 +5,9 @@ import pendulum
 from math import copysign
 from datetime import datetime, date, timedelta
 from contextlib import contextmanager
-from typing import Union
+from itertools import tee
+from operator import attrgetter
+from typing import Iterable, Iterator, Sequence, Union
 
 
 try:
@@ -29,13 +31,20 @@ except ImportError:
         timestamp,
     )
 
+from ._extensions.helpers import PreciseDiff
+from ._extensions.helpers import precise_diff as _py_precise_diff
+from ._extensions.helpers import _US_PER_DAY, _date_fields, _diff, _precise_diff
 from .constants import DAYS_PER_MONTHS
+from .constants import US_PER_SECOND
 from .formatting.difference_formatter import DifferenceFormatter
 from .locales.locale import Locale
+from .utils._compat import int64_array
 
 
 difference_formatter = DifferenceFormatter()
 
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
 
 def add_duration(
     dt,  # type:  Union[datetime, date]
@@ -116,6 +125,80 @@ def add_duration(
     )
 
 
+def precise_diff_many(
+    starts,  # type: Union[Iterable[Union[datetime, date]], Sequence[int]]
+    ends,  # type: Union[Iterable[Union[datetime, date]], Sequence[int]]
+    tz=None,  # type: Union[str, pendulum.tz.timezone.Timezone, None]
+):  # type: (...) -> PreciseDiff
+    """
+    Calculates the precise differences between many pairs of values,
+    as precise_diff() would for each pair.
+
+    Without a timezone, the values are date or datetime instances.
+    With a timezone, they are UTC timestamps in microseconds
+    and are compared in this timezone, which is resolved only once.
+
+    It returns a PreciseDiff whose attributes are arrays
+    of 64-bit integers, with one item per pair.
+    """
+    if tz is None:
+        if precise_diff is _py_precise_diff:
+            # The timezone names are only looked up once per timezone
+            tz_names = {}
+            rows = (_precise_diff(d1, d2, tz_names) for d1, d2 in zip(starts, ends))
+        else:
+            fields = attrgetter(*PreciseDiff._fields)
+            rows = (fields(precise_diff(d1, d2)) for d1, d2 in zip(starts, ends))
+    else:
+        rows = _diff_timestamps(starts, ends, pendulum._safe_timezone(tz))
+
+    columns = list(zip(*rows)) or [()] * len(PreciseDiff._fields)
+
+    return PreciseDiff(*map(int64_array, columns))
+
+
+def _diff_timestamps(
+    starts, ends, tz
+):  # type: (Sequence[int], Sequence[int], pendulum.tz.timezone.Timezone) -> Iterator[tuple]
+    # The pairs are read once and the offsets are looked up as they are read.
+    # Consecutive timestamps between the same transitions
+    # share their offset without any lookup.
+    pairs, pairs1, pairs2 = tee(zip(starts, ends), 3)
+    offsets1 = tz._utc_offsets(us1 // US_PER_SECOND for us1, _ in pairs1)
+    offsets2 = tz._utc_offsets(us2 // US_PER_SECOND for _, us2 in pairs2)
+    # The ordinal and date fields of the days seen so far
+    dates = {}
+
+    for (us1, us2), (_, offset1, _), (_, offset2, _) in zip(pairs, offsets1, offsets2):
+        offset1 *= US_PER_SECOND
+        offset2 *= US_PER_SECOND
+
+        # Values in the same timezone are compared by wall time
+        local1 = us1 + offset1
+        local2 = us2 + offset2
+        if local1 == local2:
+            yield (0,) * 8
+            continue
+
+        days1, time1 = divmod(local1, _US_PER_DAY)
+        date1 = dates.get(days1)
+        if date1 is None:
+            date1 = dates[days1] = _date_fields(_EPOCH_ORDINAL + days1)
+
+        days2, time2 = divmod(local2, _US_PER_DAY)
+        date2 = dates.get(days2)
+        if date2 is None:
+            date2 = dates[days2] = _date_fields(_EPOCH_ORDINAL + days2)
+
+        start = date1 + (time1, offset1)
+        end = date2 + (time2, offset2)
+
+        if local1 > local2:
+            yield _diff(end, start, -1, True)
+        else:
+            yield _diff(start, end, 1, True)
+
+
 def format_diff(diff, is_now=True, absolute=False, locale=None):
     if locale is None:
         locale = get_locale()
@@ -9,6 +9,10 @@ from pendulum.utils._compat import basestring
 from pendulum.utils._compat import decode
 
 
+# The value cached for missing keys
+_MISSING = object()
+
+
 class Locale:
     """
     Represent a specific locale.
@@ -16,35 +20,50 @@ class Locale:
 
     _cache = {}
 
+    # The names of the available locales, listed on first load.
+    _available = None
+
     def __init__(self, locale, data):
         self._locale = locale
         self._data = data
+
+        # The values looked up so far, keyed by their dotted key
         self._key_cache = {}
 
+        self._inverse_translations = {}
+
     @classmethod
     def load(cls, locale):
         if isinstance(locale, Locale):
             return locale
 
-        locale = cls.normalize_locale(locale)
         if locale in cls._cache:
             return cls._cache[locale]
 
-        # Checking locale existence
-        actual_locale = locale
-        locale_path = os.path.join(os.path.dirname(__file__), actual_locale)
-        while not os.path.exists(locale_path):
-            if actual_locale == locale:
-                raise ValueError("Locale [{}] does not exist.".format(locale))
+        locale = cls.normalize_locale(locale)
+        if locale in cls._cache:
+            return cls._cache[locale]
 
-            actual_locale = actual_locale.split("_")[0]
+        if locale not in cls.available_locales():
+            raise ValueError("Locale [{}] does not exist.".format(locale))
 
-        m = import_module("pendulum.locales.{}.locale".format(actual_locale))
+        m = import_module("pendulum.locales.{}.locale".format(locale))
 
         cls._cache[locale] = cls(locale, m.locale)
 
         return cls._cache[locale]
 
+    @classmethod
+    def available_locales(cls):  # type: () -> frozenset
+        if cls._available is None:
+            cls._available = frozenset(
+                name
+                for name in os.listdir(os.path.dirname(__file__))
+                if not name.startswith("_") and "." not in name
+            )
+
+        return cls._available
+
     @classmethod
     def normalize_locale(cls, locale):
         m = re.match("([a-z]{2})[-_]([a-z]{2})", locale, re.I)
@@ -54,23 +73,29 @@ class Locale:
             return locale.lower()
 
     def get(self, key, default=None):
-        if key in self._key_cache:
-            return self._key_cache[key]
+        try:
+            result = self._key_cache[key]
+        except KeyError:
+            result = self._key_cache[key] = self._get(key)
+
+        if result is _MISSING:
+            return default
+
+        return result
 
+    def _get(self, key):
         parts = key.split(".")
         try:
             result = self._data[parts[0]]
             for part in parts[1:]:
                 result = result[part]
         except KeyError:
-            result = default
+            return _MISSING
 
         if isinstance(result, basestring):
             result = decode(result)
 
-        self._key_cache[key] = result
-
-        return self._key_cache[key]
+        return result
 
     def translation(self, key):
         return self.get("translations.{}".format(key))
@@ -90,11 +115,24 @@ class Locale:
         return decode("{}{}".format(number, ordinal))
 
     def match_translation(self, key, value):
-        translations = self.translation(key)
-        if value not in translations.values():
-            return None
+        return self.inverse_translation(key).get(value)
+
+    def inverse_translation(self, key):
+        """
+        Returns the keys of the translations of the given key,
+        keyed by their translated value.
+
+        The table is built once and cached.
+        """
+        if key in self._inverse_translations:
+            return self._inverse_translations[key]
+
+        translations = self.translation(key) or {}
+        inverse = {v: k for k, v in translations.items()}
+
+        self._inverse_translations[key] = inverse
 
-        return {v: k for k, v in translations.items()}[value]
+        return inverse
 
     def __repr__(self):
         return "{}('{}')".format(self.__class__.__name__, self._locale)
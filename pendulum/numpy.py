@@ -0,0 +1,155 @@
+"""
+NumPy integration.
+
+Localizes arrays of instants, given as datetime64 values
+or integer timestamps, without creating any DateTime instance.
+
+This module requires NumPy to be installed.
+"""
+from __future__ import absolute_import
+
+import pendulum
+
+from collections import namedtuple
+from typing import Union
+
+try:
+    import numpy as np
+except ImportError:
+    raise ImportError("The pendulum.numpy module requires NumPy to be installed.")
+
+from .tz.timezone import Timezone, FixedTimezone
+
+
+LocalFields = namedtuple(
+    "LocalFields",
+    "year month day hour minute second microsecond " "offset is_dst fold",
+)
+
+_US_PER_UNIT = {"s": 1000000, "ms": 1000, "us": 1}
+
+
+def offsets(
+    tz, values, unit="s"  # type: Union[str, Timezone]  # type: np.ndarray  # type: str
+):  # type: (...) -> np.ndarray
+    """
+    Returns the UTC offsets, in seconds, of the given instants
+    in the given timezone.
+
+    :param tz: The timezone.
+    :param values: An array of datetime64 values (in UTC) or of UTC timestamps.
+    :param unit: The unit of the timestamps: "s", "ms" or "us".
+    """
+    tz = pendulum._safe_timezone(tz)
+    seconds, _ = _split(values, unit)
+
+    return _offsets(tz, seconds)[0]
+
+
+def localize(
+    tz, values, unit="s"  # type: Union[str, Timezone]  # type: np.ndarray  # type: str
+):  # type: (...) -> LocalFields
+    """
+    Localizes the given instants in the given timezone.
+
+    It returns the local year, month, day, hour, minute, second
+    and microsecond, the UTC offset, in seconds, a mask of instants
+    in daylight saving time and the fold attribute
+    Timezone.convert() would set, as arrays.
+
+    >>> import numpy as np
+    >>> from pendulum.numpy import localize
+    >>> values = np.array(['2013-01-01T00:00', '2013-07-01T00:00'], 'M8[us]')
+    >>> fields = localize('Europe/Paris', values)
+    >>> fields.hour.tolist(), fields.offset.tolist()
+    ([1, 2], [3600, 7200])
+
+    :param tz: The timezone.
+    :param values: An array of datetime64 values (in UTC) or of UTC timestamps.
+    :param unit: The unit of the timestamps: "s", "ms" or "us".
+    """
+    tz = pendulum._safe_timezone(tz)
+    seconds, microseconds = _split(values, unit)
+    offset, is_dst, fold = _offsets(tz, seconds)
+
+    local = seconds + offset
+    days = np.floor_divide(local, 86400)
+    seconds_of_day = local - days * 86400
+
+    days = days.astype("datetime64[D]")
+    months = days.astype("datetime64[M]")
+    year = months.astype("datetime64[Y]").astype(np.int64) + 1970
+    month = months.astype(np.int64) % 12 + 1
+    day = (days - months).astype(np.int64) + 1
+
+    return LocalFields(
+        year,
+        month,
+        day,
+        seconds_of_day // 3600,
+        seconds_of_day % 3600 // 60,
+        seconds_of_day % 60,
+        microseconds,
+        offset,
+        is_dst,
+        fold,
+    )
+
+
+def _split(values, unit):  # type: (np.ndarray, str) -> tuple
+    """
+    Splits instants in seconds and microseconds since the epoch.
+    """
+    values = np.asarray(values)
+
+    if np.issubdtype(values.dtype, np.datetime64):
+        values = values.astype("datetime64[us]").view(np.int64)
+        unit = "us"
+    elif not np.issubdtype(values.dtype, np.integer):
+        raise TypeError("Expected an array of datetime64 values or of integers.")
+
+    if unit not in _US_PER_UNIT:
+        raise ValueError('Invalid unit "{}".'.format(unit))
+
+    values = values.astype(np.int64) * _US_PER_UNIT[unit]
+    seconds = np.floor_divide(values, 1000000)
+
+    return seconds, values - seconds * 1000000
+
+
+def _offsets(tz, seconds):  # type: (Timezone, np.ndarray) -> tuple
+    """
+    Returns the UTC offsets, the daylight saving time mask
+    and the fold attributes of the given UTC timestamps.
+    """
+    if isinstance(tz, FixedTimezone):
+        return (
+            np.full(seconds.shape, tz.offset, dtype=np.int64),
+            np.zeros(seconds.shape, dtype=bool),
+            np.zeros(seconds.shape, dtype=np.int8),
+        )
+
+    if seconds.size:
+        # Makes sure the transitions cover the given timestamps
+        tz._lookup_transition(int(seconds.max()), is_utc=True)
+
+    # The transition columns are copied since they can still
+    # be extended, which is not possible while their buffer is exported.
+    at = np.array(tz._at, dtype=np.int64)
+
+    # The type in effect before the first transition comes first,
+    # so that the number of transitions before a timestamp
+    # is the index of its type.
+    ttypes = [tz._initial_type] + list(tz._types)
+    type_indexes = np.empty(len(at) + 1, dtype=np.intp)
+    type_indexes[0] = 0
+    type_indexes[1:] = np.array(tz._type_indexes, dtype=np.intp) + 1
+    types_offsets = np.array([t.offset for t in ttypes], dtype=np.int64)
+    types_dst = np.array([t.is_dst() for t in ttypes], dtype=bool)
+
+    idx = np.searchsorted(at, seconds, side="right")
+    types = type_indexes[idx]
+
+    is_dst = types_dst[types]
+
+    return types_offsets[types], is_dst, (~is_dst).astype(np.int8)
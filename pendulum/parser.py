@@ -3,14 +3,20 @@ from __future__ import absolute_import
 import pendulum
 import datetime
 
-from .parsing import parse as base_parse, _Interval
+from functools import partial
+
+from .datetime import DateTime
+from .parsing import parse as base_parse, parse_iso8601_datetime, _Interval
 
 try:
     from .parsing._iso8601 import Duration as CDuration
 except ImportError:
     CDuration = None
 
-from .tz import UTC
+from .tz import UTC, fixed_timezone
+from .tz.timezone import FixedTimezone
+from .utils._bulk import apply_many
+from .utils._compat import basestring
 
 
 def parse(text, **options):
@@ -20,6 +26,26 @@ def parse(text, **options):
     return _parse(text, **options)
 
 
+def parse_many(texts, errors="raise", processes=None, chunksize=None, **options):
+    """
+    Parses many strings with the same options,
+    yielding the results in order.
+
+    :param texts: The strings to parse.
+    :param errors: "raise" to raise the first parsing error,
+                   "return" to yield the error in place of the result.
+    :param processes: The number of processes to parse in, if any.
+    :param chunksize: The number of strings sent to a process at once.
+    """
+    # Use the mock now value if it exists
+    options["now"] = options.get("now", pendulum.get_test_now())
+
+    if isinstance(options.get("tz"), basestring):
+        options["tz"] = pendulum.timezone(options["tz"])
+
+    return apply_many(partial(_parse, **options), texts, errors, processes, chunksize)
+
+
 def _parse(text, **options):
     """
     Parses a string with the given options.
@@ -33,6 +59,19 @@ def _parse(text, **options):
     if text == "now":
         return pendulum.now()
 
+    # ISO 8601 dates and datetimes are directly parsed
+    # into DateTime instances, unless they need to be normalized
+    # in a timezone with transitions.
+    tz = options.get("tz", UTC)
+    if not options.get("exact") and (tz is None or isinstance(tz, FixedTimezone)):
+        try:
+            dt = parse_iso8601_datetime(text, DateTime, fixed_timezone, tz)
+        except ValueError:
+            dt = None
+
+        if dt is not None:
+            return dt
+
     parsed = base_parse(text, **options)
 
     if isinstance(parsed, datetime.datetime):
@@ -2,14 +2,31 @@ import re
 import copy
 
 from datetime import datetime, date, time
+from itertools import chain
 from dateutil import parser
 
 from .exceptions import ParserError
 
 try:
-    from ._iso8601 import parse_iso8601
+    from ._iso8601 import (
+        parse_iso8601,
+        parse_iso8601_datetime,
+        parse_iso8601_epoch,
+        parse_iso8601_lines,
+        set_fixed_timezones as _set_fixed_timezones,
+    )
 except ImportError:
-    from .iso8601 import parse_iso8601
+    from .iso8601 import (
+        parse_iso8601,
+        parse_iso8601_datetime,
+        parse_iso8601_epoch,
+        parse_iso8601_lines,
+    )
+else:
+    from ..tz import _tz_cache, fixed_timezone
+
+    # Parsed offsets are looked up directly in the fixed timezones cache
+    _set_fixed_timezones(_tz_cache.fixed_timezones, fixed_timezone)
 
 
 COMMON = re.compile(
@@ -48,6 +65,10 @@ DEFAULT_OPTIONS = {
 }
 
 
+# The number of bytes parsed at once by iter_iso8601() by default.
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+
 def parse(text, **options):
     """
     Parses a string with the given options.
@@ -63,6 +84,89 @@ def parse(text, **options):
     return _normalize(_parse(text, **_options), **_options)
 
 
+def iter_iso8601(
+    source,
+    delimiter=b"\n",
+    separator=None,
+    field=0,
+    epoch=False,
+    errors="raise",
+    chunk_size=DEFAULT_CHUNK_SIZE,
+):
+    """
+    Parses the ISO 8601 date or datetime of each line
+    of a bytes-like object, or of a binary file,
+    and yields the results in order.
+
+    Lines are parsed by chunks, directly from the bytes,
+    and empty lines are skipped.
+
+    :param source: A bytes-like object, like bytes or a memoryview, or a binary file.
+    :param delimiter: The lines delimiter.
+    :param separator: The fields separator, if the datetime is a field of each line.
+    :param field: The index of the field holding the datetime.
+    :param epoch: Whether to yield the number of microseconds since the epoch
+                  instead of date and datetime objects. Naive datetimes
+                  are assumed to be in UTC.
+    :param errors: "raise" to raise the first parsing error,
+                   "return" to yield the error in place of the result.
+    :param chunk_size: The number of bytes parsed at once.
+
+    :rtype: generator
+    """
+    if errors not in ("raise", "return"):
+        raise ValueError(
+            'Invalid errors value "{}", expected "raise" or "return".'.format(errors)
+        )
+
+    if len(delimiter) != 1 or separator is not None and len(separator) != 1:
+        raise ValueError("The delimiter and the separator must be single bytes.")
+
+    if separator is None:
+        if field:
+            raise ValueError("A separator is required to parse a field.")
+
+        separator = -1
+    else:
+        separator = bytearray(separator)[0]
+
+    def parse_lines(data, final):
+        return parse_iso8601_lines(
+            data,
+            bytearray(delimiter)[0],
+            separator,
+            field,
+            epoch,
+            final,
+            errors == "return",
+            ParserError,
+        )
+
+    if hasattr(source, "read"):
+        chunks = iter(lambda: source.read(chunk_size), b"")
+    else:
+        view = memoryview(source)
+        chunks = (view[i : i + chunk_size] for i in range(0, len(view), chunk_size))
+
+    return chain.from_iterable(_iter_lines(parse_lines, chunks))
+
+
+def _iter_lines(parse_lines, chunks):
+    remainder = b""
+    for chunk in chunks:
+        if remainder:
+            chunk = remainder + chunk
+
+        results, consumed = parse_lines(chunk, False)
+        yield results
+
+        # The last line, if incomplete, is parsed with the next chunk
+        remainder = memoryview(chunk)[consumed:].tobytes()
+
+    if remainder:
+        yield parse_lines(remainder, True)[0]
+
+
 def _normalize(parsed, **options):
     """
     Normalizes the parsed element.
@@ -109,8 +109,9 @@ const int PARSER_INVALID_SUBSECOND = 13;
 const int PARSER_INVALID_TZ_OFFSET = 14;
 const int PARSER_INVALID_DURATION = 15;
 const int PARSER_INVALID_DURATION_FLOAT_YEAR_MONTH_NOT_SUPPORTED = 16;
+const int PARSER_MISSING_FIELD = 17;
 
-const char PARSER_ERRORS[17][80] = {
+const char PARSER_ERRORS[18][80] = {
     "Invalid ISO 8601 string",
     "Invalid date",
     "Invalid time",
@@ -127,7 +128,8 @@ const char PARSER_ERRORS[17][80] = {
     "Invalid subsecond",
     "Invalid timezone offset",
     "Invalid duration",
-    "Float years and months are not supported"
+    "Float years and months are not supported",
+    "Missing field"
 };
 
 /* ------------------------------------------------------------------------- */
@@ -304,6 +306,84 @@ static PyObject *new_fixed_offset_ex(int offset, PyTypeObject *type) {
 #define new_fixed_offset(offset) new_fixed_offset_ex(offset, &FixedOffset_type)
 
 
+/*
+ * The interned fixed offset timezones, keyed by offset,
+ * and the function creating and interning missing ones,
+ * registered with set_fixed_timezones().
+ */
+static PyObject *fixed_timezones = NULL;
+static PyObject *fixed_timezone_factory = NULL;
+
+/*
+ * def set_fixed_timezones(table, factory):
+ *
+ * Registers the table of interned fixed offset timezones,
+ * which is only read, and the function called with an offset
+ * to get the timezones missing from it.
+ */
+static PyObject* set_fixed_timezones(PyObject *self, PyObject *args) {
+    PyObject *table;
+    PyObject *factory;
+
+    if (!PyArg_ParseTuple(args, "O!O", &PyDict_Type, &table, &factory)) {
+        return NULL;
+    }
+
+    Py_INCREF(table);
+    Py_INCREF(factory);
+    Py_XDECREF(fixed_timezones);
+    Py_XDECREF(fixed_timezone_factory);
+
+    fixed_timezones = table;
+    fixed_timezone_factory = factory;
+
+    Py_RETURN_NONE;
+}
+
+/*
+ * Returns the fixed offset timezone given by factory(offset),
+ * looking it up directly in the table of interned timezones
+ * if the factory is the registered one.
+ *
+ * Without factory, the registered one is used,
+ * or a new FixedOffset is created if none is registered.
+ */
+static PyObject* get_fixed_timezone(int offset, PyObject *factory) {
+    PyObject *key;
+    PyObject *tz;
+
+    if (factory == NULL) {
+        if (fixed_timezone_factory == NULL) {
+            return new_fixed_offset(offset);
+        }
+
+        factory = fixed_timezone_factory;
+    }
+
+    if (factory == fixed_timezone_factory) {
+        key = PyLong_FromLong(offset);
+        if (key == NULL) {
+            return NULL;
+        }
+
+        tz = PyDict_GetItemWithError(fixed_timezones, key);
+        Py_DECREF(key);
+
+        if (tz != NULL) {
+            Py_INCREF(tz);
+
+            return tz;
+        }
+
+        if (PyErr_Occurred()) {
+            return NULL;
+        }
+    }
+
+    return PyObject_CallFunction(factory, "i", offset);
+}
+
+
 /*
  * class Duration():
  */
@@ -467,40 +547,34 @@ typedef struct {
 } Parsed;
 
 
-Parsed* new_parsed() {
-    Parsed *parsed;
-
-    if((parsed = malloc(sizeof *parsed)) != NULL) {
-        parsed->is_date = 0;
-        parsed->is_time = 0;
-        parsed->is_datetime = 0;
-        parsed->is_duration = 0;
-        parsed->is_period = 0;
-
-        parsed->ambiguous = 0;
-        parsed->year = 0;
-        parsed->month = 1;
-        parsed->day = 1;
-        parsed->hour = 0;
-        parsed->minute = 0;
-        parsed->second = 0;
-        parsed->microsecond = 0;
-        parsed->offset = 0;
-        parsed->has_offset = 0;
-
-        parsed->years = 0;
-        parsed->months = 0;
-        parsed->weeks = 0;
-        parsed->days = 0;
-        parsed->hours = 0;
-        parsed->minutes = 0;
-        parsed->seconds = 0;
-        parsed->microseconds = 0;
-
-        parsed->error = -1;
-    }
-
-    return parsed;
+void init_parsed(Parsed *parsed) {
+    parsed->is_date = 0;
+    parsed->is_time = 0;
+    parsed->is_datetime = 0;
+    parsed->is_duration = 0;
+    parsed->is_period = 0;
+
+    parsed->ambiguous = 0;
+    parsed->year = 0;
+    parsed->month = 1;
+    parsed->day = 1;
+    parsed->hour = 0;
+    parsed->minute = 0;
+    parsed->second = 0;
+    parsed->microsecond = 0;
+    parsed->offset = 0;
+    parsed->has_offset = 0;
+
+    parsed->years = 0;
+    parsed->months = 0;
+    parsed->weeks = 0;
+    parsed->days = 0;
+    parsed->hours = 0;
+    parsed->minutes = 0;
+    parsed->seconds = 0;
+    parsed->microseconds = 0;
+
+    parsed->error = -1;
 }
 
 
@@ -1200,11 +1274,118 @@ Parsed* _parse_iso8601_duration(char *str, Parsed *parsed) {
 }
 
 
-PyObject* parse_iso8601(PyObject *self, PyObject *args) {
-    char* str;
+/*
+ * Creates the date, time or datetime object of a parsed datetime.
+ */
+static PyObject* _parsed_to_object(Parsed *parsed) {
     PyObject *obj;
     PyObject *tzinfo;
-    Parsed *parsed = new_parsed();
+
+    if (parsed->is_date) {
+        // Date only
+        if (parsed->ambiguous) {
+            // We can "safely" assume that the ambiguous
+            // date was actually a time in the form hhmmss
+            parsed->hour = parsed->year / 100;
+            parsed->minute = parsed->year % 100;
+            parsed->second = parsed->month;
+
+            return PyDateTimeAPI->Time_FromTime(
+                parsed->hour, parsed->minute, parsed->second, parsed->microsecond,
+                Py_None,
+                PyDateTimeAPI->TimeType
+            );
+        }
+
+        return PyDateTimeAPI->Date_FromDate(
+            parsed->year, parsed->month, parsed->day,
+            PyDateTimeAPI->DateType
+        );
+    }
+
+    if (!parsed->has_offset) {
+        tzinfo = Py_None;
+        Py_INCREF(tzinfo);
+    } else {
+        tzinfo = get_fixed_timezone(parsed->offset, NULL);
+        if (tzinfo == NULL) {
+            return NULL;
+        }
+    }
+
+    obj = PyDateTimeAPI->DateTime_FromDateAndTime(
+        parsed->year,
+        parsed->month,
+        parsed->day,
+        parsed->hour,
+        parsed->minute,
+        parsed->second,
+        parsed->microsecond,
+        tzinfo,
+        PyDateTimeAPI->DateTimeType
+    );
+
+    Py_DECREF(tzinfo);
+
+    return obj;
+}
+
+
+/*
+ * Returns the number of microseconds since the epoch
+ * of a parsed date or datetime, naive ones being assumed in UTC.
+ */
+static int64_t _parsed_to_epoch(Parsed *parsed) {
+    int64_t y = parsed->year - 1;
+    int64_t days;
+
+    // The number of days between 0001-01-01 and 1970-01-01 is 719162
+    days = y * DAYS_PER_N_YEAR + y / 4 - y / 100 + y / 400
+        + MONTHS_OFFSETS[is_leap(parsed->year)][parsed->month]
+        + parsed->day - 1
+        - 719162;
+
+    return (
+        days * SECS_PER_DAY
+        + parsed->hour * SECS_PER_HOUR
+        + parsed->minute * SECS_PER_MIN
+        + parsed->second
+        - parsed->offset
+    ) * USECS_PER_SEC + parsed->microsecond;
+}
+
+
+/*
+ * Checks that a parsed datetime can be represented as an object
+ * or, if epoch is true, as a number of microseconds since the epoch.
+ */
+static Parsed* _check_parsed(Parsed *parsed, int epoch) {
+    if (parsed->year < 1 || parsed->month < 1 || parsed->day < 1) {
+        parsed->error = PARSER_INVALID_DATE;
+
+        return NULL;
+    }
+
+    if (parsed->offset <= -SECS_PER_DAY || parsed->offset >= SECS_PER_DAY) {
+        parsed->error = PARSER_INVALID_TZ_OFFSET;
+
+        return NULL;
+    }
+
+    if (epoch && parsed->ambiguous) {
+        // Times do not represent an instant
+        parsed->error = PARSER_INVALID_DATE;
+
+        return NULL;
+    }
+
+    return parsed;
+}
+
+
+PyObject* parse_iso8601(PyObject *self, PyObject *args) {
+    char* str;
+    Parsed parsed;
 
     if (!PyArg_ParseTuple(args, "s", &str)) {
         PyErr_SetString(
@@ -1213,78 +1394,394 @@ PyObject* parse_iso8601(PyObject *self, PyObject *args) {
         return NULL;
     }
 
+    init_parsed(&parsed);
+
     if (*str == 'P') {
         // Duration (or interval)
-        if (_parse_iso8601_duration(str, parsed) == NULL) {
+        if (_parse_iso8601_duration(str, &parsed) == NULL) {
             PyErr_SetString(
-                PyExc_ValueError, PARSER_ERRORS[parsed->error]
+                PyExc_ValueError, PARSER_ERRORS[parsed.error]
             );
 
             return NULL;
         }
-    } else if (_parse_iso8601_datetime(str, parsed) == NULL) {
+    } else if (_parse_iso8601_datetime(str, &parsed) == NULL) {
         PyErr_SetString(
-            PyExc_ValueError, PARSER_ERRORS[parsed->error]
+            PyExc_ValueError, PARSER_ERRORS[parsed.error]
         );
 
         return NULL;
     }
 
-    if (parsed->is_date) {
-        // Date only
-        if (parsed->ambiguous) {
-            // We can "safely" assume that the ambiguous
-            // date was actually a time in the form hhmmss
-            parsed->hour = parsed->year / 100;
-            parsed->minute = parsed->year % 100;
-            parsed->second = parsed->month;
+    if (parsed.is_duration) {
+        return new_duration(
+            parsed.years, parsed.months, parsed.weeks, parsed.days,
+            parsed.hours, parsed.minutes, parsed.seconds, parsed.microseconds
+        );
+    }
 
-            obj = PyDateTimeAPI->Time_FromTime(
-                parsed->hour, parsed->minute, parsed->second, parsed->microsecond,
-                Py_BuildValue(""),
-                PyDateTimeAPI->TimeType
-            );
-        } else {
-            obj = PyDateTimeAPI->Date_FromDate(
-                parsed->year, parsed->month, parsed->day,
-                PyDateTimeAPI->DateType
-            );
-        }
-    } else if (parsed->is_datetime) {
-        if (!parsed->has_offset) {
-            tzinfo = Py_BuildValue("");
-        } else {
-            tzinfo = new_fixed_offset(parsed->offset);
-        }
+    if (!parsed.is_date && !parsed.is_datetime) {
+        return NULL;
+    }
+
+    return _parsed_to_object(&parsed);
+}
 
-        obj = PyDateTimeAPI->DateTime_FromDateAndTime(
-            parsed->year,
-            parsed->month,
-            parsed->day,
-            parsed->hour,
-            parsed->minute,
-            parsed->second,
-            parsed->microsecond,
-            tzinfo,
-            PyDateTimeAPI->DateTimeType
+
+/*
+ * def parse_iso8601_epoch(text):
+ *
+ * Parses an ISO 8601 date or datetime string into the number
+ * of microseconds since the epoch and the UTC offset, in seconds,
+ * or None for naive datetimes which are assumed to be in UTC.
+ */
+PyObject* parse_iso8601_epoch(PyObject *self, PyObject *args) {
+    char* str;
+    Parsed parsed;
+    PyObject *epoch;
+    PyObject *offset;
+    PyObject *result;
+
+    if (!PyArg_ParseTuple(args, "s", &str)) {
+        PyErr_SetString(
+            PyExc_ValueError, "Invalid parameters"
         );
+        return NULL;
+    }
 
-        Py_DECREF(tzinfo);
-    } else if (parsed->is_duration) {
-        obj = new_duration(
-            parsed->years, parsed->months, parsed->weeks, parsed->days,
-            parsed->hours, parsed->minutes, parsed->seconds, parsed->microseconds
+    init_parsed(&parsed);
+
+    if (
+        _parse_iso8601_datetime(str, &parsed) == NULL
+        || _check_parsed(&parsed, 1) == NULL
+    ) {
+        PyErr_SetString(
+            PyExc_ValueError, PARSER_ERRORS[parsed.error]
         );
+
+        return NULL;
+    }
+
+    epoch = PyLong_FromLongLong(_parsed_to_epoch(&parsed));
+    if (epoch == NULL) {
+        return NULL;
+    }
+
+    if (!parsed.has_offset) {
+        offset = Py_None;
+        Py_INCREF(offset);
     } else {
+        offset = PyLong_FromLong(parsed.offset);
+        if (offset == NULL) {
+            Py_DECREF(epoch);
+
+            return NULL;
+        }
+    }
+
+    result = PyTuple_New(2);
+    if (result == NULL) {
+        Py_DECREF(epoch);
+        Py_DECREF(offset);
+
+        return NULL;
+    }
+
+    PyTuple_SET_ITEM(result, 0, epoch);
+    PyTuple_SET_ITEM(result, 1, offset);
+
+    return result;
+}
+
+
+/*
+ * def parse_iso8601_datetime(text, datetime_class, fixed_timezone, tz):
+ *
+ * Parses an ISO 8601 date or datetime string directly
+ * into an instance of the given datetime class.
+ *
+ * Datetimes with an offset get the timezone returned by fixed_timezone(offset),
+ * naive datetimes and dates, at midnight, get tz.
+ * Returns None for the other ISO 8601 strings, like times and durations.
+ */
+PyObject* parse_iso8601_datetime(PyObject *self, PyObject *args) {
+    char* str;
+    Parsed parsed;
+    PyTypeObject *datetime_class;
+    PyObject *fixed_timezone;
+    PyObject *tz;
+    PyObject *tzinfo;
+    PyObject *obj;
+
+    if (!PyArg_ParseTuple(
+            args, "sO!OO", &str, &PyType_Type, &datetime_class, &fixed_timezone, &tz
+    )) {
+        PyErr_SetString(
+            PyExc_ValueError, "Invalid parameters"
+        );
+        return NULL;
+    }
+
+    if (!PyType_IsSubtype(datetime_class, PyDateTimeAPI->DateTimeType)) {
+        PyErr_SetString(
+            PyExc_TypeError, "The datetime class must be a subclass of datetime"
+        );
+        return NULL;
+    }
+
+    init_parsed(&parsed);
+
+    if (*str == 'P') {
+        Py_RETURN_NONE;
+    }
+
+    if (
+        _parse_iso8601_datetime(str, &parsed) == NULL
+        || _check_parsed(&parsed, 0) == NULL
+    ) {
+        PyErr_SetString(
+            PyExc_ValueError, PARSER_ERRORS[parsed.error]
+        );
+
         return NULL;
     }
 
-    free(parsed);
+    if (parsed.ambiguous || (!parsed.is_date && !parsed.is_datetime)) {
+        Py_RETURN_NONE;
+    }
+
+    if (parsed.has_offset) {
+        tzinfo = get_fixed_timezone(parsed.offset, fixed_timezone);
+        if (tzinfo == NULL) {
+            return NULL;
+        }
+    } else {
+        tzinfo = tz;
+        Py_INCREF(tzinfo);
+    }
+
+#if PY_VERSION_HEX < 0x03060000
+    // The fold attribute of datetime subclasses is only set by their constructor
+    obj = PyObject_CallFunction(
+        (PyObject *) datetime_class, "iiiiiiiO",
+        parsed.year,
+        parsed.month,
+        parsed.day,
+        parsed.hour,
+        parsed.minute,
+        parsed.second,
+        parsed.microsecond,
+        tzinfo
+    );
+#else
+    obj = PyDateTimeAPI->DateTime_FromDateAndTime(
+        parsed.year,
+        parsed.month,
+        parsed.day,
+        parsed.hour,
+        parsed.minute,
+        parsed.second,
+        parsed.microsecond,
+        tzinfo,
+        datetime_class
+    );
+#endif
+
+    Py_DECREF(tzinfo);
 
     return obj;
 }
 
 
+// The maximum length of the datetimes parsed by parse_iso8601_lines().
+#define MAX_FIELD_LENGTH 63
+
+/*
+ * Parses the datetime in the given field of a line.
+ *
+ * Returns the parsed object, or the number of microseconds
+ * since the epoch, an error instance if errors are returned
+ * or NULL if an error has been raised.
+ */
+static PyObject* _parse_iso8601_field(
+    const char *line, const char *eol,
+    int separator, int field, int epoch,
+    int return_errors, PyObject *error_class
+) {
+    char str[MAX_FIELD_LENGTH + 1];
+    const char *start = line;
+    const char *end = eol;
+    Py_ssize_t length;
+    Parsed parsed;
+    PyObject *text;
+    PyObject *message;
+    PyObject *error;
+    int i;
+
+    init_parsed(&parsed);
+
+    if (separator >= 0) {
+        for (i = 0; i < field; i++) {
+            start = memchr(start, separator, eol - start);
+            if (start == NULL) {
+                break;
+            }
+
+            start++;
+        }
+
+        if (start == NULL) {
+            parsed.error = PARSER_MISSING_FIELD;
+            start = line;
+        } else {
+            end = memchr(start, separator, eol - start);
+            if (end == NULL) {
+                end = eol;
+            }
+        }
+    }
+
+    length = end - start;
+
+    if (parsed.error < 0) {
+        if (length > MAX_FIELD_LENGTH || memchr(start, '\0', length) != NULL) {
+            parsed.error = PARSER_INVALID_ISO8601;
+        } else {
+            memcpy(str, start, length);
+            str[length] = '\0';
+
+            if (
+                _parse_iso8601_datetime(str, &parsed) != NULL
+                && _check_parsed(&parsed, epoch) != NULL
+            ) {
+                if (epoch) {
+                    return PyLong_FromLongLong(_parsed_to_epoch(&parsed));
+                }
+
+                return _parsed_to_object(&parsed);
+            }
+        }
+    }
+
+    text = PyUnicode_DecodeLatin1(start, length, NULL);
+    if (text == NULL) {
+        return NULL;
+    }
+
+    message = PyUnicode_FromFormat("%s [%U]", PARSER_ERRORS[parsed.error], text);
+    Py_DECREF(text);
+    if (message == NULL) {
+        return NULL;
+    }
+
+    if (!return_errors) {
+        PyErr_SetObject(error_class, message);
+        Py_DECREF(message);
+
+        return NULL;
+    }
+
+    error = PyObject_CallFunctionObjArgs(error_class, message, NULL);
+    Py_DECREF(message);
+
+    return error;
+}
+
+
+/*
+ * def parse_iso8601_lines(
+ *     data, delimiter, separator, field, epoch, final, return_errors, error_class
+ * ):
+ *
+ * Parses the datetime of each line of a bytes-like object
+ * and returns the results and the number of bytes consumed.
+ *
+ * Unless final is true, the last line is left unparsed
+ * if it is not terminated by the delimiter.
+ * Empty lines are skipped.
+ */
+PyObject* parse_iso8601_lines(PyObject *self, PyObject *args) {
+    Py_buffer buffer;
+    int delimiter;
+    int separator;
+    int field;
+    int epoch;
+    int final;
+    int return_errors;
+    PyObject *error_class;
+    PyObject *results;
+    PyObject *result;
+    const char *data;
+    const char *line;
+    const char *eol;
+    const char *end;
+
+    if (!PyArg_ParseTuple(
+        args, "y*iiipppO:parse_iso8601_lines",
+        &buffer, &delimiter, &separator, &field, &epoch, &final, &return_errors,
+        &error_class
+    )) {
+        return NULL;
+    }
+
+    results = PyList_New(0);
+    if (results == NULL) {
+        PyBuffer_Release(&buffer);
+
+        return NULL;
+    }
+
+    data = buffer.buf;
+    end = data + buffer.len;
+    line = data;
+
+    while (line < end) {
+        eol = memchr(line, delimiter, end - line);
+        if (eol == NULL) {
+            if (!final) {
+                break;
+            }
+
+            eol = end;
+        }
+
+        // The end of the line, without any carriage return
+        end = eol;
+        if (end > line && *(end - 1) == '\r') {
+            end--;
+        }
+
+        if (end > line) {
+            result = _parse_iso8601_field(
+                line, end, separator, field, epoch, return_errors, error_class
+            );
+
+            if (result == NULL || PyList_Append(results, result) < 0) {
+                Py_XDECREF(result);
+                Py_DECREF(results);
+                PyBuffer_Release(&buffer);
+
+                return NULL;
+            }
+
+            Py_DECREF(result);
+        }
+
+        end = data + buffer.len;
+        line = eol + 1;
+    }
+
+    if (line > end) {
+        line = end;
+    }
+
+    result = Py_BuildValue("(Nn)", results, (Py_ssize_t) (line - data));
+    PyBuffer_Release(&buffer);
+
+    return result;
+}
+
+
 /* ------------------------------------------------------------------------- */
 
 static PyMethodDef helpers_methods[] = {
@@ -1294,6 +1791,30 @@ static PyMethodDef helpers_methods[] = {
         METH_VARARGS,
         PyDoc_STR("Parses a ISO8601 string into a tuple.")
     },
+    {
+        "parse_iso8601_epoch",
+        (PyCFunction) parse_iso8601_epoch,
+        METH_VARARGS,
+        PyDoc_STR("Parses a ISO8601 string into microseconds since the epoch and an offset.")
+    },
+    {
+        "parse_iso8601_datetime",
+        (PyCFunction) parse_iso8601_datetime,
+        METH_VARARGS,
+        PyDoc_STR("Parses a ISO8601 date or datetime string into an instance of a datetime class.")
+    },
+    {
+        "set_fixed_timezones",
+        (PyCFunction) set_fixed_timezones,
+        METH_VARARGS,
+        PyDoc_STR("Registers the table of interned fixed offset timezones and their factory.")
+    },
+    {
+        "parse_iso8601_lines",
+        (PyCFunction) parse_iso8601_lines,
+        METH_VARARGS,
+        PyDoc_STR("Parses the ISO8601 datetime of each line of a bytes-like object.")
+    },
     {NULL}
 };
 
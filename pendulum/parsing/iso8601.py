@@ -7,10 +7,13 @@ from ..constants import (
     HOURS_PER_DAY,
     MINUTES_PER_HOUR,
     SECONDS_PER_MINUTE,
+    SECONDS_PER_HOUR,
+    SECONDS_PER_DAY,
+    US_PER_SECOND,
     MONTHS_OFFSETS,
 )
 from ..helpers import week_day, days_in_year, is_leap, is_long_year
-from ..tz.timezone import FixedTimezone
+from ..tz import fixed_timezone as _fixed_timezone
 from ..duration import Duration
 from .exceptions import ParserError
 
@@ -86,8 +89,34 @@ def parse_iso8601(text):
 
     :rtype: datetime.datetime or datetime.time or datetime.date
     """
+    return _parse_iso8601(text)
+
+
+def parse_iso8601_datetime(text, datetime_class, fixed_timezone, tz):
+    """
+    Parses an ISO 8601 date or datetime string directly
+    into an instance of the given datetime class.
+
+    Datetimes with an offset get the timezone returned by fixed_timezone(offset),
+    naive datetimes and dates, at midnight, get tz.
+
+    :param text: The string to parse
+    :type text: str
+
+    :rtype: datetime.datetime or None for times and durations
+    """
+    if not issubclass(datetime_class, datetime.datetime):
+        raise TypeError("The datetime class must be a subclass of datetime")
+
+    return _parse_iso8601(text, datetime_class, fixed_timezone, tz)
+
+
+def _parse_iso8601(text, datetime_class=None, fixed_timezone=_fixed_timezone, tz=None):
     parsed = _parse_iso8601_duration(text)
     if parsed is not None:
+        if datetime_class is not None:
+            return
+
         return parsed
 
     m = ISO8601_DT.match(text)
@@ -103,7 +132,7 @@ def parse_iso8601(text):
     minute = 0
     second = 0
     microsecond = 0
-    tzinfo = None
+    tzinfo = tz
 
     if m:
         if m.group("date"):
@@ -178,12 +207,18 @@ def parse_iso8601(text):
         if not m.group("time"):
             # No time has been specified
             if ambiguous_date:
+                if datetime_class is not None:
+                    return
+
                 # We can "safely" assume that the ambiguous date
                 # was actually a time in the form hhmmss
                 hhmmss = "{}{:0>2}".format(str(year), str(month))
 
                 return datetime.time(int(hhmmss[:2]), int(hhmmss[2:4]), int(hhmmss[4:]))
 
+            if datetime_class is not None:
+                return datetime_class(year, month, day, tzinfo=tz)
+
             return datetime.date(year, month, day)
 
         if ambiguous_date:
@@ -247,16 +282,144 @@ def parse_iso8601(text):
                 if negative:
                     offset = -1 * offset
 
-            tzinfo = FixedTimezone(offset)
+                if offset <= -SECONDS_PER_DAY or offset >= SECONDS_PER_DAY:
+                    raise ParserError("Invalid timezone offset")
+
+            tzinfo = fixed_timezone(offset)
 
         if is_time:
+            if datetime_class is not None:
+                return
+
             return datetime.time(hour, minute, second, microsecond)
 
-        return datetime.datetime(
+        return (datetime_class or datetime.datetime)(
             year, month, day, hour, minute, second, microsecond, tzinfo=tzinfo
         )
 
 
+_EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal()
+
+
+def parse_iso8601_epoch(text):
+    """
+    Parses an ISO 8601 date or datetime string into the number
+    of microseconds since the epoch and the UTC offset, in seconds,
+    or None for naive datetimes which are assumed to be in UTC.
+
+    :param text: The string to parse
+    :type text: str
+
+    :rtype: tuple
+    """
+    parsed = parse_iso8601(text)
+    if not isinstance(parsed, datetime.date):
+        raise ParserError("Invalid ISO 8601 string")
+
+    offset = None
+    if isinstance(parsed, datetime.datetime) and parsed.tzinfo is not None:
+        offset = parsed.utcoffset()
+        offset = offset.days * SECONDS_PER_DAY + offset.seconds
+
+    return _epoch_us(parsed), offset
+
+
+def parse_iso8601_lines(
+    data, delimiter, separator, field, epoch, final, return_errors, error_class
+):
+    """
+    Parses the datetime of each line of a bytes-like object
+    and returns the results and the number of bytes consumed.
+
+    Unless final is true, the last line is left unparsed
+    if it is not terminated by the delimiter.
+    Empty lines are skipped.
+
+    :param data: The bytes-like object.
+    :param delimiter: The code of the line delimiter.
+    :param separator: The code of the field separator, or -1 to use whole lines.
+    :param field: The index of the field holding the datetime.
+    :param epoch: Whether to return the number of microseconds since the epoch.
+    :param final: Whether the data ends with the last line.
+    :param return_errors: Whether to return errors in place of results.
+    :param error_class: The class of the errors.
+
+    :rtype: tuple
+    """
+    data = memoryview(data).tobytes()
+    lines = data.split(bytes(bytearray([delimiter])))
+
+    consumed = len(data)
+    if not final:
+        consumed -= len(lines[-1])
+        lines = lines[:-1]
+
+    if separator >= 0:
+        separator = bytes(bytearray([separator]))
+    else:
+        separator = None
+
+    results = []
+    for line in lines:
+        if line.endswith(b"\r"):
+            line = line[:-1]
+
+        if not line:
+            continue
+
+        text = line
+        try:
+            if separator is not None:
+                fields = line.split(separator)
+                if field >= len(fields):
+                    raise ParserError("Missing field")
+
+                text = fields[field]
+
+            parsed = parse_iso8601(text.decode("latin-1"))
+            if not isinstance(parsed, (datetime.date, datetime.time)):
+                raise ParserError("Invalid ISO 8601 string")
+
+            if isinstance(parsed, datetime.datetime):
+                # Checking the offset
+                parsed.utcoffset()
+
+            if epoch:
+                parsed = _epoch_us(parsed)
+        except ValueError as e:
+            error = error_class("{} [{}]".format(e, text.decode("latin-1")))
+            if not return_errors:
+                raise error
+
+            parsed = error
+
+        results.append(parsed)
+
+    return results, consumed
+
+
+def _epoch_us(parsed):  # type: (datetime.date) -> int
+    if isinstance(parsed, datetime.time):
+        raise ParserError("Invalid date")
+
+    seconds = (parsed.toordinal() - _EPOCH_ORDINAL) * SECONDS_PER_DAY
+
+    if isinstance(parsed, datetime.datetime):
+        seconds += (
+            parsed.hour * SECONDS_PER_HOUR
+            + parsed.minute * SECONDS_PER_MINUTE
+            + parsed.second
+        )
+
+        offset = parsed.utcoffset()
+        if offset:
+            seconds -= offset.days * SECONDS_PER_DAY + offset.seconds
+
+        return seconds * US_PER_SECOND + parsed.microsecond
+
+    return seconds * US_PER_SECOND
+
+
 def _parse_iso8601_duration(text, **options):
     m = ISO8601_DURATION.match(text)
     if not m:
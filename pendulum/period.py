@@ -4,13 +4,114 @@ import operator
 import pendulum
 
 from datetime import datetime, date, timedelta
+from itertools import count
+from typing import List
 
 from pendulum.utils._compat import _HAS_FOLD
 from pendulum.utils._compat import decode
+from pendulum.utils._compat import int64_array
 
 from .duration import Duration
+from .constants import DAYS_PER_MONTHS
 from .constants import MONTHS_PER_YEAR
+from .constants import SECONDS_PER_DAY
+from .constants import SECONDS_PER_HOUR
+from .constants import SECONDS_PER_MINUTE
+from .constants import US_PER_SECOND
+from .helpers import is_leap
 from .helpers import precise_diff
+from .helpers import timestamp
+from .tz import POST_TRANSITION
+from .tz.timezone import Timezone
+
+
+_MIN_TIMESTAMP = timestamp(datetime.min)
+_MAX_TIMESTAMP = timestamp(datetime.max)
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+# The units stepped by Period.range() without adding a duration
+# to the start for each step: the length in microseconds
+# of the units of fixed length and the number of months and days
+# of the units of variable length.
+_EXACT_UNITS = {
+    "hours": SECONDS_PER_HOUR * US_PER_SECOND,
+    "minutes": SECONDS_PER_MINUTE * US_PER_SECOND,
+    "seconds": US_PER_SECOND,
+    "microseconds": 1,
+}
+_CALENDAR_UNITS = {
+    "years": (MONTHS_PER_YEAR, 0),
+    "months": (1, 0),
+    "weeks": (0, 7),
+    "days": (0, 1),
+}
+
+
+def _to_stdlib(dt):  # type: (date) -> date
+    """
+    Return a copy of a date or datetime as a standard one,
+    whose arithmetic does not normalize the result.
+    """
+    if isinstance(dt, datetime):
+        if _HAS_FOLD:
+            return datetime(
+                dt.year,
+                dt.month,
+                dt.day,
+                dt.hour,
+                dt.minute,
+                dt.second,
+                dt.microsecond,
+                tzinfo=dt.tzinfo,
+                fold=dt.fold,
+            )
+
+        return datetime(
+            dt.year,
+            dt.month,
+            dt.day,
+            dt.hour,
+            dt.minute,
+            dt.second,
+            dt.microsecond,
+            tzinfo=dt.tzinfo,
+        )
+
+    return date(dt.year, dt.month, dt.day)
+
+
+def _offset(dt):  # type: (datetime) -> int
+    """
+    Return the UTC offset of a datetime in seconds, 0 if it is naive.
+    """
+    offset = dt.utcoffset()
+    if offset is None:
+        return 0
+
+    return offset.days * SECONDS_PER_DAY + offset.seconds
+
+
+def _step(dt):  # type: (datetime) -> tuple
+    """
+    Return the step of Period.range() of a datetime.
+    """
+    local = timestamp(dt)
+
+    return local, local - _offset(dt), dt.fold, dt.microsecond
+
+
+def _timestamp(dt, local):  # type: (date, bool) -> int
+    """
+    Return the timestamp of a date or datetime, in seconds since the epoch.
+    """
+    if not isinstance(dt, datetime):
+        return (dt.toordinal() - _EPOCH_ORDINAL) * SECONDS_PER_DAY
+
+    sec = timestamp(dt)
+    if not local:
+        sec -= _offset(dt)
+
+    return sec
 
 
 class Period(Duration):
@@ -19,6 +120,8 @@ class Period(Duration):
     time difference.
     """
 
+    _precise_diff = None
+
     def __new__(cls, start, end, absolute=False):
         if isinstance(start, datetime) and isinstance(end, datetime):
             if (
@@ -32,76 +135,17 @@ class Period(Duration):
         if absolute and start > end:
             end, start = start, end
 
-        _start = start
-        _end = end
-        if isinstance(start, pendulum.DateTime):
-            if _HAS_FOLD:
-                _start = datetime(
-                    start.year,
-                    start.month,
-                    start.day,
-                    start.hour,
-                    start.minute,
-                    start.second,
-                    start.microsecond,
-                    tzinfo=start.tzinfo,
-                    fold=start.fold,
-                )
-            else:
-                _start = datetime(
-                    start.year,
-                    start.month,
-                    start.day,
-                    start.hour,
-                    start.minute,
-                    start.second,
-                    start.microsecond,
-                    tzinfo=start.tzinfo,
-                )
-        elif isinstance(start, pendulum.Date):
-            _start = date(start.year, start.month, start.day)
-
-        if isinstance(end, pendulum.DateTime):
-            if _HAS_FOLD:
-                _end = datetime(
-                    end.year,
-                    end.month,
-                    end.day,
-                    end.hour,
-                    end.minute,
-                    end.second,
-                    end.microsecond,
-                    tzinfo=end.tzinfo,
-                    fold=end.fold,
-                )
-            else:
-                _end = datetime(
-                    end.year,
-                    end.month,
-                    end.day,
-                    end.hour,
-                    end.minute,
-                    end.second,
-                    end.microsecond,
-                    tzinfo=end.tzinfo,
-                )
-        elif isinstance(end, pendulum.Date):
-            _end = date(end.year, end.month, end.day)
-
-        # Fixing issues with datetime.__sub__()
-        # not handling offsets if the tzinfo is the same
-        if (
-            isinstance(_start, datetime)
-            and isinstance(_end, datetime)
-            and _start.tzinfo is _end.tzinfo
-        ):
-            if _start.tzinfo is not None:
-                _start = (_start - start.utcoffset()).replace(tzinfo=None)
-
-            if isinstance(end, datetime) and _end.tzinfo is not None:
-                _end = (_end - end.utcoffset()).replace(tzinfo=None)
-
-        delta = _end - _start
+        if isinstance(start, datetime) and isinstance(end, datetime):
+            # The subtraction of datetime since the one
+            # of DateTime returns a Period
+            delta = datetime.__sub__(end, start)
+
+            # Fixing issues with datetime.__sub__()
+            # not handling offsets if the tzinfo is the same
+            if start.tzinfo is end.tzinfo and start.tzinfo is not None:
+                delta -= end.utcoffset() - start.utcoffset()
+        else:
+            delta = _to_stdlib(end) - _to_stdlib(start)
 
         return super(Period, cls).__new__(cls, seconds=delta.total_seconds())
 
@@ -114,56 +158,32 @@ class Period(Duration):
             else:
                 start = pendulum.date(start.year, start.month, start.day)
 
-            _start = start
-        else:
-            if isinstance(start, pendulum.DateTime):
-                _start = datetime(
-                    start.year,
-                    start.month,
-                    start.day,
-                    start.hour,
-                    start.minute,
-                    start.second,
-                    start.microsecond,
-                    tzinfo=start.tzinfo,
-                )
-            else:
-                _start = date(start.year, start.month, start.day)
-
         if not isinstance(end, pendulum.Date):
             if isinstance(end, datetime):
                 end = pendulum.instance(end)
             else:
                 end = pendulum.date(end.year, end.month, end.day)
 
-            _end = end
-        else:
-            if isinstance(end, pendulum.DateTime):
-                _end = datetime(
-                    end.year,
-                    end.month,
-                    end.day,
-                    end.hour,
-                    end.minute,
-                    end.second,
-                    end.microsecond,
-                    tzinfo=end.tzinfo,
-                )
-            else:
-                _end = date(end.year, end.month, end.day)
-
         self._invert = False
         if start > end:
             self._invert = True
 
             if absolute:
                 end, start = start, end
-                _end, _start = _start, _end
 
         self._absolute = absolute
         self._start = start
         self._end = end
-        self._delta = precise_diff(_start, _end)
+
+    @property
+    def _delta(self):
+        # The calendar units are only computed when first needed
+        if self._precise_diff is None:
+            self._precise_diff = precise_diff(
+                _to_stdlib(self._start), _to_stdlib(self._end)
+            )
+
+        return self._precise_diff
 
     @property
     def years(self):
@@ -274,12 +294,46 @@ class Period(Duration):
         return decode(separator.join(parts))
 
     def range(self, unit, amount=1):
-        method = "add"
-        op = operator.le
+        method, op = self._range_direction()
+
+        steps = self._steps(unit, amount, method, op)
+        if steps is None:
+            return self._range(unit, amount, method, op)
+
+        return self._range_steps(unit, steps)
+
+    def timestamps(self, unit, amount=1, local=False):
+        # type: (str, int, bool) -> List[int]
+        """
+        Return the timestamps of the instances yielded by range(),
+        in seconds since the epoch, as an array of 64-bit integers,
+        without creating the instances.
+
+        :param unit: The unit of the steps.
+        :param amount: The number of units of each step.
+        :param local: Whether to return the wall-clock timestamps
+                      instead of the UTC ones.
+        """
+        method, op = self._range_direction()
+
+        steps = self._steps(unit, amount, method, op, utc=not local)
+        if steps is None:
+            return int64_array(
+                _timestamp(dt, local) for dt in self._range(unit, amount, method, op)
+            )
+
+        if local:
+            return int64_array(step[0] for step in steps)
+
+        return int64_array(step[1] for step in steps)
+
+    def _range_direction(self):  # type: () -> tuple
         if not self._absolute and self.invert:
-            method = "subtract"
-            op = operator.ge
+            return "subtract", operator.ge
+
+        return "add", operator.le
 
+    def _range(self, unit, amount, method, op):
         start, end = self.start, self.end
 
         i = amount
@@ -290,6 +344,198 @@ class Period(Duration):
 
             i += amount
 
+    def _range_steps(self, unit, steps):
+        start = self.start
+        tz = start.tzinfo
+
+        cls = pendulum.DateTime
+        if tz is not None and unit in _EXACT_UNITS:
+            cls = start.__class__
+
+        # The first step is the start itself
+        if next(steps, None) is None:
+            return
+
+        yield start
+
+        last_days = None
+        for local, _, fold, microsecond in steps:
+            days, local = divmod(local, SECONDS_PER_DAY)
+            if days != last_days:
+                # Consecutive steps often fall on the same day
+                last_days = days
+                day = date.fromordinal(days + _EPOCH_ORDINAL)
+
+            hour, local = divmod(local, SECONDS_PER_HOUR)
+            minute, second = divmod(local, SECONDS_PER_MINUTE)
+
+            yield cls(
+                day.year,
+                day.month,
+                day.day,
+                hour,
+                minute,
+                second,
+                microsecond,
+                tzinfo=tz,
+                fold=fold,
+            )
+
+    def _steps(self, unit, amount, method, op, utc=False):
+        """
+        Returns an iterator over the steps of range() computed
+        from the start directly, or None if the steps
+        can only be computed by adding durations to the start.
+
+        Each step is a tuple of its local timestamp, its UTC timestamp,
+        which is only computed if requested for calendar units,
+        its fold attribute and its microsecond.
+        """
+        start = self.start
+        if (
+            not isinstance(start, pendulum.DateTime)
+            or not (start.tzinfo is None or isinstance(start.tzinfo, Timezone))
+            or type(amount) is not int
+        ):
+            return
+
+        step = amount if method == "add" else -amount
+
+        if unit in _EXACT_UNITS:
+            return self._exact_steps(unit, amount, method, op, step)
+
+        if unit in _CALENDAR_UNITS:
+            return self._calendar_steps(unit, amount, method, op, step, utc)
+
+    def _exact_steps(self, unit, amount, method, op, step):
+        """
+        Yields the steps of range() for units of fixed length
+        by stepping the UTC timestamp of the start, with a single cursor
+        over the transitions of the timezone.
+        """
+        start, end = self.start, self.end
+        tz = start.tzinfo
+
+        # Microseconds since the epoch of the UTC time of the start
+        utc = (timestamp(start) - _offset(start)) * US_PER_SECOND + start.microsecond
+        step *= _EXACT_UNITS[unit]
+
+        # Like datetime, instances are compared by wall-clock time
+        # when they share the same timezone, and by UTC time otherwise.
+        same_tz = end.tzinfo is tz
+        end_us = timestamp(end) * US_PER_SECOND + end.microsecond
+        if not same_tz:
+            end_us -= _offset(end) * US_PER_SECOND
+
+        if not op(start, end):
+            return
+
+        yield _step(start)
+
+        stamps = (us // US_PER_SECOND for us in count(utc + step, step))
+        if tz is None:
+            offsets = ((sec, 0, 0) for sec in stamps)
+        else:
+            offsets = tz._utc_offsets(stamps)
+
+        us = utc
+        i = 0
+        for sec, offset, fold in offsets:
+            us += step
+            i += amount
+            local = sec + offset
+
+            if not _MIN_TIMESTAMP <= local <= _MAX_TIMESTAMP:
+                # Left to the generic implementation
+                dt = getattr(start, method)(**{unit: i})
+                if not op(dt, end):
+                    return
+
+                yield _step(dt)
+
+                continue
+
+            key = us
+            if same_tz:
+                key += offset * US_PER_SECOND
+
+            if not op(key, end_us):
+                return
+
+            yield local, sec, fold, us % US_PER_SECOND
+
+    def _calendar_steps(self, unit, amount, method, op, step, utc):
+        """
+        Yields the steps of range() for units of variable length
+        by computing the date of each step directly,
+        clamping the day to the length of the month.
+        """
+        start, end = self.start, self.end
+        tz = start.tzinfo
+        month_step, day_step = _CALENDAR_UNITS[unit]
+        month_step *= step
+        day_step *= step
+
+        # The wall-clock time of the start, in seconds since the epoch,
+        # minus its date so that each step only needs its ordinal.
+        ordinal = start.toordinal()
+        base = timestamp(start) - ordinal * SECONDS_PER_DAY
+        month = start.year * MONTHS_PER_YEAR + start.month - 1
+        microsecond = start.microsecond
+
+        same_tz = end.tzinfo is tz
+        end_us = timestamp(end) * US_PER_SECOND + end.microsecond
+        if not same_tz:
+            end_us -= _offset(end) * US_PER_SECOND
+
+        if not op(start, end):
+            return
+
+        yield _step(start)
+
+        i = 0
+        for k in count(1):
+            i += amount
+            sec = None
+
+            if month_step:
+                year, m = divmod(month + k * month_step, MONTHS_PER_YEAR)
+                if 1 <= year <= 9999:
+                    day = min(DAYS_PER_MONTHS[int(is_leap(year))][m + 1], start.day)
+                    sec = base + date(year, m + 1, day).toordinal() * SECONDS_PER_DAY
+            else:
+                sec = base + (ordinal + k * day_step) * SECONDS_PER_DAY
+
+            if sec is not None:
+                fold = 0
+                if tz is not None:
+                    sec, fold = tz._normalize_timestamp(sec, POST_TRANSITION)
+
+                if not _MIN_TIMESTAMP <= sec <= _MAX_TIMESTAMP:
+                    sec = None
+
+            if sec is None:
+                # Left to the generic implementation
+                dt = getattr(start, method)(**{unit: i})
+                if not op(dt, end):
+                    return
+
+                yield _step(dt)
+
+                continue
+
+            stamp = None
+            if utc or not same_tz:
+                stamp = sec
+                if tz is not None:
+                    stamp -= tz._local_offset(sec, fold)
+
+            key = sec if same_tz else stamp
+            if not op(key * US_PER_SECOND + microsecond, end_us):
+                return
+
+            yield sec, stamp, fold, microsecond
+
     def as_interval(self):
         """
         Return the Period as an Duration.
@@ -6,9 +6,15 @@ from .local_timezone import get_local_timezone
 from .local_timezone import set_local_timezone
 from .local_timezone import test_local_timezone
 
+from .cache import CacheInfo
+from .cache import TimezoneCache as _TimezoneCache
+
 from .timezone import Timezone as _Timezone
 from .timezone import FixedTimezone as _FixedTimezone
 from .timezone import UTC
+from .data.windows import windows_timezones as _windows_timezones
+from .zoneinfo import use_bundle as _use_bundle
+from .zoneinfo.bundle import Bundle as _Bundle
 
 PRE_TRANSITION = "pre"
 POST_TRANSITION = "post"
@@ -17,39 +23,102 @@ TRANSITION_ERROR = "error"
 timezones = pytzdata.timezones
 
 
-_tz_cache = {}
+def _index_timezone_names():  # type: () -> dict
+    names = {}
+
+    # The IANA names take precedence over the Windows ones
+    for aliases in (_windows_timezones.items(), zip(timezones, timezones)):
+        for alias, name in aliases:
+            names[alias] = names[alias.lower()] = name
+
+    return names
+
+
+# The IANA name of each timezone keyed by its name,
+# its lowercase name and its Windows names, if any.
+_timezone_names = _index_timezone_names()
+
+_tz_cache = _TimezoneCache()
+
+
+def _resolve_name(name):  # type: (str) -> Union[str, None]
+    """
+    Return the IANA name of a timezone given its name, in any case,
+    or its Windows name, or None if it is unknown.
+    """
+    resolved = _timezone_names.get(name)
+    if resolved is None:
+        resolved = _timezone_names.get(name.lower())
+
+    return resolved
 
 
 def timezone(name, extended=True):  # type: (Union[str, int]) -> _Timezone
     """
     Return a Timezone instance given its name.
+
+    The name is case-insensitive and can also be a Windows timezone name.
     """
     if isinstance(name, int):
         return fixed_timezone(name)
 
-    if name.lower() == "utc":
+    resolved = _resolve_name(name) or name
+    if resolved == "UTC":
         return UTC
 
-    if name in _tz_cache:
-        return _tz_cache[name]
-
-    tz = _Timezone(name, extended=extended)
-    _tz_cache[name] = tz
-
-    return tz
+    return _tz_cache.get(resolved, extended, _Timezone)
 
 
 def fixed_timezone(offset):  # type: (int) -> _FixedTimezone
     """
     Return a Timezone instance given its offset in seconds.
     """
-    if offset in _tz_cache:
-        return _tz_cache[offset]
+    return _tz_cache.fixed(offset, _FixedTimezone)
+
+
+def cache_info():  # type: () -> CacheInfo
+    """
+    Return the statistics of the timezone cache:
+    the number of hits and misses, the total time spent loading
+    timezones, in seconds, the number of named and fixed offset
+    timezones in the cache and the maximum number of the latter.
+    """
+    return _tz_cache.info()
+
+
+def clear_cache():  # type: () -> None
+    """
+    Clear the timezone cache and its statistics.
+    """
+    _tz_cache.clear()
+
+
+def set_cache_size(max_fixed):  # type: (Union[int, None]) -> None
+    """
+    Set the maximum number of fixed offset timezones kept in the cache.
+
+    The least recently used ones are evicted first.
+    None, the default, means there is no limit.
+    """
+    _tz_cache.set_max_fixed(max_fixed)
+
+
+def load_bundle(path):  # type: (Union[str, None]) -> None
+    """
+    Load timezones from a precompiled bundle instead of the zoneinfo files.
 
-    tz = _FixedTimezone(offset)
-    _tz_cache[offset] = tz
+    The bundle is memory mapped so its pages are shared between
+    processes, like forked workers, loading it from the same file,
+    as long as the transitions are not extended past the bundled year.
+
+    Passing None reverts to reading the zoneinfo files.
+    Timezones already loaded are not affected.
+    """
+    bundle = None
+    if path is not None:
+        bundle = _Bundle(path)
 
-    return tz
+    _use_bundle(bundle)
 
 
 def local_timezone():  # type: () -> _Timezone
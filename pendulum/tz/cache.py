@@ -0,0 +1,147 @@
+import threading
+
+from collections import OrderedDict, namedtuple
+from timeit import default_timer
+from typing import Callable, Union
+
+from .timezone import Timezone, FixedTimezone
+
+
+CacheInfo = namedtuple("CacheInfo", "hits misses load_time zones fixed max_fixed")
+
+
+class TimezoneCache(object):
+    """
+    A thread-safe cache of timezone instances.
+
+    Named timezones are keyed by their name and whether
+    their transitions are extended, and are never evicted
+    since there is a bounded number of them.
+
+    Fixed offset timezones can come from arbitrary input
+    so the least recently used ones are evicted
+    once there are more than max_fixed of them, if set.
+
+    Hits of named timezones are counted without locking
+    so the counters can be slightly off under contention.
+
+    The fixed offset timezones are also read directly
+    by the C ISO 8601 parser, so its lookups are not counted
+    and do not mark the timezones as recently used.
+    """
+
+    def __init__(self, max_fixed=None):  # type: (Union[int, None]) -> None
+        self._zones = {}
+        self._fixed = OrderedDict()
+        self._max_fixed = max_fixed
+        self._lock = threading.Lock()
+
+        # The locks of the zones being loaded, so that
+        # a zone is only loaded once even if several threads
+        # request it at the same time, without blocking
+        # the loading of other zones.
+        self._loading = {}
+
+        self._hits = 0
+        self._misses = 0
+        self._load_time = 0.0
+
+    def get(
+        self, name, extended, load  # type: str  # type: bool  # type: Callable
+    ):  # type: (...) -> Timezone
+        """
+        Returns the timezone with the given name,
+        loading it with the given callable if it is not cached yet.
+        """
+        key = (name, extended)
+        tz = self._zones.get(key)
+        if tz is not None:
+            self._hits += 1
+
+            return tz
+
+        with self._lock:
+            lock = self._loading.get(key)
+            if lock is None:
+                lock = self._loading[key] = threading.Lock()
+
+        with lock:
+            tz = self._zones.get(key)
+            if tz is not None:
+                self._hits += 1
+
+                return tz
+
+            start = default_timer()
+            tz = None
+            try:
+                tz = load(name, extended=extended)
+            finally:
+                with self._lock:
+                    # The zone is stored before its loading lock is removed
+                    # so that threads requesting it in between find it.
+                    if tz is not None:
+                        self._zones[key] = tz
+
+                    self._misses += 1
+                    self._load_time += default_timer() - start
+                    del self._loading[key]
+
+        return tz
+
+    def fixed(
+        self, offset, load  # type: int  # type: Callable
+    ):  # type: (...) -> FixedTimezone
+        """
+        Returns the fixed timezone with the given offset,
+        creating it with the given callable if it is not cached yet.
+        """
+        with self._lock:
+            tz = self._fixed.pop(offset, None)
+            if tz is not None:
+                self._hits += 1
+            else:
+                self._misses += 1
+                tz = load(offset)
+
+            # Reinserted to mark it as the most recently used
+            self._fixed[offset] = tz
+
+            if self._max_fixed is not None:
+                while len(self._fixed) > self._max_fixed:
+                    self._fixed.popitem(last=False)
+
+        return tz
+
+    @property
+    def fixed_timezones(self):  # type: () -> dict
+        """
+        The fixed offset timezones, keyed by offset, which must only be read.
+        """
+        return self._fixed
+
+    def set_max_fixed(self, max_fixed):  # type: (Union[int, None]) -> None
+        with self._lock:
+            self._max_fixed = max_fixed
+
+            if max_fixed is not None:
+                while len(self._fixed) > max_fixed:
+                    self._fixed.popitem(last=False)
+
+    def info(self):  # type: () -> CacheInfo
+        return CacheInfo(
+            self._hits,
+            self._misses,
+            self._load_time,
+            len(self._zones),
+            len(self._fixed),
+            self._max_fixed,
+        )
+
+    def clear(self):  # type: () -> None
+        with self._lock:
+            self._zones.clear()
+            self._fixed.clear()
+            self._hits = 0
+            self._misses = 0
+            self._load_time = 0.0
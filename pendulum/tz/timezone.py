@@ -1,20 +1,53 @@
+import threading
+
 import pendulum
 
+from bisect import bisect_right
+from math import modf
 from datetime import datetime, timedelta, tzinfo
-from typing import Optional, Union
+from typing import Iterable, Iterator, List, Optional, Union
 
+from pendulum.constants import SECS_PER_YEAR
 from pendulum.helpers import local_time, timestamp
 from pendulum.utils._compat import _HAS_FOLD
+from pendulum.utils._compat import int64_array
 
 from .exceptions import NonExistingTime, AmbiguousTime
 from .zoneinfo import read, read_file
+from .zoneinfo.timezone import Timezone as _Zoneinfo
 from .zoneinfo.transition import Transition
+from .zoneinfo.transition_type import TransitionType
 
 
 POST_TRANSITION = "post"
 PRE_TRANSITION = "pre"
 TRANSITION_ERROR = "error"
 
+_MIN_STAMP = float("-inf")
+_MAX_STAMP = float("inf")
+
+
+_NO_HINT = (0, 0, 0)
+
+# The size of the buckets of the transition indexes.
+# Since there are at most a few transitions per year,
+# a bucket only ever spans a few transitions.
+_BUCKET_SIZE = SECS_PER_YEAR[0]
+
+
+class _LookupHints(threading.local):
+    """
+    The bounds of the last two transition periods looked up,
+    as (start, end, index) tuples, for UTC and local timestamps.
+
+    They are kept per thread so that threads looking up
+    distant timestamps in the same timezone do not thrash them.
+    """
+
+    def __init__(self):
+        self.utc = [_NO_HINT, _NO_HINT]
+        self.local = [_NO_HINT, _NO_HINT]
+
 
 class Timezone(tzinfo):
     """
@@ -27,11 +60,34 @@ class Timezone(tzinfo):
     """
 
     def __init__(self, name, extended=True):  # type: (str) -> None
-        tz = read(name, extend=extended)
+        tz = read(name, extend=False)
 
         self._name = name
-        self._transitions = tz.transitions
-        self._hint = {True: None, False: None}
+        self._load(tz, extended=extended)
+
+    def _load(self, tz, extended=True):  # type: (_Zoneinfo, bool) -> None
+        # The transitions are kept in compact columns,
+        # see pendulum.tz.zoneinfo.timezone.Timezone.
+        self._zone = tz
+        self._types = tz.types
+        self._initial_type = tz.initial_type
+        self._at = tz.at
+        self._local = tz.local
+        self._to = tz.to
+        self._type_indexes = tz.type_indexes
+        self._hints = _LookupHints()
+
+        # The transition periods overlapping each bucket of timestamps,
+        # for UTC and local timestamps, so that lookups only need
+        # to look at a few periods instead of bisecting the transitions.
+        # They are filled lazily, as buckets are looked up.
+        self._buckets = {True: {}, False: {}}
+
+        # Transitions past the last one of the zoneinfo file
+        # are computed lazily from the POSIX rule.
+        # _extendable is reset once the rule cannot add any.
+        self._extended = extended
+        self._extendable = extended
 
     @property
     def name(self):  # type: () -> str
@@ -81,13 +137,13 @@ class Timezone(tzinfo):
             dst_rule=POST_TRANSITION,
         )
 
+    @property
+    def transitions(self):  # type: () -> List[Transition]
+        return self._zone.transitions
+
     def _normalize(
         self, dt, dst_rule=None  # type: datetime  # type: Union[str, None]
     ):  # type: (...) -> datetime
-        sec = timestamp(dt)
-        fold = 0
-        transition = self._lookup_transition(sec)
-
         if not _HAS_FOLD and dst_rule is None:
             dst_rule = POST_TRANSITION
 
@@ -96,8 +152,29 @@ class Timezone(tzinfo):
             if dt.fold == 1:
                 dst_rule = POST_TRANSITION
 
-        if sec < transition.local:
-            if transition.is_ambiguous(sec):
+        sec, fold = self._normalize_timestamp(timestamp(dt), dst_rule, dt)
+
+        kwargs = {"tzinfo": self}
+        if _HAS_FOLD or isinstance(dt, pendulum.DateTime):
+            kwargs["fold"] = fold
+
+        return dt.__class__(*local_time(sec, 0, dt.microsecond), **kwargs)
+
+    def _normalize_timestamp(
+        self, sec, dst_rule, dt=None  # type: int  # type: str  # type: datetime
+    ):  # type: (...) -> tuple
+        """
+        Normalizes a local timestamp, given as seconds
+        since the epoch of the wall-clock time, for the current timezone.
+
+        Returns the normalized local timestamp and its fold attribute.
+        The datetime, if any, is only used in error messages.
+        """
+        fold = 0
+        idx = self._lookup_transition(sec)
+
+        if sec < self._local[idx]:
+            if self._to[idx] <= sec:
                 # Ambiguous time
                 if dst_rule == TRANSITION_ERROR:
                     raise AmbiguousTime(dt)
@@ -105,10 +182,12 @@ class Timezone(tzinfo):
                 # We set the fold attribute for later
                 if dst_rule == POST_TRANSITION:
                     fold = 1
-            else:
-                transition = transition.previous
+            elif idx:
+                idx -= 1
 
-        if transition.is_ambiguous(sec):
+        local = self._local[idx]
+        to = self._to[idx]
+        if to <= sec < local:
             # Ambiguous time
             if dst_rule == TRANSITION_ERROR:
                 raise AmbiguousTime(dt)
@@ -116,23 +195,19 @@ class Timezone(tzinfo):
             # We set the fold attribute for later
             if dst_rule == POST_TRANSITION:
                 fold = 1
-        elif transition.is_missing(sec):
+        elif local <= sec < to:
             # Skipped time
             if dst_rule == TRANSITION_ERROR:
                 raise NonExistingTime(dt)
 
             # We adjust accordingly
             if dst_rule == POST_TRANSITION:
-                sec += transition.fix
+                sec += to - local
                 fold = 1
             else:
-                sec -= transition.fix
-
-        kwargs = {"tzinfo": self}
-        if _HAS_FOLD or isinstance(dt, pendulum.DateTime):
-            kwargs["fold"] = fold
+                sec -= to - local
 
-        return dt.__class__(*local_time(sec, 0, dt.microsecond), **kwargs)
+        return sec, fold
 
     def _convert(self, dt):  # type: (datetime) -> datetime
         if dt.tzinfo is self:
@@ -146,27 +221,22 @@ class Timezone(tzinfo):
         if isinstance(dt.tzinfo, FixedTimezone):
             offset = dt.tzinfo.offset
         else:
-            transition = dt.tzinfo._lookup_transition(stamp)
-            offset = transition.ttype.offset
+            tz = dt.tzinfo
+            idx = tz._lookup_transition(stamp)
+            offset = tz._ttype(idx).offset
 
-            if stamp < transition.local:
+            if stamp < tz._local[idx]:
+                idx -= 1
                 if (
-                    transition.previous.is_ambiguous(stamp)
+                    idx >= 0
+                    and tz._to[idx] <= stamp < tz._local[idx]
                     and getattr(dt, "fold", 1) == 0
                 ):
                     pass
                 else:
-                    offset = transition.previous.ttype.offset
-
-        stamp -= offset
+                    offset = tz._ttype(idx).offset
 
-        transition = self._lookup_transition(stamp, is_utc=True)
-        if stamp < transition.at:
-            transition = transition.previous
-
-        offset = transition.ttype.offset
-        stamp += offset
-        fold = int(not transition.ttype.is_dst())
+        stamp, fold = self._from_utc_timestamp(stamp - offset)
 
         kwargs = {"tzinfo": self}
 
@@ -175,41 +245,135 @@ class Timezone(tzinfo):
 
         return dt.__class__(*local_time(stamp, 0, dt.microsecond), **kwargs)
 
+    def _from_utc_timestamp(self, stamp):  # type: (int) -> tuple
+        """
+        Returns the local timestamp of a UTC timestamp
+        in the current timezone and its fold attribute.
+        """
+        ttype = self._ttype(self._utc_transition(stamp))
+
+        return stamp + ttype.offset, int(not ttype.is_dst())
+
+    def _utc_transition(self, stamp):  # type: (int) -> int
+        """
+        Returns the index of the transition in effect
+        at a UTC timestamp, or -1 before the first transition.
+        """
+        idx = self._lookup_transition(stamp, is_utc=True)
+        if stamp < self._at[idx]:
+            idx -= 1
+
+        return idx
+
+    def _ttype(self, idx):  # type: (int) -> TransitionType
+        """
+        Returns the type of the transition at the given index,
+        or the type in effect before the first transition for -1.
+        """
+        if idx < 0:
+            return self._initial_type
+
+        return self._types[self._type_indexes[idx]]
+
     def _lookup_transition(
         self, stamp, is_utc=False  # type: int  # type: bool
-    ):  # type: (...) -> Transition
-        lo, hi = 0, len(self._transitions)
-        hint = self._hint[is_utc]
-        if hint:
-            if stamp == hint[0]:
-                return self._transitions[hint[1]]
-            elif stamp < hint[0]:
-                hi = hint[1]
-            else:
-                lo = hint[1]
-
-        if not is_utc:
-            while lo < hi:
-                mid = (lo + hi) // 2
-                if stamp < self._transitions[mid].to:
-                    hi = mid
-                else:
-                    lo = mid + 1
+    ):  # type: (...) -> int
+        """
+        Returns the index of the first transition
+        occurring after the given timestamp, or of the last one.
+        """
+        if is_utc:
+            column = self._at
+            hints = self._hints.utc
         else:
-            while lo < hi:
-                mid = (lo + hi) // 2
-                if stamp < self._transitions[mid].at:
-                    hi = mid
-                else:
-                    lo = mid + 1
+            column = self._to
+            hints = self._hints.local
+
+        last = hints[0]
+        if last[0] <= stamp < last[1]:
+            return last[2]
+
+        previous = hints[1]
+        if previous[0] <= stamp < previous[1]:
+            return previous[2]
+
+        if self._extendable and stamp >= column[-1]:
+            self._extend(stamp, is_utc=is_utc)
+
+        bucket = stamp // _BUCKET_SIZE
+        periods = self._buckets[is_utc].get(bucket)
+        if periods is None:
+            periods = self._bucket_periods(bucket, is_utc)
+
+        for period in periods:
+            if period[0] <= stamp < period[1]:
+                break
+
+        if period[1] is _MAX_STAMP and self._extendable:
+            # Beyond last transition, which might still be extended
+            return period[2]
+
+        hints[0] = period
+        hints[1] = last
 
-        if lo >= len(self._transitions):
+        return period[2]
+
+    def _bucket_periods(self, bucket, is_utc):  # type: (int, bool) -> tuple
+        """
+        Returns the transition periods overlapping the given bucket,
+        as (start, end, index) tuples, and caches them if they
+        cannot change anymore.
+        """
+        column = self._at if is_utc else self._to
+        start = bucket * _BUCKET_SIZE
+        end = start + _BUCKET_SIZE
+
+        periods = []
+        n = len(column)
+        idx = bisect_right(column, start)
+        while idx < n:
+            periods.append((column[idx - 1] if idx else _MIN_STAMP, column[idx], idx))
+            if column[idx] >= end:
+                break
+
+            idx += 1
+        else:
             # Beyond last transition
-            lo = len(self._transitions) - 1
+            periods.append((column[-1], _MAX_STAMP, n - 1))
 
-        self._hint[is_utc] = (stamp, lo)
+        periods = tuple(periods)
+        if end <= column[-1] or not self._extendable:
+            self._buckets[is_utc][bucket] = periods
 
-        return self._transitions[lo]
+        return periods
+
+    def _extend(self, stamp, is_utc=False):  # type: (int, bool) -> None
+        """
+        Makes sure the transitions cover the given timestamp
+        by extending them, if necessary, using the POSIX rule.
+        """
+        if is_utc:
+            if stamp < self._at[-1]:
+                return
+        elif stamp < self._to[-1]:
+            return
+
+        year = local_time(stamp, 0, 0)[0]
+        extendable = self._zone.extend(year + 1)
+
+        # The zone columns are copied when first extended
+        # if they were viewing a bundle mapping.
+        # _at and _to, which are bisected, are replaced last
+        # so that the indexes found in them are valid in the others.
+        zone = self._zone
+        self._type_indexes = zone.type_indexes
+        self._local = zone.local
+        self._to = zone.to
+        self._at = zone.at
+
+        if not extendable:
+            # No more transitions can be added
+            self._extendable = False
 
     def utcoffset(
         self, dt  # type: Optional[datetime]
@@ -217,9 +381,7 @@ class Timezone(tzinfo):
         if dt is None:
             return
 
-        transition = self._get_transition(dt)
-
-        return transition.utcoffset()
+        return self._ttype(self._get_transition(dt)).utcoffset()
 
     def dst(
         self, dt  # type: Optional[datetime]
@@ -227,61 +389,154 @@ class Timezone(tzinfo):
         if dt is None:
             return
 
-        transition = self._get_transition(dt)
+        idx = self._get_transition(dt)
 
-        if not transition.ttype.is_dst():
+        # The local time before the first transition, usually LMT,
+        # is not a standard time to compare the first type to.
+        if idx < 1 or not self._ttype(idx).is_dst():
             return timedelta()
 
-        return timedelta(seconds=transition.fix)
+        return timedelta(seconds=self._to[idx] - self._local[idx])
 
     def tzname(self, dt):  # type: Optional[datetime]  # type: (...) -> Union[str, None]
         if dt is None:
             return
 
-        transition = self._get_transition(dt)
+        return self._ttype(self._get_transition(dt)).abbreviation
 
-        return transition.ttype.abbreviation
-
-    def _get_transition(self, dt):  # type: (datetime) -> Transition
+    def _get_transition(self, dt):  # type: (datetime) -> int
         if dt.tzinfo is not None and dt.tzinfo is not self:
             dt = dt - dt.utcoffset()
 
-            stamp = timestamp(dt)
-
-            transition = self._lookup_transition(stamp, is_utc=True)
+            idx = self._utc_transition(timestamp(dt))
         else:
-            stamp = timestamp(dt)
+            idx = self._local_transition(timestamp(dt), getattr(dt, "fold", 1))
 
-            transition = self._lookup_transition(stamp)
+        return idx
 
-            if stamp < transition.local:
-                fold = getattr(dt, "fold", 1)
-                if transition.is_ambiguous(stamp):
-                    if fold == 0:
-                        transition = transition.previous
-                elif transition.previous.is_ambiguous(stamp) and fold == 0:
-                    pass
-                else:
-                    transition = transition.previous
+    def _local_transition(self, stamp, fold):  # type: (int, int) -> int
+        """
+        Returns the index of the transition in effect
+        at a local timestamp with the given fold attribute,
+        or -1 before the first transition.
+        """
+        idx = self._lookup_transition(stamp)
+
+        if stamp < self._local[idx]:
+            if self._to[idx] <= stamp:
+                # Ambiguous time
+                if fold == 0:
+                    idx -= 1
+            elif (
+                idx and self._to[idx - 1] <= stamp < self._local[idx - 1] and fold == 0
+            ):
+                pass
+            else:
+                idx -= 1
 
-        return transition
+        return idx
+
+    def _local_offset(self, stamp, fold):  # type: (int, int) -> int
+        """
+        Returns the UTC offset, in seconds, of a local timestamp
+        with the given fold attribute.
+        """
+        return self._ttype(self._local_transition(stamp, fold)).offset
 
     def fromutc(self, dt):  # type: (datetime) -> datetime
         stamp = timestamp(dt)
 
-        transition = self._lookup_transition(stamp, is_utc=True)
-        if stamp < transition.at:
-            transition = transition.previous
-
-        stamp += transition.ttype.offset
+        stamp += self._ttype(self._utc_transition(stamp)).offset
 
         return dt.__class__(*local_time(stamp, 0, dt.microsecond), tzinfo=self)
 
+    def offsets_for(self, timestamps):
+        # type: (Iterable[Union[int, float]]) -> List[int]
+        """
+        Returns the UTC offsets, in seconds, of the given UTC timestamps.
+
+        >>> from pendulum import timezone
+        >>> paris = timezone('Europe/Paris')
+        >>> list(paris.offsets_for([1356998400, 1372636800]))
+        [3600, 7200]
+        """
+        return int64_array(offset for _, offset, _ in self._utc_offsets(timestamps))
+
+    def convert_many(self, timestamps):
+        # type: (Iterable[Union[int, float]]) -> Iterator[tuple]
+        """
+        Converts UTC timestamps to local times in the current timezone.
+
+        It yields, for each timestamp, a tuple of the local
+        year, month, day, hour, minute, second and microsecond,
+        followed by the UTC offset, in seconds, and the fold attribute
+        that convert() would set.
+
+        Any iterable of timestamps, like a list, an array
+        or a memoryview, is accepted. Sorted timestamps
+        are converted faster.
+
+        >>> from pendulum import timezone
+        >>> paris = timezone('Europe/Paris')
+        >>> list(paris.convert_many([1372636800]))
+        [(2013, 7, 1, 2, 0, 0, 0, 7200, 0)]
+        """
+        for stamp, offset, fold in self._utc_offsets(timestamps):
+            microsecond = 0
+            if isinstance(stamp, float):
+                # Same rounding as datetime.utcfromtimestamp()
+                frac, stamp = modf(stamp)
+                stamp, microsecond = divmod(
+                    int(stamp) * 1000000 + int(round(frac * 1000000)), 1000000
+                )
+
+            yield local_time(stamp + offset, 0, microsecond) + (offset, fold)
+
+    def _utc_offsets(self, timestamps):
+        # type: (Iterable[Union[int, float]]) -> Iterator[tuple]
+        """
+        Yields each of the given UTC timestamps
+        along with its UTC offset and fold attribute.
+
+        The bounds of the last matching transition are kept
+        so that consecutive timestamps between the same transitions
+        do not need a lookup.
+        """
+        start = end = 0
+        offset = fold = 0
+
+        for stamp in timestamps:
+            if not start <= stamp < end:
+                idx = self._utc_transition(stamp)
+                # Read after the lookup, which can extend the transitions
+                at = self._at
+
+                ttype = self._ttype(idx)
+                offset = ttype.offset
+                fold = int(not ttype.is_dst())
+
+                if idx < 0:
+                    start = float("-inf")
+                else:
+                    start = at[idx]
+
+                if idx + 1 < len(at):
+                    end = at[idx + 1]
+                elif self._extendable:
+                    # The next lookup might extend the transitions
+                    end = at[idx]
+                else:
+                    end = float("inf")
+
+            yield stamp, offset, fold
+
     def __repr__(self):  # type: () -> str
         return "Timezone('{}')".format(self._name)
 
-    def __getinitargs__(self):  # type: () -> tuple
-        return (self._name,)
+    def __reduce__(self):
+        # Unpickled through the timezone cache
+        # instead of loading the timezone again
+        return pendulum.timezone, (self._name, self._extended)
 
 
 class FixedTimezone(Timezone):
@@ -329,12 +584,22 @@ class FixedTimezone(Timezone):
 
         return dt
 
+    def _normalize_timestamp(self, sec, dst_rule, dt=None):
+        # type: (int, str, datetime) -> tuple
+        return sec, 0
+
     def _convert(self, dt):  # type: (datetime) -> datetime
         if dt.tzinfo is not self:
             return dt.astimezone(self)
 
         return dt
 
+    def _from_utc_timestamp(self, stamp):  # type: (int) -> tuple
+        return stamp + self._offset, 0
+
+    def _local_offset(self, stamp, fold):  # type: (int, int) -> int
+        return self._offset
+
     def utcoffset(self, dt):  # type: Optional[datetime]  # type: (...) -> timedelta
         return self._utcoffset
 
@@ -344,20 +609,37 @@ class FixedTimezone(Timezone):
     def fromutc(self, dt):  # type: (datetime) -> datetime
         return (dt + self._utcoffset).replace(tzinfo=self)
 
+    def _utc_offsets(self, timestamps):
+        # type: (Iterable[Union[int, float]]) -> Iterator[tuple]
+        for stamp in timestamps:
+            yield stamp, self._offset, 0
+
     def tzname(self, dt):  # type: Optional[datetime]  # type: (...) -> Union[str, None]
         return self._name
 
     def __getinitargs__(self):  # type: () -> tuple
         return self._offset, self._name
 
+    def __reduce__(self):
+        if self is UTC:
+            return pendulum.timezone, ("UTC",)
+
+        if self._name == FixedTimezone(self._offset).name:
+            return pendulum.tz.fixed_timezone, (self._offset,)
+
+        return self.__class__, (self._offset, self._name)
+
 
 class TimezoneFile(Timezone):
     def __init__(self, path):
-        tz = read_file(path)
+        tz = read_file(path, extend=False)
 
         self._name = ""
-        self._transitions = tz.transitions
-        self._hint = {True: None, False: None}
+        self._path = path
+        self._load(tz)
+
+    def __reduce__(self):
+        return self.__class__, (self._path,)
 
 
 UTC = FixedTimezone(0, "UTC")
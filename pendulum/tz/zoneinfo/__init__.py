@@ -2,10 +2,18 @@ from .reader import Reader
 from .timezone import Timezone
 
 
+# The bundle zones are read from, if any.
+# See pendulum.tz.zoneinfo.bundle.
+_bundle = None
+
+
 def read(name, extend=True):  # type: (str) -> Timezone
     """
     Read the zoneinfo structure for a given timezone name.
     """
+    if _bundle is not None and name in _bundle:
+        return _bundle.read_for(name, extend=extend)
+
     return Reader(extend=extend).read_for(name)
 
 
@@ -14,3 +22,13 @@ def read_file(path, extend=True):  # type: (str) -> Timezone
     Read the zoneinfo structure for a given path.
     """
     return Reader(extend=extend).read(path)
+
+
+def use_bundle(bundle):  # type: (...) -> None
+    """
+    Read the zoneinfo structures from the given bundle,
+    or from the zoneinfo files again if it is None.
+    """
+    global _bundle
+
+    _bundle = bundle
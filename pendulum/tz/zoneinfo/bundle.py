@@ -0,0 +1,268 @@
+"""
+Precompiled bundles of zoneinfo structures.
+
+A bundle stores the already decoded, and extended, transitions
+of many timezones in a single binary file which is memory mapped
+when loaded so zones can be materialized without any parsing.
+
+The file is made of a header, an index of the zone names
+and one record per zone. All integers are little-endian.
+
+    header:  magic, version, number of zones, size of the names
+    index:   the zone names, separated by newlines,
+             followed by the offset of each zone record
+    record:  number of transitions, of types, size of the abbreviations,
+             size of the POSIX rule, extension state (year, max year,
+             types), followed by the types, the abbreviations,
+             the POSIX rule and the at, local, to (int64)
+             and type indexes (uint8) columns.
+
+The columns of the zones read from a bundle are views of the mapping
+until their transitions have to be extended past the bundled year.
+"""
+import mmap
+import sys
+
+import pytzdata
+
+from array import array
+from struct import Struct, pack, unpack_from
+from typing import Iterable, List, Union
+
+from pendulum.utils._compat import PY2
+from pendulum.utils._compat import _HAS_INT64_ARRAY
+
+from .exceptions import InvalidTimezone, InvalidZoneinfoFile
+from .reader import Reader
+from .timezone import Timezone
+from .transition_type import TransitionType
+
+
+MAGIC = b"PDZB"
+VERSION = 1
+
+# The year up to which transitions are extended when compiling a bundle.
+# Zones are still extended lazily past this year when needed.
+DEFAULT_YEAR = 2100
+
+_header = Struct("<4sIII")
+_record = Struct("<IHHHiiBB")
+
+_BIG_ENDIAN = sys.byteorder == "big"
+
+
+def compile_bundle(
+    path, names=None, year=DEFAULT_YEAR  # type: str  # type: Iterable[str]  # type: int
+):  # type: (...) -> None
+    """
+    Compiles the given timezones, all those of the timezone database
+    by default, into a bundle at the given path.
+
+    :param path: The path of the bundle file.
+    :param names: The names of the timezones to compile.
+    :param year: The year up to which the transitions are extended.
+    """
+    if names is None:
+        names = pytzdata.timezones
+
+    names = sorted(set(names))
+    reader = Reader(extend=False)
+    records = []
+    for name in names:
+        tz = reader.read_for(name)
+        tz.extend(year)
+
+        records.append(_dump(tz))
+
+    index = "\n".join(names).encode("utf-8")
+    offset = _header.size + len(index) + 4 * len(records)
+    offsets = []
+    for record in records:
+        offsets.append(offset)
+        offset += len(record)
+
+    with open(path, "wb") as f:
+        f.write(_header.pack(MAGIC, VERSION, len(names), len(index)))
+        f.write(index)
+        f.write(pack("<{}I".format(len(offsets)), *offsets))
+        for record in records:
+            f.write(record)
+
+
+def _dump(tz):  # type: (Timezone) -> bytes
+    types = tz.types
+    abbrs = b""
+    abbr_indexes = {}
+    for t in types:
+        if t.abbreviation not in abbr_indexes:
+            abbr_indexes[t.abbreviation] = len(abbrs)
+            abbrs += t.abbreviation.encode("utf-8") + b"\0"
+
+    spec = b""
+    if tz.posix_rule and tz.posix_rule.spec:
+        spec = tz.posix_rule.spec.encode("utf-8")
+
+    extension = tz._extension
+    if extension:
+        state = (extension.year, extension.max_year, extension.type0, extension.type1)
+    else:
+        state = (0, 0, 0, 0)
+
+    n = len(tz.at)
+    parts = [
+        _record.pack(n, len(types), len(abbrs), len(spec), *state),
+        pack(
+            "<" + "iBB" * len(types),
+            *[
+                v
+                for t in types
+                for v in (t.offset, t.is_dst(), abbr_indexes[t.abbreviation])
+            ]
+        ),
+        abbrs,
+        spec,
+    ]
+    for column in (tz.at, tz.local, tz.to):
+        parts.append(pack("<{}q".format(n), *column))
+
+    parts.append(pack("{}B".format(n), *tz.type_indexes))
+
+    return b"".join(parts)
+
+
+class Bundle(object):
+    """
+    A memory mapped bundle of zoneinfo structures.
+
+    >>> from pendulum.tz.zoneinfo.bundle import Bundle
+    >>> bundle = Bundle('/path/to/zones.bundle')
+    >>> tz = bundle.read_for('Europe/Paris')
+    """
+
+    def __init__(self, path):  # type: (str) -> None
+        self._path = path
+
+        with open(path, "rb") as f:
+            self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            magic, version, count, size = _header.unpack_from(self._data, 0)
+            if magic != MAGIC or version != VERSION:
+                raise InvalidZoneinfoFile(
+                    'The file "{}" is not a valid timezone bundle.'.format(path)
+                )
+
+            start = _header.size
+            names = self._data[start : start + size].decode("utf-8").split("\n")
+            offsets = unpack_from("<{}I".format(count), self._data, start + size)
+        except Exception:
+            self._data.close()
+            raise
+
+        self._index = dict(zip(names, offsets))
+
+    @property
+    def path(self):  # type: () -> str
+        return self._path
+
+    @property
+    def names(self):  # type: () -> List[str]
+        return sorted(self._index)
+
+    def __contains__(self, name):  # type: (str) -> bool
+        return name in self._index
+
+    def __len__(self):  # type: () -> int
+        return len(self._index)
+
+    def read_for(self, name, extend=True):  # type: (str, bool) -> Timezone
+        """
+        Materializes the zoneinfo structure for a given timezone name.
+
+        :param name: The timezone name.
+        :param extend: Whether to extend the transitions
+                       using the POSIX rule right away.
+        """
+        try:
+            offset = self._index[name]
+        except KeyError:
+            raise InvalidTimezone(name)
+
+        data = self._data
+        n, n_types, abbr_size, spec_size, year, max_year, type0, type1 = (
+            _record.unpack_from(data, offset)
+        )
+        offset += _record.size
+
+        values = unpack_from("<" + "iBB" * n_types, data, offset)
+        offset += 6 * n_types
+
+        abbrs = data[offset : offset + abbr_size]
+        offset += abbr_size
+
+        types = []
+        for i in range(0, len(values), 3):
+            idx = values[i + 2]
+            abbr = abbrs[idx : abbrs.find(b"\0", idx)].decode("utf-8")
+            types.append(TransitionType(values[i], values[i + 1] == 1, abbr))
+
+        spec = data[offset : offset + spec_size].decode("utf-8") or None
+        offset += spec_size
+
+        columns = []
+        for _ in range(3):
+            columns.append(_int64_column(data, offset, n))
+            offset += 8 * n
+
+        if PY2:
+            type_indexes = array("B")
+            type_indexes.fromstring(data[offset : offset + n])
+        else:
+            type_indexes = memoryview(data)[offset : offset + n]
+
+        resume = False
+        if year:
+            resume = (year, max_year, type0, type1)
+
+        tz = Timezone._from_columns(
+            types, columns[0], columns[1], columns[2], type_indexes, spec, resume
+        )
+
+        if extend:
+            tz._extends()
+
+        return tz
+
+    def close(self):  # type: () -> None
+        try:
+            self._data.close()
+        except BufferError:
+            # Zones read from the bundle still use the mapping,
+            # which is released along with them.
+            pass
+
+    def __enter__(self):  # type: () -> Bundle
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def __repr__(self):  # type: () -> str
+        return "Bundle('{}')".format(self._path)
+
+
+def _int64_column(
+    data, offset, n
+):  # type: (mmap.mmap, int, int) -> Union[array, list, memoryview]
+    if not _HAS_INT64_ARRAY:
+        return list(unpack_from("<{}q".format(n), data, offset))
+
+    if not _BIG_ENDIAN:
+        # Backed by the mapping, so that its pages are shared
+        return memoryview(data)[offset : offset + 8 * n].cast("q")
+
+    column = array("q")
+    column.frombytes(data[offset : offset + 8 * n])
+    column.byteswap()
+
+    return column
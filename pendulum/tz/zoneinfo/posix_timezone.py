@@ -64,7 +64,9 @@ def _posix_spec(spec):  # type: (str) -> PosixTimezone
         dst_start = _parse_rule(m.group("dst_start"))
         dst_end = _parse_rule(m.group("dst_end"))
 
-    return PosixTimezone(std_abbr, std_offset, dst_abbr, dst_offset, dst_start, dst_end)
+    return PosixTimezone(
+        std_abbr, std_offset, dst_abbr, dst_offset, dst_start, dst_end, spec=spec
+    )
 
 
 def _parse_abbr(text):  # type: (str) -> Union[str, None]
@@ -235,6 +237,7 @@ class PosixTimezone:
         dst_offset,  # type: Union[str, None] = None
         dst_start=None,  # type: Union[PosixTransition, None]
         dst_end=None,  # type: Union[PosixTransition, None]
+        spec=None,  # type: Union[str, None]
     ):
         self._std_abbr = std_abbr
         self._std_offset = std_offset
@@ -242,6 +245,7 @@ class PosixTimezone:
         self._dst_offset = dst_offset
         self._dst_start = dst_start
         self._dst_end = dst_end
+        self._spec = spec
 
     @property
     def std_abbr(self):  # type: () -> str
@@ -266,3 +270,10 @@ class PosixTimezone:
     @property
     def dst_end(self):  # type: () -> Union[PosixTransition, None]
         return self._dst_end
+
+    @property
+    def spec(self):  # type: () -> Union[str, None]
+        """
+        The POSIX string this rule was parsed from, if any.
+        """
+        return self._spec
@@ -11,7 +11,6 @@ from pendulum.utils._compat import PY2
 
 from .exceptions import InvalidZoneinfoFile, InvalidTimezone
 from .timezone import Timezone
-from .transition import Transition
 from .posix_timezone import posix_spec, PosixTimezone
 from .transition_type import TransitionType
 
@@ -55,7 +54,17 @@ class Reader:
             raise InvalidZoneinfoFile("The tzinfo file does not exist")
 
         with open(file_path, "rb") as fd:
-            return self._parse(fd)
+            return self._parse(_Buffer(fd.read(), file_path))
+
+    def read_buffer(self, buffer, name="<buffer>"):  # type: (bytes, str) -> Timezone
+        """
+        Read a zoneinfo structure from an in-memory buffer,
+        like bytes or a mmap object.
+
+        :param buffer: The content of a zoneinfo file.
+        :param name: The name used in error messages.
+        """
+        return self._parse(_Buffer(buffer, name))
 
     def _check_read(self, fd, nbytes):  # type: (...) -> bytes
         """
@@ -64,10 +73,10 @@ class Reader:
         """
         result = fd.read(nbytes)
 
-        if not result or len(result) != nbytes:
+        if len(result) != nbytes:
             raise InvalidZoneinfoFile(
                 "Expected {} bytes reading {}, "
-                "but got {}".format(nbytes, fd.name, len(result) if result else 0)
+                "but got {}".format(nbytes, fd.name, len(result))
             )
 
         if PY2:
@@ -75,7 +84,7 @@ class Reader:
 
         return result
 
-    def _parse(self, fd):  # type: (...) -> Timezone
+    def _parse(self, fd):  # type: (_Buffer) -> Timezone
         """
         Parse a zoneinfo file.
         """
@@ -84,14 +93,13 @@ class Reader:
         if hdr.version in (2, 3):
             # We're skipping the entire v1 file since
             # at least the same data will be found in TZFile 2.
-            fd.seek(
+            fd.skip(
                 hdr.transitions * 5
                 + hdr.types * 6
                 + hdr.abbr_size
                 + hdr.leaps * 4
                 + hdr.stdwalls
-                + hdr.utclocals,
-                1,
+                + hdr.utclocals
             )
 
             # Parse the second header
@@ -108,7 +116,7 @@ class Reader:
             types = self._parse_types(fd, hdr.types)
             abbrs = self._parse_abbrs(fd, hdr.abbr_size, types)
 
-            fd.seek(hdr.leaps * 8 + hdr.stdwalls + hdr.utclocals, 1)
+            fd.skip(hdr.leaps * 8 + hdr.stdwalls + hdr.utclocals)
 
             trule = self._parse_posix_tz(fd)
         else:
@@ -123,20 +131,13 @@ class Reader:
             TransitionType(off, is_dst, abbrs[abbr]) for off, is_dst, abbr in types
         ]
 
-        transitions = []
-        previous = None
-        for trans, idx in zip(trans, type_idx):
-            transition = Transition(trans, types[idx], previous)
-            transitions.append(transition)
-
-            previous = transition
+        if not trans:
+            trans = [0]
+            type_idx = [0]
 
-        if not transitions:
-            transitions.append(Transition(0, types[0], None))
+        return Timezone(types, trans, type_idx, posix_rule=trule, extended=self._extend)
 
-        return Timezone(transitions, posix_rule=trule, extended=self._extend)
-
-    def _parse_header(self, fd):  # type: (...) -> header
+    def _parse_header(self, fd):  # type: (_Buffer) -> header
         buff = self._check_read(fd, 44)
 
         if buff[:4] != b"TZif":
@@ -155,40 +156,31 @@ class Reader:
 
         return hdr
 
-    def _parse_trans_64(self, fd, n):  # type: (..., int) -> List[int]
-        trans = []
-        for _ in range(n):
-            buff = self._check_read(fd, 8)
-            trans.append(unpack(">q", buff)[0])
+    def _parse_trans_64(self, fd, n):  # type: (_Buffer, int) -> List[int]
+        buff = self._check_read(fd, n * 8)
 
-        return trans
+        return unpack(">{}q".format(n), buff)
 
-    def _parse_trans_32(self, fd, n):  # type: (..., int) -> List[int]
-        trans = []
-        for _ in range(n):
-            buff = self._check_read(fd, 4)
-            trans.append(unpack(">i", buff)[0])
+    def _parse_trans_32(self, fd, n):  # type: (_Buffer, int) -> List[int]
+        buff = self._check_read(fd, n * 4)
 
-        return trans
+        return unpack(">{}l".format(n), buff)
 
-    def _parse_type_idx(self, fd, n):  # type: (..., int) -> List[int]
+    def _parse_type_idx(self, fd, n):  # type: (_Buffer, int) -> List[int]
         buff = self._check_read(fd, n)
 
-        return list(unpack("{}B".format(n), buff))
-
-    def _parse_types(self, fd, n):  # type: (..., int) -> List[tuple]
-        types = []
+        return unpack("{}B".format(n), buff)
 
-        for _ in range(n):
-            buff = self._check_read(fd, 6)
-            offset = unpack(">l", buff[:4])[0]
-            is_dst = buff[4] == 1
-            types.append((offset, is_dst, buff[5]))
+    def _parse_types(self, fd, n):  # type: (_Buffer, int) -> List[tuple]
+        buff = self._check_read(fd, n * 6)
+        values = iter(unpack(">" + "lBB" * n, buff))
 
-        return types
+        return [
+            (offset, is_dst == 1, idx) for offset, is_dst, idx in zip(*[values] * 3)
+        ]
 
     def _parse_abbrs(
-        self, fd, n, types  # type: int  # type: List[tuple]
+        self, fd, n, types  # type: _Buffer  # type: int  # type: List[tuple]
     ):  # type: (...) -> Dict[int, str]
         abbrs = {}
         buff = self._check_read(fd, n)
@@ -200,7 +192,7 @@ class Reader:
 
         return abbrs
 
-    def _parse_posix_tz(self, fd):  # type: (...) -> PosixTimezone
+    def _parse_posix_tz(self, fd):  # type: (_Buffer) -> PosixTimezone
         s = fd.read().decode("utf-8")
 
         if not s.startswith("\n") or not s.endswith("\n"):
@@ -209,3 +201,28 @@ class Reader:
         s = s.strip()
 
         return posix_spec(s)
+
+
+class _Buffer(object):
+    """
+    A cursor over the content of a zoneinfo file,
+    so that each section can be read in a single operation.
+    """
+
+    def __init__(self, data, name):  # type: (bytes, str) -> None
+        self._data = memoryview(data)
+        self._pos = 0
+        self.name = name
+
+    def read(self, nbytes=None):  # type: (int) -> bytes
+        end = len(self._data)
+        if nbytes is not None:
+            end = min(self._pos + nbytes, end)
+
+        result = self._data[self._pos : end].tobytes()
+        self._pos = end
+
+        return result
+
+    def skip(self, nbytes):  # type: (int) -> None
+        self._pos += nbytes
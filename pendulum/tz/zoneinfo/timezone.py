@@ -1,62 +1,272 @@
-from datetime import datetime
+import threading
+
+from array import array
+from datetime import datetime, MAXYEAR
+from operator import add
 from typing import List, Union
 
 from pendulum.constants import DAYS_PER_YEAR, SECS_PER_YEAR
 from pendulum.helpers import local_time, is_leap, timestamp, week_day
+from pendulum.utils._compat import int64_array
 
-from .posix_timezone import PosixTimezone
+from .posix_timezone import PosixTimezone, PosixTransition, posix_spec
 from .transition import Transition
 from .transition_type import TransitionType
 
 
+# Guards the lazy extension of transitions, which can happen
+# concurrently from several threads using the same timezone.
+_extension_lock = threading.Lock()
+
+
 class Timezone:
+    """
+    The zoneinfo structure of a timezone.
+
+    Transitions are stored as parallel columns:
+    the transition times (UTC), the local times at which they occur,
+    the local times they lead to, and the index of their type
+    in the table of transition types.
+    """
+
+    # Number of years the transitions are extended for
+    # using the POSIX rule.
+    EXTENSION_YEARS = 400
+
     def __init__(
         self,
-        transitions,  # type: List[Transition]
+        types,  # type: List[TransitionType]
+        at,  # type: List[int]
+        type_indexes,  # type: List[int]
         posix_rule=None,  # type: Union[PosixTimezone, None]
         extended=True,  # type: bool
     ):
+        initial_type = _initial_type(types)
+        offsets = [types[idx].offset for idx in type_indexes]
+
         self._posix_rule = posix_rule
-        self._transitions = transitions
+        self._types = types
+        self._initial_type = initial_type
+        self._at = int64_array(at)
+        self._local = int64_array(map(add, at, [initial_type.offset] + offsets[:-1]))
+        self._to = int64_array(map(add, at, offsets))
+        self._type_indexes = array("B", type_indexes)
+        self._posix_spec = None
+        self._extension = None
+        self._resume = None
 
         if extended:
             self._extends()
 
+    @classmethod
+    def _from_columns(
+        cls,
+        types,  # type: List[TransitionType]
+        at,  # type: Union[array, memoryview]
+        local,  # type: Union[array, memoryview]
+        to,  # type: Union[array, memoryview]
+        type_indexes,  # type: Union[array, memoryview]
+        spec=None,  # type: Union[str, None]
+        resume=None,  # type: Union[tuple, None]
+    ):  # type: (...) -> Timezone
+        """
+        Builds a zoneinfo structure from already computed columns,
+        as stored in a bundle (see pendulum.tz.zoneinfo.bundle).
+
+        The POSIX rule spec is only parsed if the transitions
+        need to be extended past the given resume point:
+        a (year, max_year, type0, type1) tuple, or False
+        if the transitions cannot be extended.
+        """
+        tz = cls.__new__(cls)
+        tz._posix_rule = None
+        tz._posix_spec = spec
+        tz._types = types
+        tz._initial_type = _initial_type(types)
+        tz._at = at
+        tz._local = local
+        tz._to = to
+        tz._type_indexes = type_indexes
+        tz._extension = None
+        tz._resume = resume
+
+        return tz
+
+    @property
+    def types(self):  # type: () -> List[TransitionType]
+        return self._types
+
+    @property
+    def initial_type(self):  # type: () -> TransitionType
+        """
+        The type of the local time before the first transition.
+        """
+        return self._initial_type
+
+    @property
+    def at(self):  # type: () -> List[int]
+        """
+        The UTC times of the transitions.
+        """
+        return self._at
+
+    @property
+    def local(self):  # type: () -> List[int]
+        """
+        The local times of the transitions, before they occur.
+        """
+        return self._local
+
+    @property
+    def to(self):  # type: () -> List[int]
+        """
+        The local times of the transitions, after they occur.
+        """
+        return self._to
+
+    @property
+    def type_indexes(self):  # type: () -> List[int]
+        return self._type_indexes
+
     @property
     def transitions(self):  # type: () -> List[Transition]
-        return self._transitions
+        """
+        The transitions, as Transition instances.
+
+        They are built on each access, so this should
+        not be used in performance sensitive code.
+        """
+        transitions = []
+        previous = None
+        for at, idx in zip(self._at, self._type_indexes):
+            previous = Transition(at, self._types[idx], previous)
+            transitions.append(previous)
+
+        return transitions
 
     @property
-    def posix_rule(self):
+    def posix_rule(self):  # type: () -> Union[PosixTimezone, None]
+        if self._posix_rule is None and self._posix_spec:
+            self._posix_rule = posix_spec(self._posix_spec)
+
         return self._posix_rule
 
+    def _append(self, at, idx):  # type: (int, int) -> None
+        offset = self._types[idx].offset
+        if self._type_indexes:
+            previous_offset = self._types[self._type_indexes[-1]].offset
+        else:
+            previous_offset = self._initial_type.offset
+
+        # The transitions are looked up without the extension lock
+        # by bisecting _to or _at, so those are appended last:
+        # a transition found in them is complete.
+        self._type_indexes.append(idx)
+        self._local.append(at + previous_offset)
+        self._to.append(at + offset)
+        self._at.append(at)
+
+    def _copy_columns(self):  # type: () -> None
+        """
+        Copies the columns viewing a bundle mapping
+        into arrays that transitions can be appended to.
+        """
+        self._type_indexes = array("B", self._type_indexes)
+        self._local = int64_array(self._local)
+        self._to = int64_array(self._to)
+        self._at = int64_array(self._at)
+
+    def extend(self, year):  # type: (int) -> bool
+        """
+        Extends the transitions up to the given year (included)
+        using the POSIX rule, if any.
+
+        Transitions are only ever appended, so this can be called
+        lazily, when a given year is actually needed.
+
+        Returns False if the transitions cannot be extended any further.
+        """
+        with _extension_lock:
+            if self._extension is None:
+                self._extension = self._prepare_extension()
+
+            extension = self._extension
+            if not extension:
+                return False
+
+            year = min(year, extension.max_year)
+            if year <= extension.year:
+                return year < extension.max_year
+
+            jan1_time = extension.jan1_time
+            jan1_weekday = extension.jan1_weekday
+            leap_year = extension.leap_year
+            type0, type1 = extension.type0, extension.type1
+            offset0 = self._types[type0].offset
+            offset1 = self._types[type1].offset
+            pt0, pt1 = extension.pt0, extension.pt1
+
+            if isinstance(self._at, memoryview):
+                self._copy_columns()
+
+            for y in range(extension.year + 1, year + 1):
+                jan1_time += SECS_PER_YEAR[leap_year]
+                jan1_weekday = (jan1_weekday + DAYS_PER_YEAR[leap_year]) % 7
+                leap_year = not leap_year and is_leap(y)
+
+                tr1_offset = pt1.trans_offset(leap_year, jan1_weekday)
+                self._append(jan1_time + tr1_offset - offset0, type1)
+
+                tr0_offset = pt0.trans_offset(leap_year, jan1_weekday)
+                self._append(jan1_time + tr0_offset - offset1, type0)
+
+            extension.year = year
+            extension.jan1_time = jan1_time
+            extension.jan1_weekday = jan1_weekday
+            extension.leap_year = leap_year
+
+            return year < extension.max_year
+
     def _extends(self):
-        if not self._posix_rule:
-            return
+        # Extend the transitions for an additional 400 years
+        # using the future specification
+        self.extend(MAXYEAR)
 
-        posix = self._posix_rule
+    def _prepare_extension(self):  # type: () -> Union[_Extension, bool]
+        """
+        Checks the POSIX rule against the last transitions
+        and computes the starting point of the extension.
+
+        Returns False if the transitions do not need to be extended.
+        """
+        if self._resume is not None:
+            if not self._resume:
+                return False
+
+            return self._extension_from(*self._resume)
+
+        posix = self.posix_rule
+        if not posix:
+            return False
 
         if not posix.dst_abbr:
             # std only
             # The future specification should match the last/default transition
-            ttype = self._transitions[-1].ttype
+            ttype = self._types[self._type_indexes[-1]]
             if not self._check_ttype(ttype, posix.std_offset, False, posix.std_abbr):
                 raise ValueError("Posix spec does not match last transition")
 
-            return
+            return False
 
-        if len(self._transitions) < 2:
+        if len(self._at) < 2:
             raise ValueError("Too few transitions for POSIX spec")
 
-        # Extend the transitions for an additional 400 years
-        # using the future specification
-
         # The future specification should match the last two transitions,
         # and those transitions should have different is_dst flags.
-        tr0 = self._transitions[-1]
-        tr1 = self._transitions[-2]
-        tt0 = tr0.ttype
-        tt1 = tr1.ttype
+        idx0 = self._type_indexes[-1]
+        idx1 = self._type_indexes[-2]
+        tt0 = self._types[idx0]
+        tt1 = self._types[idx1]
         if tt0.is_dst():
             dst = tt0
             std = tt1
@@ -68,46 +278,44 @@ class Timezone:
         self._check_ttype(std, posix.std_offset, False, posix.std_abbr)
 
         # Add the transitions to tr1 and back to tr0 for each extra year.
-        last_year = local_time(tr0.local, 0, 0)[0]
-        leap_year = is_leap(last_year)
-        jan1 = datetime(last_year, 1, 1)
-        jan1_time = timestamp(jan1)
-        jan1_weekday = week_day(jan1.year, jan1.month, jan1.day) % 7
-
-        if local_time(tr1.local, 0, 0)[0] != last_year:
-            # Add a single extra transition to align to a calendar year.
-            if tt0.is_dst():
-                pt1 = posix.dst_end
-            else:
-                pt1 = posix.dst_start
-
-            tr1_offset = pt1.trans_offset(leap_year, jan1_weekday)
-            tr = Transition(jan1_time + tr1_offset - tt0.offset, tr1.ttype, tr0)
-            tr0 = tr
-            tr1 = tr0
-            tt0 = tr0.ttype
-            tt1 = tr1.ttype
+        last_year = local_time(self._local[-1], 0, 0)[0]
 
-        if tt0.is_dst():
+        if local_time(self._local[-2], 0, 0)[0] != last_year:
+            # Align to a calendar year.
+            idx0 = idx1
+
+        return self._extension_from(
+            last_year, last_year + self.EXTENSION_YEARS, idx0, idx1
+        )
+
+    def _extension_from(
+        self, year, max_year, type0, type1  # type: int  # type: int  # type: int
+    ):  # type: (...) -> _Extension
+        """
+        Returns the extension state for transitions extended
+        up to the given year (included).
+        """
+        posix = self.posix_rule
+        jan1 = datetime(year, 1, 1)
+
+        if self._types[type0].is_dst():
             pt1 = posix.dst_end
             pt0 = posix.dst_start
         else:
             pt1 = posix.dst_start
             pt0 = posix.dst_end
 
-        tr = tr0
-        for year in range(last_year + 1, last_year + 401):
-            jan1_time += SECS_PER_YEAR[leap_year]
-            jan1_weekday = (jan1_weekday + DAYS_PER_YEAR[leap_year]) % 7
-            leap_year = not leap_year and is_leap(year)
-
-            tr1_offset = pt1.trans_offset(leap_year, jan1_weekday)
-            tr = Transition(jan1_time + tr1_offset - tt0.offset, tt1, tr)
-            self._transitions.append(tr)
-
-            tr0_offset = pt0.trans_offset(leap_year, jan1_weekday)
-            tr = Transition(jan1_time + tr0_offset - tt1.offset, tt0, tr)
-            self._transitions.append(tr)
+        return _Extension(
+            year,
+            max_year,
+            timestamp(jan1),
+            week_day(jan1.year, jan1.month, jan1.day) % 7,
+            is_leap(year),
+            type0,
+            type1,
+            pt0,
+            pt1,
+        )
 
     def _check_ttype(
         self,
@@ -121,3 +329,56 @@ class Timezone:
             and ttype.is_dst() == is_dst
             and ttype.abbreviation == abbr
         )
+
+
+def _initial_type(types):  # type: (List[TransitionType]) -> TransitionType
+    """
+    Returns the type of the local time before the first transition:
+    the first standard time type, or the first type if there is none.
+    """
+    for ttype in types:
+        if not ttype.is_dst():
+            return ttype
+
+    return types[0]
+
+
+class _Extension(object):
+    """
+    The state of the POSIX rule extension of the transitions:
+    the last extended year and what is needed to compute the next one.
+    """
+
+    __slots__ = (
+        "year",
+        "max_year",
+        "jan1_time",
+        "jan1_weekday",
+        "leap_year",
+        "type0",
+        "type1",
+        "pt0",
+        "pt1",
+    )
+
+    def __init__(
+        self,
+        year,  # type: int
+        max_year,  # type: int
+        jan1_time,  # type: int
+        jan1_weekday,  # type: int
+        leap_year,  # type: bool
+        type0,  # type: int
+        type1,  # type: int
+        pt0,  # type: PosixTransition
+        pt1,  # type: PosixTransition
+    ):
+        self.year = year
+        self.max_year = max_year
+        self.jan1_time = jan1_time
+        self.jan1_weekday = jan1_weekday
+        self.leap_year = leap_year
+        self.type0 = type0
+        self.type1 = type1
+        self.pt0 = pt0
+        self.pt1 = pt1
@@ -0,0 +1,84 @@
+"""
+Helpers to apply a function to many values, lazily,
+optionally in a pool of processes.
+"""
+import multiprocessing
+
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, Union
+
+
+# The number of values sent to a process at once by default.
+DEFAULT_CHUNKSIZE = 10000
+
+
+def apply_many(
+    func,  # type: Callable[[Any], Any]
+    values,  # type: Iterable
+    errors="raise",  # type: str
+    processes=None,  # type: Union[int, None]
+    chunksize=None,  # type: Union[int, None]
+):  # type: (...) -> Iterator
+    """
+    Applies a function to each value and yields the results in order.
+
+    :param func: The function, it must be picklable to use processes.
+    :param values: The values.
+    :param errors: "raise" to raise the first error,
+                   "return" to yield the error in place of the result.
+    :param processes: The number of processes to use, if any.
+    :param chunksize: The number of values sent to a process at once.
+    """
+    if errors not in ("raise", "return"):
+        raise ValueError(
+            'Invalid errors value "{}", expected "raise" or "return".'.format(errors)
+        )
+
+    if processes is None:
+        return _apply(func, values, errors)
+
+    if chunksize is None:
+        chunksize = DEFAULT_CHUNKSIZE
+
+    if processes < 1 or chunksize < 1:
+        raise ValueError("The number of processes and the chunk size must be positive.")
+
+    return _apply_in_pool(func, values, errors, processes, chunksize)
+
+
+def _apply(func, values, errors):  # type: (Callable, Iterable, str) -> Iterator
+    if errors == "raise":
+        for value in values:
+            yield func(value)
+
+        return
+
+    for value in values:
+        try:
+            result = func(value)
+        except Exception as e:
+            result = e
+
+        yield result
+
+
+def _apply_chunk(args):  # type: (tuple) -> list
+    func, chunk, errors = args
+
+    return list(_apply(func, chunk, errors))
+
+
+def _apply_in_pool(
+    func, values, errors, processes, chunksize
+):  # type: (Callable, Iterable, str, int, int) -> Iterator
+    values = iter(values)
+    chunks = iter(lambda: list(islice(values, chunksize)), [])
+
+    pool = multiprocessing.Pool(processes)
+    try:
+        tasks = ((func, chunk, errors) for chunk in chunks)
+        for results in pool.imap(_apply_chunk, tasks):
+            for result in results:
+                yield result
+    finally:
+        pool.terminate()
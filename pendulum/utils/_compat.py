@@ -1,5 +1,7 @@
 import sys
 
+from array import array
+
 PY2 = sys.version_info < (3, 0)
 PY36 = sys.version_info >= (3, 6)
 PYPY = hasattr(sys, "pypy_version_info")
@@ -17,6 +19,23 @@ except NameError:  # Python 3
     basestring = str
 
 
+try:
+    array("q")
+
+    _HAS_INT64_ARRAY = True
+except ValueError:  # Python 2
+    _HAS_INT64_ARRAY = False
+
+
+def int64_array(values=()):
+    # The "q" typecode is not available in Python 2,
+    # so we fallback on plain lists.
+    if _HAS_INT64_ARRAY:
+        return array("q", values)
+
+    return list(values)
+
+
 def decode(string, encodings=None):
     if not PY2 and not isinstance(string, bytes):
         return string
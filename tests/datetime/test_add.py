@@ -264,3 +264,43 @@ def test_period_over_midnight_tz():
     new_end = start + period
 
     assert new_end == end
+
+
+def test_add_months_clamps_day_in_timezone():
+    dt = pendulum.datetime(2016, 1, 31, 2, 30, tz="Europe/Paris")
+
+    assert_datetime(dt.add(months=1), 2016, 2, 29, 2, 30, 0, 0)
+    assert_datetime(dt.add(years=1, months=1), 2017, 2, 28, 2, 30, 0, 0)
+    assert_datetime(dt.subtract(months=14), 2014, 11, 30, 2, 30, 0, 0)
+
+
+def test_add_days_into_skipped_time():
+    dt = pendulum.datetime(2013, 3, 30, 2, 30, tz="Europe/Paris")
+    dt = dt.add(days=1)
+
+    assert_datetime(dt, 2013, 3, 31, 3, 30, 0, 0)
+    assert dt.offset == 7200
+
+
+def test_add_to_naive():
+    dt = pendulum.naive(2013, 3, 31, 1, 30)
+
+    assert_datetime(dt.add(hours=1), 2013, 3, 31, 2, 30, 0, 0)
+    assert dt.add(hours=1).tzinfo is None
+
+
+def test_add_fractional_seconds():
+    dt = pendulum.datetime(2013, 3, 31, 1, 59, 59, tz="Europe/Paris")
+    dt = dt.add(seconds=0.5)
+
+    assert_datetime(dt, 2013, 3, 31, 1, 59, 59, 500000)
+
+
+def test_add_out_of_range():
+    dt = pendulum.datetime(9999, 12, 31, 23, tz="Europe/Paris")
+
+    with pytest.raises((OverflowError, ValueError)):
+        dt.add(hours=2)
+
+    with pytest.raises(ValueError):
+        dt.add(years=1)
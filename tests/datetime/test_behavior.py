@@ -7,6 +7,7 @@ import pytest
 import pendulum
 from pendulum.tz.timezone import Timezone
 from pendulum import timezone
+from pendulum.utils._compat import PY36
 
 
 @pytest.fixture
@@ -130,6 +131,17 @@ def test_pickle():
     assert dt1 == dt2
 
 
+@pytest.mark.skipif(not PY36, reason="fold attribute only present in Python 3.6+")
+def test_pickle_keeps_fold():
+    dt1 = pendulum.datetime(2016, 11, 6, 1, 30, tz="America/New_York", dst_rule="pre")
+    dt1 = dt1.add(hours=1)
+    dt2 = pickle.loads(pickle.dumps(dt1, protocol=4))
+
+    assert dt2.fold == dt1.fold == 1
+    assert dt2.offset == dt1.offset
+    assert dt2.tzinfo is dt1.tzinfo
+
+
 def test_pickle_with_integer_tzinfo():
     dt1 = pendulum.datetime(2016, 8, 27, 12, 34, 56, 123456, tz=0)
     s = pickle.dumps(dt1)
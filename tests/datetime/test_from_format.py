@@ -1,6 +1,7 @@
 import pendulum
 import pytest
 
+from pendulum.formatting import Formatter
 from pendulum.utils._compat import PY2
 
 from ..conftest import assert_datetime
@@ -31,6 +32,19 @@ def test_from_format_with_timezone():
     assert "Europe/London" == d.timezone_name
 
 
+def test_from_format_with_timezone_name():
+    d = pendulum.from_format(
+        "1975-05-21 22:32:11 europe/london", "YYYY-MM-DD HH:mm:ss z"
+    )
+    assert_datetime(d, 1975, 5, 21, 22, 32, 11)
+    assert "Europe/London" == d.timezone_name
+
+    with pytest.raises(ValueError):
+        pendulum.from_format(
+            "1975-05-21 22:32:11 Europe/Nowhere", "YYYY-MM-DD HH:mm:ss z"
+        )
+
+
 def test_from_format_with_escaped_elements():
     d = pendulum.from_format("1975-05-21T22:32:11+00:00", "YYYY-MM-DD[T]HH:mm:ssZ")
     assert_datetime(d, 1975, 5, 21, 22, 32, 11)
@@ -152,3 +166,52 @@ def test_strptime():
     assert_datetime(d, 1975, 5, 21, 22, 32, 11)
     assert isinstance(d, pendulum.DateTime)
     assert "UTC" == d.timezone_name
+
+
+def test_from_format_with_compiled_parser():
+    parser = Formatter().compile_parser("D MMMM YYYY HH:mm", locale="fr")
+
+    d = pendulum.from_format("21 mai 1975 22:32", parser)
+    assert_datetime(d, 1975, 5, 21, 22, 32, 0)
+    assert "UTC" == d.timezone_name
+
+    d = pendulum.from_format("25 juin 1975 14:15", parser, tz="Europe/Paris")
+    assert_datetime(d, 1975, 6, 25, 14, 15, 0)
+    assert "Europe/Paris" == d.timezone_name
+
+
+def test_from_format_many():
+    strings = ["21/05/1975 22:32", "invalid", "25/06/1975 14:15"]
+
+    with pytest.raises(ValueError):
+        list(pendulum.from_format_many(strings, "DD/MM/YYYY HH:mm"))
+
+    parsed = list(
+        pendulum.from_format_many(
+            strings, "DD/MM/YYYY HH:mm", tz="Europe/Paris", errors="return"
+        )
+    )
+
+    assert_datetime(parsed[0], 1975, 5, 21, 22, 32, 0)
+    assert "Europe/Paris" == parsed[0].timezone_name
+    assert isinstance(parsed[1], ValueError)
+    assert_datetime(parsed[2], 1975, 6, 25, 14, 15, 0)
+
+
+def test_from_format_many_uses_the_same_now():
+    now = pendulum.datetime(2018, 2, 2)
+
+    with pendulum.test(now):
+        parsed = pendulum.from_format_many(["10:30", "11:45"], "HH:mm")
+
+    assert [(dt.day, dt.hour) for dt in parsed] == [(2, 10), (2, 11)]
+
+
+def test_from_format_many_in_processes():
+    parser = Formatter().compile_parser("D MMMM YYYY", locale="fr")
+    strings = ["{} mai 1975".format(day) for day in range(1, 32)]
+
+    parsed = list(pendulum.from_format_many(strings, parser, processes=2, chunksize=4))
+
+    assert [dt.day for dt in parsed] == list(range(1, 32))
+    assert all(dt.month == 5 for dt in parsed)
@@ -12,6 +12,14 @@ def test_pickle():
     assert it == it2
 
 
+def test_pickle_keeps_years_and_months():
+    it = pendulum.duration(years=2, months=3, days=4)
+    it2 = pickle.loads(pickle.dumps(it))
+
+    assert it == it2
+    assert (it2.years, it2.months, it2.remaining_days) == (2, 3, 4)
+
+
 def test_comparison_to_timedelta():
     duration = pendulum.duration(days=3)
 
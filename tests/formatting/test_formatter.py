@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+import pickle
 import pytest
 
 import pendulum
@@ -259,3 +260,110 @@ def test_unknown_token():
     d = pendulum.datetime(2016, 8, 28, 7, 3, 6, 123456)
 
     assert f.format(d, "J") == "J"
+
+
+def test_compile():
+    f = Formatter()
+    d = pendulum.datetime(2016, 8, 28, 7, 3, 6, 123456)
+    fmt = f.compile("dddd Do [of] MMMM YYYY HH:mm:ss.SSSSSS Z", locale="en")
+
+    assert fmt(d) == "Sunday 28th of August 2016 07:03:06.123456 +00:00"
+    assert fmt(d.add(days=1)) == "Monday 29th of August 2016 07:03:06.123456 +00:00"
+    assert f.compile("dddd Do [of] MMMM YYYY HH:mm:ss.SSSSSS Z", locale="en") is fmt
+    assert f.compile("dddd Do [of] MMMM YYYY HH:mm:ss.SSSSSS Z", locale="fr") is not fmt
+
+
+def test_compile_braces():
+    f = Formatter()
+    d = pendulum.datetime(2016, 8, 28)
+
+    assert f.format(d, "{YYYY} }{ [{0}] \{ LL") == "{2016} }{ {0} { August 28, 2016"
+
+
+def test_compile_cache_is_bounded():
+    f = Formatter()
+    d = pendulum.datetime(2016, 8, 28)
+
+    for i in range(f.COMPILED_CACHE_SIZE + 10):
+        assert f.format(d, "[{}] YYYY".format(i)) == "{} 2016".format(i)
+
+    assert len(f._compiled) == f.COMPILED_CACHE_SIZE
+
+
+def test_compile_parser():
+    f = Formatter()
+    parser = f.compile_parser("YYYY-MM-DD HH:mm", locale="en")
+
+    assert f.compile_parser("YYYY-MM-DD HH:mm", locale="en") is parser
+    assert parser.parse("2016-08-28 07:03") == {
+        "year": 2016,
+        "month": 8,
+        "day": 28,
+        "hour": 7,
+        "minute": 3,
+        "second": 0,
+        "microsecond": 0,
+        "tz": None,
+    }
+
+    with pytest.raises(ValueError):
+        parser.parse("2016-08-28")
+
+
+def test_compile_parser_pickle():
+    parser = Formatter().compile_parser("YYYY-MM-DD HH:mm", locale="fr")
+
+    unpickled = pickle.loads(pickle.dumps(parser))
+
+    assert unpickled is not parser
+    assert unpickled.parse("2016-08-28 07:03")["minute"] == 3
+    # Compiled once through the shared formatter
+    assert pickle.loads(pickle.dumps(parser)) is unpickled
+    assert pendulum._formatter.compile_parser("YYYY-MM-DD HH:mm", "fr") is unpickled
+
+
+def test_compile_parser_missing_elements_use_now():
+    f = Formatter()
+    now = pendulum.datetime(2018, 2, 2, 12, 30)
+
+    assert f.compile_parser("HH:mm").parse("07:03", now)["day"] == 2
+
+    with pendulum.test(now):
+        parsed = f.compile_parser("dddd").parse("Monday")
+
+    assert (parsed["year"], parsed["month"], parsed["day"]) == (2018, 1, 29)
+
+
+def test_locale_inverse_translation():
+    locale = Locale.load("de")
+    months = locale.inverse_translation("months.wide")
+
+    assert months[u"März"] == 3
+    assert locale.inverse_translation("months.wide") is months
+    assert locale.match_translation("days.wide", "Sonntag") == 0
+    assert locale.match_translation("days.wide", "Sunday") is None
+
+
+def test_compile_parser_translated_tokens():
+    f = Formatter()
+    parser = f.compile_parser("dddd D MMMM YYYY hh:mm a", locale="fr")
+    parsed = parser.parse("mercredi 25 juin 1975 02:15 pm")
+
+    assert (parsed["year"], parsed["month"], parsed["day"]) == (1975, 6, 25)
+    assert (parsed["hour"], parsed["minute"]) == (14, 15)
+
+
+def test_locale_get_does_not_cache_defaults():
+    locale = Locale.load("de")
+
+    assert locale.get("custom.missing") is None
+    assert locale.get("custom.missing", "default") == "default"
+    assert locale.get("translations.days.wide")[0] == "Sonntag"
+
+
+def test_locale_load_normalizes_names():
+    assert Locale.load("pt-BR") is Locale.load("pt_br")
+    assert "pt_br" in Locale.available_locales()
+
+    with pytest.raises(ValueError):
+        Locale.load("xx")
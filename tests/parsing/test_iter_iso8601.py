@@ -0,0 +1,90 @@
+import io
+
+import pytest
+
+from datetime import date, datetime
+from pendulum.parsing import iter_iso8601
+from pendulum.parsing.exceptions import ParserError
+
+
+DATA = (
+    b"2016-10-06T12:34:56.123456Z\n"
+    b"2016-10-06T12:34:56+02:00\r\n"
+    b"\n"
+    b"2016-10-06\n"
+    b"2016-10-06T12:34:56"
+)
+
+
+def test_iter_iso8601():
+    parsed = list(iter_iso8601(DATA))
+
+    assert len(parsed) == 4
+    assert datetime(2016, 10, 6, 12, 34, 56, 123456) == parsed[0].replace(tzinfo=None)
+    assert 0 == parsed[0].utcoffset().total_seconds()
+    assert 7200 == parsed[1].utcoffset().total_seconds()
+    assert date(2016, 10, 6) == parsed[2]
+    assert datetime(2016, 10, 6, 12, 34, 56) == parsed[3]
+    assert parsed[3].tzinfo is None
+
+
+def test_iter_iso8601_epoch():
+    parsed = list(iter_iso8601(DATA, epoch=True))
+
+    assert parsed == [
+        1475757296123456,
+        1475750096000000,
+        1475712000000000,
+        1475757296000000,
+    ]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1024])
+def test_iter_iso8601_chunks(chunk_size):
+    expected = list(iter_iso8601(DATA, epoch=True))
+
+    assert expected == list(
+        iter_iso8601(memoryview(DATA), epoch=True, chunk_size=chunk_size)
+    )
+    assert expected == list(
+        iter_iso8601(io.BytesIO(DATA), epoch=True, chunk_size=chunk_size)
+    )
+
+
+def test_iter_iso8601_field():
+    data = b"a;1970-01-01T00:00:01Z;x\nb;1970-01-01T01:00:00+01:00\n"
+
+    parsed = list(iter_iso8601(data, separator=b";", field=1, epoch=True))
+
+    assert parsed == [1000000, 0]
+
+
+def test_iter_iso8601_errors():
+    data = b"2016-10-06\ninvalid\n2016-13-06\na;b\n2016-10-07\n"
+
+    with pytest.raises(ParserError):
+        list(iter_iso8601(data))
+
+    parsed = list(iter_iso8601(data, errors="return", epoch=True))
+
+    assert 1475712000000000 == parsed[0]
+    assert isinstance(parsed[1], ParserError)
+    assert isinstance(parsed[2], ParserError)
+    assert isinstance(parsed[3], ParserError)
+    assert 1475798400000000 == parsed[4]
+
+    parsed = list(iter_iso8601(b"a;2016-10-06\nb\n", b"\n", b";", 1, errors="return"))
+
+    assert date(2016, 10, 6) == parsed[0]
+    assert isinstance(parsed[1], ParserError)
+
+
+def test_iter_iso8601_invalid_arguments():
+    with pytest.raises(ValueError):
+        iter_iso8601(DATA, errors="ignore")
+
+    with pytest.raises(ValueError):
+        iter_iso8601(DATA, delimiter=b"\r\n")
+
+    with pytest.raises(ValueError):
+        iter_iso8601(DATA, field=1)
@@ -1,13 +1,35 @@
 import pytest
 
 from datetime import date, time, datetime
-from pendulum.parsing import parse_iso8601
+from pendulum import DateTime
+from pendulum.parsing import parse_iso8601, parse_iso8601_datetime, parse_iso8601_epoch
+from pendulum.parsing import iso8601
+from pendulum.tz import UTC, _tz_cache, fixed_timezone
 
 try:
     from pendulum.parsing._extension import TZFixedOffset as FixedTimezone
 except ImportError:
     from pendulum.tz.timezone import FixedTimezone
 
+try:
+    from pendulum.parsing import _iso8601
+except ImportError:
+    _iso8601 = None
+
+
+# The C extension, if available, and the pure Python implementation
+BACKENDS = pytest.mark.parametrize(
+    "backend",
+    [
+        pytest.param(
+            _iso8601,
+            marks=pytest.mark.skipif(_iso8601 is None, reason="No C extension"),
+            id="c",
+        ),
+        pytest.param(iso8601, id="python"),
+    ],
+)
+
 
 def test_parse_iso8601():
     # Date
@@ -137,14 +159,6 @@ def test_parse_ios8601_invalid():
     with pytest.raises(ValueError):
         parse_iso8601("2010-02-18T16:23.33.600")
 
-    # Invalid offset
-    with pytest.raises(ValueError):
-        parse_iso8601("2009-05-19 14:39:22+063")
-    with pytest.raises(ValueError):
-        parse_iso8601("2009-05-19 14:39:22+06a00")
-    with pytest.raises(ValueError):
-        parse_iso8601("2009-05-19 14:39:22+0:6:00")
-
     # Missing time separator
     with pytest.raises(ValueError):
         parse_iso8601("2009-05-1914:39")
@@ -160,6 +174,44 @@ def test_parse_ios8601_invalid():
         parse_iso8601("2012-W123")  # Missing separator
 
 
+@BACKENDS
+@pytest.mark.parametrize(
+    "text",
+    [
+        "2009-05-19 14:39:22+063",
+        "2009-05-19 14:39:22+06a00",
+        "2009-05-19 14:39:22+0:6:00",
+    ],
+)
+def test_parse_iso8601_invalid_offset(backend, text):
+    with pytest.raises(ValueError):
+        backend.parse_iso8601(text)
+
+    with pytest.raises(ValueError):
+        backend.parse_iso8601_datetime(text, DateTime, fixed_timezone, UTC)
+
+
+@BACKENDS
+@pytest.mark.parametrize(
+    "text",
+    [
+        "2016-01-01T00:00:00+25:00",
+        "2016-01-01T00:00:00+24:00",
+        "2016-01-01T00:00:00-2400",
+        "2016-01-01T00:00:00-99",
+    ],
+)
+def test_parse_iso8601_out_of_range_offset(backend, text):
+    with pytest.raises(ValueError, match="Invalid timezone offset"):
+        backend.parse_iso8601_datetime(text, DateTime, fixed_timezone, UTC)
+
+    with pytest.raises(ValueError, match="Invalid timezone offset"):
+        backend.parse_iso8601_epoch(text)
+
+    # No invalid timezone is left in the cache
+    assert all(abs(offset) < 86400 for offset in _tz_cache._fixed)
+
+
 def test_parse_ios8601_duration():
     text = "P2Y3M4DT5H6M7S"
     parsed = parse_iso8601(text)
@@ -458,3 +510,50 @@ def test_parse_ios8601_duration():
     # Invalid fractional
     with pytest.raises(ValueError):
         parse_iso8601("P2Y3M4DT5.5H6M7S")
+
+
+def test_parse_iso8601_epoch():
+    assert (1475750096123456, 7200) == parse_iso8601_epoch(
+        "2016-10-06T12:34:56.123456+02:00"
+    )
+    assert (1475757296000000, 0) == parse_iso8601_epoch("2016-10-06T12:34:56Z")
+    assert (1475757296000000, None) == parse_iso8601_epoch("2016-10-06T12:34:56")
+    assert (1475712000000000, None) == parse_iso8601_epoch("2016-10-06")
+    assert (-1, 0) == parse_iso8601_epoch("1969-12-31T23:59:59.999999Z")
+    assert (1454493600000000, 0) == parse_iso8601_epoch("2016-W05-3T10:00Z")
+
+
+@pytest.mark.parametrize("text", ["201610", "P1Y", "2016-13-06", "invalid"])
+def test_parse_iso8601_epoch_invalid(text):
+    with pytest.raises(ValueError):
+        parse_iso8601_epoch(text)
+
+
+def test_parse_iso8601_datetime():
+    dt = parse_iso8601_datetime(
+        "2016-10-06T12:34:56.123456+02:00", DateTime, fixed_timezone, UTC
+    )
+    assert isinstance(dt, DateTime)
+    assert DateTime(2016, 10, 6, 12, 34, 56, 123456, tzinfo=fixed_timezone(7200)) == dt
+    assert dt.tzinfo is fixed_timezone(7200)
+
+    dt = parse_iso8601_datetime("2016-10-06T12:34:56", DateTime, fixed_timezone, UTC)
+    assert DateTime(2016, 10, 6, 12, 34, 56, tzinfo=UTC) == dt
+    assert dt.tzinfo is UTC
+
+    dt = parse_iso8601_datetime("2016-10-06", DateTime, fixed_timezone, None)
+    assert isinstance(dt, DateTime)
+    assert DateTime(2016, 10, 6) == dt
+    assert dt.tzinfo is None
+
+    # Times and durations
+    assert parse_iso8601_datetime("201610", DateTime, fixed_timezone, UTC) is None
+    assert parse_iso8601_datetime("P1Y", DateTime, fixed_timezone, UTC) is None
+
+
+def test_parse_iso8601_datetime_invalid():
+    with pytest.raises(ValueError):
+        parse_iso8601_datetime("2016-13-06", DateTime, fixed_timezone, UTC)
+
+    with pytest.raises(TypeError):
+        parse_iso8601_datetime("2016-10-06", date, fixed_timezone, UTC)
@@ -117,3 +117,44 @@ def test_different_timezones_same_time():
 
     assert period.in_words() == "1 day 5 hours"
     assert period.in_hours() == 29
+
+
+
+def test_calendar_units_are_computed_lazily(monkeypatch):
+    from importlib import import_module
+
+    from pendulum.helpers import precise_diff as _precise_diff
+
+    calls = []
+
+    def precise_diff(d1, d2):
+        calls.append((d1, d2))
+
+        return _precise_diff(d1, d2)
+
+    # pendulum.period is also the name of a function
+    monkeypatch.setattr(import_module("pendulum.period"), "precise_diff", precise_diff)
+
+    dt1 = pendulum.datetime(2000, 1, 1)
+    dt2 = pendulum.datetime(2001, 2, 3)
+    period = dt2 - dt1
+
+    assert period.total_seconds() == 399 * 86400
+    assert dt1.add(days=3) in period
+    assert not calls
+
+    assert (period.years, period.months, period.remaining_days) == (1, 1, 2)
+    assert period.in_months() == 13
+    assert len(calls) == 1
+
+
+def test_ambiguous_time_in_different_timezones():
+    dt1 = pendulum.datetime(
+        2016, 11, 6, 1, 30, tz="America/New_York", dst_rule="pre"
+    ).add(hours=1)
+    dt2 = pendulum.datetime(2016, 11, 6, 12, 0, tz="Europe/Paris")
+    period = dt2 - dt1
+
+    assert dt1.fold == 1
+    assert period.in_minutes() == 270
+    assert (period.hours, period.minutes) == (4, 30)
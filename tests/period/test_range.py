@@ -115,3 +115,101 @@ def test_range_amount():
     assert_datetime(r[1], 2016, 10, 16, 1, 0, 0)
     assert_datetime(r[2], 2016, 10, 18, 0, 0, 0)
     assert_datetime(r[3], 2016, 10, 20, 0, 0, 0)
+
+
+def test_range_hours_with_dst():
+    dt1 = pendulum.datetime(2016, 11, 6, tz="America/New_York")
+    dt2 = pendulum.datetime(2016, 11, 6, 3, tz="America/New_York")
+
+    p = pendulum.period(dt1, dt2)
+    r = list(p.range("hours"))
+
+    assert len(r) == 5
+    assert [(dt.hour, dt.offset, dt.fold) for dt in r] == [
+        (0, -4 * 3600, 0),
+        (1, -4 * 3600, 0),
+        (1, -5 * 3600, 1),
+        (2, -5 * 3600, 1),
+        (3, -5 * 3600, 1),
+    ]
+
+
+def test_range_months_end_of_month():
+    dt1 = pendulum.datetime(2016, 1, 31, 12, 30, tz="Europe/Paris")
+    dt2 = pendulum.datetime(2016, 2, 29, 12, 30, tz="Europe/Paris")
+
+    p = pendulum.period(dt2, dt1)
+    r = list(p.range("months"))
+
+    assert len(r) == 1
+
+    p = pendulum.period(dt1, dt2.add(years=1))
+    r = list(p.range("months", 3))
+
+    assert len(r) == 5
+    assert_datetime(r[1], 2016, 4, 30, 12, 30, 0)
+    assert_datetime(r[-1], 2017, 1, 31, 12, 30, 0)
+
+
+def test_range_matches_add():
+    dt1 = pendulum.datetime(2015, 12, 31, 23, 30, 15, 123456, tz="Europe/Paris")
+    dt2 = pendulum.datetime(2017, 3, 27, 2, 30, tz="Asia/Tokyo")
+
+    for unit, amount in [("years", 1), ("months", 5), ("weeks", 3), ("days", 10)]:
+        r = list(pendulum.period(dt1, dt2).range(unit, amount))
+        expected = [dt1.add(**{unit: i * amount}) for i in range(len(r) + 1)]
+
+        assert r == expected[:-1]
+        assert [dt.fold for dt in r[1:]] == [dt.fold for dt in expected[1:-1]]
+        assert expected[-1] > dt2
+
+    for unit, amount in [("hours", 7), ("minutes", 1000), ("seconds", 100000)]:
+        r = list(pendulum.period(dt2, dt1).range(unit, amount))
+        expected = [dt2.subtract(**{unit: i * amount}) for i in range(len(r) + 1)]
+
+        assert r == expected[:-1]
+        assert expected[-1] < dt1
+
+
+def test_range_naive():
+    dt1 = pendulum.naive(2016, 3, 27, 1, 30)
+    dt2 = pendulum.naive(2016, 3, 27, 3, 30)
+
+    r = list(pendulum.period(dt1, dt2).range("minutes", 30))
+
+    assert len(r) == 5
+    assert all(dt.tzinfo is None for dt in r)
+    assert_datetime(r[2], 2016, 3, 27, 2, 30, 0)
+
+
+def test_timestamps():
+    dt1 = pendulum.datetime(2016, 10, 30, tz="Europe/Paris")
+    dt2 = dt1.add(hours=4)
+
+    p = pendulum.period(dt1, dt2)
+
+    assert list(p.timestamps("hours")) == [
+        int(dt.timestamp()) for dt in p.range("hours")
+    ]
+    assert list(p.timestamps("hours", local=True)) == [
+        1477785600,
+        1477789200,
+        1477792800,
+        1477792800,
+        1477796400,
+    ]
+
+    p = pendulum.period(dt2.add(months=2), dt1)
+
+    assert list(p.timestamps("months")) == [
+        int(dt.timestamp()) for dt in p.range("months")
+    ]
+    assert list(p.timestamps("days", 7)) == [
+        int(dt.timestamp()) for dt in p.range("days", 7)
+    ]
+
+
+def test_timestamps_of_dates():
+    p = pendulum.period(pendulum.date(2016, 1, 1), pendulum.date(2016, 1, 3))
+
+    assert list(p.timestamps("days")) == [1451606400, 1451692800, 1451779200]
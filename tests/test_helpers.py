@@ -4,9 +4,9 @@ import pytest
 import pendulum
 import pytz
 
-from datetime import datetime
+from datetime import date, datetime
 from pendulum import timezone
-from pendulum.helpers import precise_diff, week_day, days_in_year
+from pendulum.helpers import precise_diff, precise_diff_many, week_day, days_in_year
 
 from .conftest import assert_datetime
 
@@ -110,6 +110,128 @@ def test_precise_diff_timezone():
     diff = precise_diff(dt1, dt2)
     assert_diff(diff, minutes=10)
 
+    # Adjusting to UTC crosses a transition
+    dt1 = pendulum.datetime(2016, 3, 27, 3, 30, tz="Europe/Paris")
+    dt2 = pendulum.datetime(2016, 3, 27, 1, tz="America/New_York")
+    diff = precise_diff(dt1, dt2)
+    assert_diff(diff, hours=3, minutes=30)
+
+
+def test_precise_diff_many():
+    paris = pendulum.timezone("Europe/Paris")
+    toronto = pendulum.timezone("America/Toronto")
+
+    starts = [
+        datetime(2003, 3, 1, 0, 0, 0),
+        datetime(2001, 1, 1),
+        paris.datetime(2013, 3, 31, 1, 30),
+        paris.datetime(2013, 3, 31, 1, 30),
+        date(2012, 2, 29),
+        pytz.timezone("Europe/Paris").localize(datetime(2013, 3, 31, 1, 30)),
+        paris.datetime(2013, 1, 1),
+    ]
+    ends = [
+        datetime(2003, 1, 31, 23, 59, 59),
+        datetime(2003, 9, 17, 20, 54, 47, 282310),
+        paris.datetime(2013, 4, 1, 1, 30),
+        toronto.datetime(2013, 4, 1, 1, 30),
+        date(2013, 2, 28),
+        pytz.timezone("Europe/Paris").localize(datetime(2013, 4, 1, 1, 30)),
+        paris.datetime(2013, 1, 1),
+    ]
+
+    diffs = precise_diff_many(starts, ends)
+
+    assert list(zip(*diffs)) == [
+        tuple(precise_diff(d1, d2)) for d1, d2 in zip(starts, ends)
+    ]
+    assert list(diffs.years) == [0, 2, 0, 0, 0, 0, 0]
+    assert list(diffs.months) == [-1, 8, 0, 0, 11, 0, 0]
+    assert list(diffs.hours) == [0, 20, 0, 5, 0, 0, 0]
+    assert list(diffs.total_days) == [-29, 989, 1, 1, 365, 1, 0]
+
+
+def test_precise_diff_many_timestamps():
+    starts = [
+        pendulum.datetime(2013, 3, 31, 1, 30, tz="Europe/Paris"),
+        pendulum.datetime(
+            2016, 10, 30, 2, 30, tz="Europe/Paris", dst_rule=pendulum.PRE_TRANSITION
+        ),
+        pendulum.datetime(
+            2016, 10, 30, 2, 30, tz="Europe/Paris", dst_rule=pendulum.POST_TRANSITION
+        ),
+        pendulum.datetime(1987, 6, 5, 4, 3, 2, 1, tz="Europe/Paris"),
+    ]
+    ends = [
+        pendulum.datetime(2013, 4, 1, 1, 30, tz="Europe/Paris"),
+        pendulum.datetime(
+            2016, 10, 30, 2, 30, tz="Europe/Paris", dst_rule=pendulum.POST_TRANSITION
+        ),
+        pendulum.datetime(2016, 10, 30, 1, tz="Europe/Paris"),
+        pendulum.datetime(2024, 5, 1, tz="Europe/Paris"),
+    ]
+
+    diffs = precise_diff_many(
+        [int(dt.timestamp()) * 1000000 + dt.microsecond for dt in starts],
+        [int(dt.timestamp()) * 1000000 + dt.microsecond for dt in ends],
+        "Europe/Paris",
+    )
+
+    assert list(zip(*diffs)) == [
+        (0, 0, 1, 0, 0, 0, 0, 1),
+        # Values in the same timezone are compared by wall time
+        (0, 0, 0, 0, 0, 0, 0, 0),
+        (0, 0, 0, -2, -30, 0, 0, 0),
+        (36, 10, 25, 19, 56, 57, 999999, 13480),
+    ]
+
+
+def test_precise_diff_many_iterators():
+    paris = pendulum.timezone("Europe/Paris")
+    starts = [paris.datetime(2013, 3, 31, 1, 30), paris.datetime(2016, 1, 1)]
+    ends = [paris.datetime(2013, 4, 1, 1, 30), paris.datetime(2016, 2, 3, 4)]
+    expected = list(zip(*precise_diff_many(starts, ends)))
+
+    diffs = precise_diff_many(iter(starts), iter(ends))
+    assert list(zip(*diffs)) == expected
+
+    diffs = precise_diff_many(
+        (int(dt.timestamp()) * 1000000 for dt in starts),
+        (int(dt.timestamp()) * 1000000 for dt in ends),
+        paris,
+    )
+    assert list(zip(*diffs)) == expected
+
+
+def test_precise_diff_many_uses_precise_diff_extension(monkeypatch):
+    calls = []
+
+    def c_precise_diff(d1, d2):
+        calls.append((d1, d2))
+
+        return pendulum.helpers._py_precise_diff(d1, d2)
+
+    monkeypatch.setattr(pendulum.helpers, "precise_diff", c_precise_diff)
+
+    diffs = precise_diff_many([date(2012, 2, 29)], [date(2013, 2, 28)])
+
+    assert calls == [(date(2012, 2, 29), date(2013, 2, 28))]
+    assert list(diffs.months) == [11]
+
+
+def test_precise_diff_many_empty():
+    diffs = precise_diff_many([], [])
+
+    assert len(diffs) == 8
+    assert all(len(column) == 0 for column in diffs)
+
+    assert len(precise_diff_many([], [], "UTC").years) == 0
+
+
+def test_precise_diff_many_naive_and_aware():
+    with pytest.raises(ValueError):
+        precise_diff_many([datetime(2018, 1, 1)], [pendulum.datetime(2018, 1, 2)])
+
 
 def test_week_day():
     assert 5 == week_day(2017, 6, 2)
@@ -0,0 +1,96 @@
+import pytest
+
+import pendulum
+
+np = pytest.importorskip("numpy")
+
+from pendulum.numpy import localize, offsets  # noqa: E402
+
+
+def test_localize_datetime64():
+    values = np.array(
+        [
+            "2013-03-31T00:59:59.5",
+            "2013-03-31T01:00:00",
+            "2013-10-27T00:59:59",
+            "2013-10-27T01:00:00",
+            "1800-01-01T00:00:00",
+        ],
+        dtype="datetime64[us]",
+    )
+    fields = localize("Europe/Paris", values)
+
+    assert fields.year.tolist() == [2013, 2013, 2013, 2013, 1800]
+    assert fields.month.tolist() == [3, 3, 10, 10, 1]
+    assert fields.day.tolist() == [31, 31, 27, 27, 1]
+    assert fields.hour.tolist() == [1, 3, 2, 2, 0]
+    assert fields.minute.tolist() == [59, 0, 59, 0, 9]
+    assert fields.second.tolist() == [59, 0, 59, 0, 21]
+    assert fields.microsecond.tolist() == [500000, 0, 0, 0, 0]
+    assert fields.offset.tolist() == [3600, 7200, 7200, 3600, 561]
+    assert fields.is_dst.tolist() == [False, True, True, False, False]
+    assert fields.fold.tolist() == [1, 0, 0, 1, 1]
+
+
+def test_localize_timestamps():
+    fields = localize(
+        pendulum.timezone("America/New_York"),
+        np.array([1383800000000, 5000000000000]),
+        unit="ms",
+    )
+
+    assert fields.year.tolist() == [2013, 2128]
+    assert fields.hour.tolist() == [23, 4]
+    assert fields.offset.tolist() == [-18000, -14400]
+
+
+def test_localize_fixed_timezone():
+    fields = localize(pendulum.tz.fixed_timezone(-19800), np.array([0]))
+
+    assert fields.day.tolist() == [31]
+    assert fields.hour.tolist() == [18]
+    assert fields.minute.tolist() == [30]
+    assert fields.offset.tolist() == [-19800]
+    assert fields.fold.tolist() == [0]
+
+
+def test_localize_matches_convert_many():
+    tz = pendulum.timezone("Australia/Lord_Howe")
+    stamps = list(range(-2000000000, 5000000000, 7777777))
+    fields = localize(tz, np.array(stamps))
+    columns = fields[:8] + (fields.fold,)
+
+    assert list(zip(*[column.tolist() for column in columns])) == list(
+        tz.convert_many(stamps)
+    )
+
+
+def test_localize_before_first_transition():
+    # The first transition goes from LMT (-00:16:08) to GMT
+    tz = pendulum.timezone("Africa/Abidjan")
+    stamps = [-1830469432, -1830383033, -1830383032, 0]
+    fields = localize(tz, np.array(stamps))
+
+    assert fields.offset.tolist() == [-968, -968, 0, 0]
+    assert fields.is_dst.tolist() == [False] * 4
+    assert fields.minute.tolist() == [0, 59, 16, 0]
+    assert offsets("America/New_York", np.array([-3000000000])).tolist() == [-17762]
+
+    columns = fields[:8] + (fields.fold,)
+    assert list(zip(*[column.tolist() for column in columns])) == list(
+        tz.convert_many(stamps)
+    )
+
+
+def test_offsets():
+    values = np.array(["2013-01-01", "2013-07-01"], dtype="datetime64[D]")
+
+    assert offsets("Europe/Paris", values).tolist() == [3600, 7200]
+
+
+def test_invalid_values():
+    with pytest.raises(TypeError):
+        offsets("Europe/Paris", np.array([1.5]))
+
+    with pytest.raises(ValueError):
+        offsets("Europe/Paris", np.array([1]), unit="ns")
@@ -1,4 +1,7 @@
 import pendulum
+import pytest
+
+from pendulum.parsing.exceptions import ParserError
 
 from .conftest import assert_datetime, assert_date, assert_time, assert_duration
 
@@ -39,6 +42,26 @@ def test_parse_with_timezone():
     assert "Europe/Paris" == dt.tz.name
     assert 7200 == dt.offset
 
+    dt = pendulum.parse("2013-03-31T02:30:00", tz="Europe/Paris")
+    assert_datetime(dt, 2013, 3, 31, 3, 30, 0)
+    assert 7200 == dt.offset
+
+
+def test_parse_with_fixed_timezone():
+    text = "2016-10-16T12:34:56.123456"
+
+    dt = pendulum.parse(text, tz=pendulum.timezone(5400))
+    assert isinstance(dt, pendulum.DateTime)
+    assert_datetime(dt, 2016, 10, 16, 12, 34, 56, 123456)
+    assert 5400 == dt.offset
+
+    dt = pendulum.parse(text, tz=None)
+    assert isinstance(dt, pendulum.DateTime)
+    assert dt.tzinfo is None
+
+    dt = pendulum.parse(text + "Z", tz=None)
+    assert dt.tzinfo is pendulum.timezone(0)
+
 
 def test_parse_exact():
     text = "2016-10-16T12:34:56.123456+01:30"
@@ -128,3 +151,41 @@ def test_parse_now():
 
     with pendulum.test(mock_now):
         assert pendulum.parse("now") == mock_now
+
+
+def test_parse_many():
+    texts = ["2016-10-16T12:34:56.123456+01:30", "2016-10-16", "12:34:56"]
+
+    with pendulum.test(pendulum.datetime(2015, 11, 12)):
+        parsed = list(pendulum.parse_many(texts, tz="Europe/Paris"))
+
+    assert_datetime(parsed[0], 2016, 10, 16, 12, 34, 56, 123456)
+    assert "+01:30" == parsed[0].tz.name
+    assert_datetime(parsed[1], 2016, 10, 16, 0, 0, 0, 0)
+    assert "Europe/Paris" == parsed[1].timezone_name
+    assert_datetime(parsed[2], 2015, 11, 12, 12, 34, 56, 0)
+
+
+def test_parse_many_errors():
+    texts = ["2016-10-16", "invalid", "2016-10-17"]
+
+    with pytest.raises(ParserError):
+        list(pendulum.parse_many(texts))
+
+    parsed = list(pendulum.parse_many(texts, errors="return"))
+
+    assert_datetime(parsed[0], 2016, 10, 16, 0, 0, 0, 0)
+    assert isinstance(parsed[1], ParserError)
+    assert_datetime(parsed[2], 2016, 10, 17, 0, 0, 0, 0)
+
+    with pytest.raises(ValueError):
+        pendulum.parse_many(texts, errors="ignore")
+
+
+def test_parse_many_in_processes():
+    texts = ["2016-10-{:02d}".format(day) for day in range(1, 32)] + ["invalid"]
+
+    parsed = list(pendulum.parse_many(texts, errors="return", processes=2, chunksize=4))
+
+    assert [dt.day for dt in parsed[:-1]] == list(range(1, 32))
+    assert isinstance(parsed[-1], ParserError)
@@ -0,0 +1,176 @@
+import threading
+import time
+
+import pytest
+
+import pendulum
+
+from pendulum.parsing import parse_iso8601
+from pendulum.tz.cache import TimezoneCache
+
+
+@pytest.fixture(autouse=True)
+def setup():
+    pendulum.tz.clear_cache()
+
+    yield
+
+    pendulum.tz.set_cache_size(None)
+    pendulum.tz.clear_cache()
+
+
+def test_timezone_is_cached():
+    tz = pendulum.timezone("Europe/Paris")
+
+    assert pendulum.timezone("Europe/Paris") is tz
+
+    info = pendulum.tz.cache_info()
+    assert info.hits == 1
+    assert info.misses == 1
+    assert info.load_time > 0
+    assert info.zones == 1
+
+
+def test_timezone_cache_honors_extended():
+    tz = pendulum.timezone("Europe/Paris", extended=False)
+    extended_tz = pendulum.timezone("Europe/Paris")
+
+    assert extended_tz is not tz
+    assert not tz._extended
+    assert extended_tz._extended
+    assert pendulum.tz.cache_info().zones == 2
+
+
+def test_fixed_timezone_is_cached():
+    tz = pendulum.tz.fixed_timezone(3600)
+
+    assert pendulum.tz.fixed_timezone(3600) is tz
+
+    info = pendulum.tz.cache_info()
+    assert info.hits == 1
+    assert info.misses == 1
+    assert info.fixed == 1
+
+
+def test_fixed_timezones_are_evicted():
+    pendulum.tz.set_cache_size(2)
+
+    tz = pendulum.tz.fixed_timezone(3600)
+    pendulum.tz.fixed_timezone(7200)
+    assert pendulum.tz.fixed_timezone(3600) is tz
+
+    pendulum.tz.fixed_timezone(10800)
+
+    info = pendulum.tz.cache_info()
+    assert info.fixed == 2
+    assert info.max_fixed == 2
+
+    # 7200 was the least recently used one
+    assert pendulum.tz.fixed_timezone(3600) is tz
+    assert pendulum.tz.cache_info().misses == 3
+    pendulum.tz.fixed_timezone(7200)
+    assert pendulum.tz.cache_info().misses == 4
+
+
+def test_parsed_offsets_use_cached_fixed_timezones():
+    tz = pendulum.parse("2016-10-06T12:34:56+02:00").tzinfo
+
+    assert tz is pendulum.tz.fixed_timezone(7200)
+    assert parse_iso8601("2016-10-06T12:34:56+02:00").tzinfo is tz
+    assert pendulum.tz.cache_info().fixed == 1
+
+    pendulum.tz.clear_cache()
+
+    tz = parse_iso8601("2016-10-06T12:34:56+02:00").tzinfo
+    assert tz is pendulum.tz.fixed_timezone(7200)
+
+
+def test_timezone_is_loaded_once_concurrently():
+    cache = TimezoneCache()
+    loads = []
+
+    def load(name, extended=True):
+        loads.append(name)
+        time.sleep(0.05)
+
+        return object()
+
+    results = []
+    threads = [
+        threading.Thread(
+            target=lambda: results.append(cache.get("Europe/Paris", True, load))
+        )
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert loads == ["Europe/Paris"]
+    assert len(results) == 5
+    assert all(result is results[0] for result in results)
+    assert cache.info().misses == 1
+    assert cache.info().hits == 4
+
+
+class _Zones(dict):
+    """
+    Requests the zone from another thread right before it is stored.
+    """
+
+    def __init__(self, request):
+        super(_Zones, self).__init__()
+
+        self.request = request
+        self.threads = []
+
+    def __setitem__(self, key, value):
+        thread = threading.Thread(target=self.request)
+        thread.start()
+        self.threads.append(thread)
+
+        # Gives the thread a chance to load the zone a second time
+        thread.join(0.1)
+
+        super(_Zones, self).__setitem__(key, value)
+
+
+def test_timezone_is_stored_before_its_loading_lock_is_released():
+    cache = TimezoneCache()
+    loads = []
+    results = []
+
+    def load(name, extended=True):
+        loads.append(name)
+
+        return object()
+
+    def request():
+        results.append(cache.get("Europe/Paris", True, load))
+
+    zones = cache._zones = _Zones(request)
+
+    request()
+    for thread in zones.threads:
+        thread.join()
+
+    assert loads == ["Europe/Paris"]
+    assert len(results) == 2
+    assert results[0] is results[1]
+    assert cache.info().misses == 1
+    assert cache.info().hits == 1
+
+
+def test_failed_load_is_not_cached():
+    cache = TimezoneCache()
+
+    def load(name, extended=True):
+        raise ValueError(name)
+
+    with pytest.raises(ValueError):
+        cache.get("Europe/Paris", True, load)
+
+    assert cache.info().zones == 0
+    assert cache.info().misses == 1
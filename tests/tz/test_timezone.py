@@ -1,10 +1,16 @@
+import pickle
+import threading
+import time
+
 import pytest
+from array import array
 from datetime import datetime, timedelta
 
 import pendulum
 from pendulum import timezone
 from pendulum.utils._compat import PY36
 from pendulum.tz import fixed_timezone
+from pendulum.tz.timezone import FixedTimezone, Timezone
 from pendulum.tz.exceptions import NonExistingTime, AmbiguousTime
 
 from ..conftest import assert_datetime
@@ -12,11 +18,11 @@ from ..conftest import assert_datetime
 
 @pytest.fixture(autouse=True)
 def setup():
-    pendulum.tz._tz_cache = {}
+    pendulum.tz.clear_cache()
 
     yield
 
-    pendulum.tz._tz_cache = {}
+    pendulum.tz.clear_cache()
 
 
 @pytest.mark.skipif(not PY36, reason="fold attribute only present in Python 3.6+")
@@ -312,10 +318,10 @@ def test_dst():
 
 def test_short_timezones():
     tz = pendulum.timezone("CET")
-    assert len(tz._transitions) > 0
+    assert len(tz.transitions) > 0
 
     tz = pendulum.timezone("EET")
-    assert len(tz._transitions) > 0
+    assert len(tz.transitions) > 0
 
 
 def test_short_timezones_should_not_modify_time():
@@ -580,3 +586,262 @@ def test_repr():
     tz = timezone("Europe/Paris")
 
     assert "Timezone('Europe/Paris')" == repr(tz)
+
+
+def test_before_first_transition():
+    tz = pendulum.timezone("Europe/Paris")
+    dt = tz.convert(pendulum.naive(1800, 1, 1))
+
+    assert_datetime(dt, 1800, 1, 1)
+    assert dt.utcoffset().total_seconds() == 561
+
+    dt = tz.convert(pendulum.datetime(1800, 1, 1))
+
+    assert_datetime(dt, 1800, 1, 1, 0, 9, 21)
+    assert dt.utcoffset().total_seconds() == 561
+
+
+def test_before_first_transition_uses_initial_type():
+    # The first transition goes from LMT (-00:16:08) to GMT
+    tz = pendulum.timezone("Africa/Abidjan")
+    dt = tz.convert(pendulum.naive(1907, 1, 1))
+
+    assert_datetime(dt, 1907, 1, 1)
+    assert dt.utcoffset().total_seconds() == -968
+    assert dt.tzname() == "LMT"
+
+    dt = tz.convert(pendulum.datetime(1907, 1, 1))
+
+    assert_datetime(dt, 1906, 12, 31, 23, 43, 52)
+    assert dt.utcoffset().total_seconds() == -968
+    assert list(tz.offsets_for([-1900000000, -1800000000])) == [-968, 0]
+
+    # The local times skipped by the first transition
+    dt = tz.convert(pendulum.naive(1912, 1, 1, 0, 10))
+    assert_datetime(dt, 1911, 12, 31, 23, 53, 52)
+    assert dt.utcoffset().total_seconds() == -968
+
+    dt = tz.convert(
+        pendulum.naive(1912, 1, 1, 0, 10), dst_rule=pendulum.POST_TRANSITION
+    )
+    assert_datetime(dt, 1912, 1, 1, 0, 26, 8)
+    assert dt.utcoffset().total_seconds() == 0
+
+
+def test_dst_of_first_transition():
+    tz = pendulum.timezone("America/Iqaluit")
+
+    # The first transition leads to EWT from -00
+    dt = tz.convert(datetime(1943, 1, 1))
+
+    assert dt.utcoffset() == timedelta(hours=-4)
+    assert dt.dst() == timedelta()
+    assert tz.dst(datetime(1930, 1, 1)) == timedelta()
+
+
+def test_utcoffset_of_datetime_in_other_timezone():
+    tz = pendulum.timezone("Europe/Paris")
+
+    assert tz.utcoffset(pendulum.datetime(2016, 7, 1)) == timedelta(hours=2)
+    assert tz.utcoffset(pendulum.datetime(2016, 1, 1)) == timedelta(hours=1)
+
+
+def test_timezones_are_extended_lazily():
+    tz = pendulum.timezone("Europe/Paris")
+    count = len(tz.transitions)
+
+    dt = tz.convert(pendulum.naive(2017, 6, 15, 14))
+    assert dt.utcoffset().total_seconds() == 7200
+    assert len(tz.transitions) == count
+
+    dt = tz.convert(pendulum.naive(2134, 7, 11, 2, 30))
+    assert dt.utcoffset().total_seconds() == 7200
+    assert count < len(tz.transitions) < count + 2 * 400
+
+    eager = pendulum.tz.zoneinfo.read("Europe/Paris")
+    for lazy, transition in zip(tz.transitions, eager.transitions):
+        assert lazy.at == transition.at
+        assert lazy.local == transition.local
+        assert lazy.to == transition.to
+
+
+def test_offsets_for():
+    tz = pendulum.timezone("Europe/Paris")
+    offsets = tz.offsets_for([1356998400, 1372636800, 1356998400.5])
+
+    assert list(offsets) == [3600, 7200, 3600]
+
+
+def test_offsets_for_fixed_timezone():
+    tz = fixed_timezone(19800)
+
+    assert list(tz.offsets_for([1356998400, 1372636800])) == [19800, 19800]
+
+
+def test_convert_many():
+    tz = pendulum.timezone("Europe/Paris")
+    stamps = [
+        1364691599,  # 2013-03-31T01:59:59+01:00
+        1364691600,  # 2013-03-31T03:00:00+02:00
+        1382835599,  # 2013-10-27T02:59:59+02:00
+        1382835600,  # 2013-10-27T02:00:00+01:00
+        1382835600.25,
+        -5000000000,
+        5000000000,
+    ]
+
+    assert list(tz.convert_many(stamps)) == [
+        (2013, 3, 31, 1, 59, 59, 0, 3600, 1),
+        (2013, 3, 31, 3, 0, 0, 0, 7200, 0),
+        (2013, 10, 27, 2, 59, 59, 0, 7200, 0),
+        (2013, 10, 27, 2, 0, 0, 0, 3600, 1),
+        (2013, 10, 27, 2, 0, 0, 250000, 3600, 1),
+        (1811, 7, 23, 15, 16, 1, 0, 561, 1),
+        (2128, 6, 11, 10, 53, 20, 0, 7200, 0),
+    ]
+
+
+def test_convert_many_matches_convert():
+    tz = pendulum.timezone("America/New_York")
+    stamps = range(1383800000, 1383900000, 1800)
+
+    for stamp, fields in zip(stamps, tz.convert_many(stamps)):
+        dt = tz.convert(pendulum.from_timestamp(stamp))
+
+        assert fields == (
+            dt.year,
+            dt.month,
+            dt.day,
+            dt.hour,
+            dt.minute,
+            dt.second,
+            dt.microsecond,
+            dt.offset,
+            dt.fold,
+        )
+
+
+def test_lookup_hints_are_per_thread():
+    tz = pendulum.timezone("America/New_York")
+    idx = tz._lookup_transition(1383800000, is_utc=True)
+    hints = tz._hints.utc
+
+    def lookup():
+        assert tz._lookup_transition(1104537600, is_utc=True) < idx
+
+    thread = threading.Thread(target=lookup)
+    thread.start()
+    thread.join()
+
+    assert tz._hints.utc == hints
+    assert tz._lookup_transition(1383800000, is_utc=True) == idx
+
+
+class _SlowArray(array):
+    def append(self, value):
+        time.sleep(0.0005)
+
+        array.append(self, value)
+
+
+def test_lookups_during_concurrent_extension():
+    tz = Timezone("Europe/Paris")
+    zone = tz._zone
+
+    # Slow appends widen the window in which a lookup
+    # can see a partially appended transition
+    for name in ("_at", "_local", "_to", "_type_indexes"):
+        column = getattr(zone, name)
+        column = _SlowArray(column.typecode, column)
+        setattr(zone, name, column)
+        setattr(tz, name, column)
+
+    errors = []
+    done = threading.Event()
+
+    def lookup(is_utc):
+        column = tz._at if is_utc else tz._to
+        try:
+            while not done.is_set():
+                idx = tz._lookup_transition(column[-1] - 1, is_utc=is_utc)
+                tz._types[tz._type_indexes[idx]]
+                assert tz._to[idx] - tz._local[idx] in (-3600, 3600)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=lookup, args=(i % 2 == 0,)) for i in range(2)]
+    for thread in threads:
+        thread.start()
+
+    for year in range(2040, 2050):
+        zone.extend(year)
+
+    done.set()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+
+
+def test_lookups_across_periods():
+    tz = pendulum.timezone("America/New_York")
+
+    for _ in range(3):
+        for stamp in (1104537600, 1383800000, 1383900000, 1104537600):
+            dt = pendulum.from_timestamp(stamp)
+            expected = pendulum.timezone("America/New_York", extended=False)
+
+            assert tz.convert(dt).isoformat() == expected.convert(dt).isoformat()
+
+
+def test_pickle():
+    tz = pendulum.timezone("Europe/Paris")
+    tz._lookup_transition(1383800000)
+
+    unpickled = pickle.loads(pickle.dumps(tz))
+
+    assert unpickled.name == "Europe/Paris"
+    assert unpickled.convert(datetime(2013, 3, 31, 2, 30)).isoformat() == (
+        "2013-03-31T01:30:00+01:00"
+    )
+
+
+def test_pickle_uses_the_timezone_cache():
+    tz = pendulum.timezone("Europe/Paris")
+
+    assert pickle.loads(pickle.dumps(tz)) is tz
+    assert pickle.loads(pickle.dumps(pendulum.UTC)) is pendulum.UTC
+    assert pickle.loads(pickle.dumps(pendulum.timezone(3600))) is (
+        pendulum.timezone(3600)
+    )
+
+    tz = pendulum.timezone("Europe/Paris", extended=False)
+
+    assert pickle.loads(pickle.dumps(tz)) is tz
+
+    tz = pendulum.timezone("Asia/Tokyo")
+    tz._lookup_transition(1893456000)  # 2030-01-01
+
+    assert pickle.loads(pickle.dumps(tz)) is tz
+
+    tz = FixedTimezone(3600, "Custom")
+    unpickled = pickle.loads(pickle.dumps(tz))
+
+    assert unpickled.name == "Custom"
+    assert unpickled.offset == 3600
+
+
+@pytest.mark.parametrize("is_utc", [True, False])
+def test_lookup_transition_matches_bisection(is_utc):
+    from bisect import bisect_right
+
+    tz = pendulum.timezone("Australia/Lord_Howe")
+    stamps = list(range(-3000000000, 5000000000, 7654321)) + [0, 1383800000]
+
+    for stamp in stamps:
+        idx = tz._lookup_transition(stamp, is_utc=is_utc)
+        column = tz._at if is_utc else tz._to
+
+        assert idx == min(bisect_right(column, stamp), len(column) - 1)
+
+    assert tz._buckets[is_utc]
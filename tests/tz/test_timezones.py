@@ -14,3 +14,18 @@ def test_timezones_are_loadable():
 
     for zone in zones:
         pendulum.timezone(zone)
+
+
+def test_timezone_names_are_case_insensitive():
+    tz = pendulum.timezone("Europe/Paris")
+
+    assert pendulum.timezone("europe/paris") is tz
+    assert pendulum.timezone("EUROPE/PARIS") is tz
+    assert pendulum.timezone("utc") is pendulum.UTC
+
+
+def test_timezone_windows_names():
+    assert pendulum.timezone("Romance Standard Time") is pendulum.timezone(
+        "Europe/Paris"
+    )
+    assert pendulum.timezone("UTC") is pendulum.UTC
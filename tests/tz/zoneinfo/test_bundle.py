@@ -0,0 +1,118 @@
+import os
+import sys
+import pytest
+
+from array import array
+
+import pendulum
+
+from pendulum.tz.timezone import Timezone
+from pendulum.utils._compat import PY2
+from pendulum.tz.zoneinfo import read
+from pendulum.tz.zoneinfo.bundle import Bundle, compile_bundle
+from pendulum.tz.zoneinfo.exceptions import InvalidTimezone, InvalidZoneinfoFile
+
+
+NAMES = ["America/New_York", "Australia/Sydney", "Europe/Paris", "UTC"]
+
+
+@pytest.fixture
+def bundle_path(tmpdir):
+    path = str(tmpdir.join("zones.bundle"))
+    compile_bundle(path, names=NAMES, year=2050)
+
+    return path
+
+
+def test_bundle(bundle_path):
+    with Bundle(bundle_path) as bundle:
+        assert len(bundle) == 4
+        assert bundle.names == NAMES
+        assert "Europe/Paris" in bundle
+        assert "Europe/London" not in bundle
+
+
+@pytest.mark.parametrize("name", NAMES)
+def test_bundle_read_for(bundle_path, name):
+    expected = read(name)
+
+    with Bundle(bundle_path) as bundle:
+        tz = bundle.read_for(name)
+
+    assert list(tz.at) == list(expected.at)
+    assert list(tz.local) == list(expected.local)
+    assert list(tz.to) == list(expected.to)
+    assert list(tz.type_indexes) == list(expected.type_indexes)
+    assert [(t.offset, t.is_dst(), t.abbreviation) for t in tz.types] == [
+        (t.offset, t.is_dst(), t.abbreviation) for t in expected.types
+    ]
+
+
+def test_bundle_read_for_extends_lazily(bundle_path):
+    expected = read("Europe/Paris", extend=False)
+
+    with Bundle(bundle_path) as bundle:
+        tz = bundle.read_for("Europe/Paris", extend=False)
+
+    assert tz.extend(2200)
+    assert expected.extend(2200)
+    assert list(tz.at) == list(expected.at)
+    assert list(tz.local) == list(expected.local)
+    assert list(tz.to) == list(expected.to)
+    assert list(tz.type_indexes) == list(expected.type_indexes)
+
+
+@pytest.mark.skipif(PY2 or sys.byteorder == "big", reason="The columns are copied")
+def test_bundle_read_for_views_the_mapping(bundle_path):
+    bundle = Bundle(bundle_path)
+    tz = bundle.read_for("Europe/Paris", extend=False)
+
+    for column in (tz.at, tz.local, tz.to, tz.type_indexes):
+        assert isinstance(column, memoryview)
+        assert column.obj is bundle._data
+
+    # Zones still use the mapping
+    bundle.close()
+
+    # Not extended past the bundled year
+    assert tz.extend(2050)
+    assert isinstance(tz.at, memoryview)
+
+    n = len(tz.at)
+    assert tz.extend(2060)
+    assert isinstance(tz.at, array)
+    assert len(tz.at) == len(tz.local) == len(tz.to) == len(tz.type_indexes) == n + 20
+
+
+def test_bundle_read_for_bad_timezone(bundle_path):
+    with Bundle(bundle_path) as bundle:
+        with pytest.raises(InvalidTimezone):
+            bundle.read_for("Europe/London")
+
+
+def test_bundle_invalid_file():
+    local_path = os.path.join(os.path.split(__file__)[0], "..", "..")
+    tz_file = os.path.join(local_path, "fixtures", "tz", "Paris")
+
+    with pytest.raises(InvalidZoneinfoFile):
+        Bundle(tz_file)
+
+
+def test_load_bundle(bundle_path):
+    pendulum.tz.load_bundle(bundle_path)
+
+    try:
+        tz = Timezone("Australia/Sydney")
+        dt = pendulum.datetime(2013, 3, 31, 2, 30, tz=tz)
+
+        assert tz._zone._resume
+        assert dt.offset == 39600
+
+        # Past the bundled year
+        dt = pendulum.datetime(2063, 3, 31, 2, 30, tz=tz)
+
+        assert dt.offset == 39600
+        assert tz._at is tz._zone.at
+        assert tz._type_indexes is tz._zone.type_indexes
+    finally:
+        pendulum.tz.load_bundle(None)
@@ -1,3 +1,4 @@
+import mmap
 import os
 import pytest
 
@@ -28,6 +29,46 @@ def test_read():
     assert len(tz.transitions) > 0
 
 
+def test_read_stores_transitions_as_columns():
+    tz = Reader().read_for("Europe/Paris")
+    transitions = tz.transitions
+
+    assert len(tz.at) == len(tz.local) == len(tz.to) == len(transitions)
+
+    for i, transition in enumerate(transitions):
+        assert tz.at[i] == transition.at
+        assert tz.local[i] == transition.local
+        assert tz.to[i] == transition.to
+        assert tz.types[tz.type_indexes[i]] is transition.ttype
+
+
+def test_read_buffer():
+    reader = Reader()
+    local_path = os.path.join(os.path.split(__file__)[0], "..", "..")
+    tz_file = os.path.join(local_path, "fixtures", "tz", "Paris")
+    expected = reader.read(tz_file)
+
+    with open(tz_file, "rb") as f:
+        tz = reader.read_buffer(f.read())
+
+    assert list(tz.at) == list(expected.at)
+    assert list(tz.type_indexes) == list(expected.type_indexes)
+
+    with open(tz_file, "rb") as f:
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        tz = reader.read_buffer(buffer)
+        buffer.close()
+
+    assert list(tz.at) == list(expected.at)
+
+
+def test_read_buffer_invalid():
+    reader = Reader()
+
+    with pytest.raises(InvalidZoneinfoFile):
+        reader.read_buffer(b"TZif2")
+
+
 def test_read_invalid():
     reader = Reader()
     local_path = os.path.join(os.path.split(__file__)[0], "..")
@@ -42,3 +83,18 @@ def test_set_transitions_for_no_transition_database_file():
     tz = reader.read_for("Etc/UTC")
 
     assert len(tz.transitions) == 1
+
+
+def test_read_for_extends_lazily():
+    tz = Reader(extend=False).read_for("Europe/Paris")
+    count = len(tz.transitions)
+
+    assert tz.extend(2040)
+    assert len(tz.transitions) > count
+
+    count = len(tz.transitions)
+    assert tz.extend(2039)
+    assert len(tz.transitions) == count
+
+    assert not tz.extend(9999)
+    assert len(Reader().read_for("Europe/Paris").transitions) == len(tz.transitions)